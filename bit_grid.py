@@ -17,6 +17,100 @@ except ImportError:
     HAS_NUMPY = False
     np = None
 
+_HAS_BITWISE_COUNT = HAS_NUMPY and hasattr(np, "bitwise_count")
+
+# Live connection trace colour, pulsing between 70% and 100% brightness;
+# indexed by abs(sin(...)) quantized to CONNECTION_PULSE_STEPS levels
+CONNECTION_COLOR = (70, 80, 110)
+CONNECTION_PULSE_STEPS = 64
+_CONNECTION_PULSE_LUT = tuple(
+    tuple(int(c * (step / (CONNECTION_PULSE_STEPS - 1) * 0.3 + 0.7)) for c in CONNECTION_COLOR)
+    for step in range(CONNECTION_PULSE_STEPS)
+)
+
+# Component bit states are bit-packed (8 bits per byte, little bit order) when
+# numpy is available, and plain lists of 0/1 otherwise.
+
+def _new_bit_states(bits):
+    """Allocate an all-zero bit state array for `bits` bits"""
+    if HAS_NUMPY:
+        return np.zeros((bits + 7) // 8, dtype=np.uint8)
+    return [0] * bits
+
+
+def _grow_bit_states(bit_states, total_bits):
+    """Return bit_states extended with empty bits up to total_bits"""
+    if HAS_NUMPY:
+        grown = np.zeros((total_bits + 7) // 8, dtype=np.uint8)
+        grown[:len(bit_states)] = bit_states
+        return grown
+    bit_states.extend([0] * (total_bits - len(bit_states)))
+    return bit_states
+
+
+def _popcount_uint8(arr):
+    """Number of set bits in a uint8 array"""
+    if _HAS_BITWISE_COUNT:
+        # numpy >= 2.0: lowers to the hardware POPCNT instruction
+        return int(np.bitwise_count(arr).sum(dtype=np.int64))
+    return int(np.count_nonzero(np.unpackbits(arr)))
+
+
+def _count_ones(bit_states, start=0, stop=None):
+    """Count filled bits in the bit range [start, stop)"""
+    if not HAS_NUMPY:
+        # list.count runs in C; only slice when a sub-range is asked for
+        if start == 0 and stop is None:
+            return bit_states.count(1)
+        return bit_states[start:stop].count(1)
+    if start == 0 and stop is None:
+        return _popcount_uint8(bit_states)
+    if stop is None:
+        stop = len(bit_states) * 8
+    if stop <= start:
+        return 0
+    if not (start & 7 or stop & 7):
+        # Byte-aligned range (the usual LED bucket): popcount the bytes directly
+        return _popcount_uint8(bit_states[start >> 3:stop >> 3])
+    bits = np.unpackbits(bit_states[start >> 3:(stop + 7) >> 3], bitorder="little")
+    offset = start & 7
+    return int(np.count_nonzero(bits[offset:offset + stop - start]))
+
+
+def _led_fill_states(bit_states, num_leds, bits_per_led):
+    """Fill state of each LED bucket of bits_per_led bits: 0 empty, 1 partly lit, 2 full"""
+    if not HAS_NUMPY:
+        states = []
+        for i in range(num_leds):
+            ones = _count_ones(bit_states, i * bits_per_led, (i + 1) * bits_per_led)
+            states.append(2 if ones >= bits_per_led else (1 if ones else 0))
+        return states
+    # One unpack of the covered bits, viewed as a (LED, bit) matrix
+    bits = np.unpackbits(bit_states, count=num_leds * bits_per_led, bitorder="little")
+    counts = np.count_nonzero(bits.reshape(num_leds, bits_per_led), axis=1)
+    states = (counts > 0).astype(np.uint8)
+    states += counts >= bits_per_led
+    return states.tolist()
+
+
+def _fill_first_zeros(bit_states, total_bits, count):
+    """Set the first `count` empty bits below total_bits; return their indices"""
+    if not HAS_NUMPY:
+        filled = []
+        for index in range(total_bits):
+            if len(filled) >= count:
+                break
+            if not bit_states[index]:
+                bit_states[index] = 1
+                filled.append(index)
+        return filled
+    bits = np.unpackbits(bit_states, count=total_bits, bitorder="little")
+    zeros = np.flatnonzero(bits == 0)[:count]
+    bits[zeros] = 1
+    packed = np.packbits(bits, bitorder="little")
+    bit_states[:len(packed)] = packed
+    return zeros.tolist()
+
 
 class LEDGrid:
     """Exact bit-level LED grid with density scaling for large capacities"""
@@ -105,13 +199,6 @@ class LEDGrid:
             self._render_fallback(screen)
             return
         
-        if self._cached_label != self.label:
-            self._cached_label = self.label
-            self._cached_text_surf = LEDGrid._font_cache.render(self.label, True, (200, 255, 255))
-        
-        if self._cached_text_surf:
-            screen.blit(self._cached_text_surf, (self.rect.x, self.rect.bottom - 40))
-            
         self.glow *= 0.85
         glow_int = (self.glow * 128).astype(np.uint8)
         
@@ -200,6 +287,18 @@ class LEDGrid:
 
 
 class MotherboardBitGrid:
+    # LED body colours indexed by fill state: empty, partially lit, fully lit
+    LED_COLORS = ((25, 30, 45), (50, 180, 50), (50, 255, 50))
+    PANEL_PULSE_STEPS = 8
+    COUNT_LABEL_INTERVAL_MS = 100
+    # Rebirth progress at which each component unlocks, per hardware generation
+    UNLOCK_THRESHOLDS = {
+        "RAM": {0: 0.1, 1: 0.05, 2: 0.03, 3: 0.0},
+        "STORAGE": {1: 0.05, 2: 0.03, 3: 0.0},
+        "GPU": {2: 0.03, 3: 0.0},
+    }
+    _UNLOCK_MIN_GENERATION = {name: min(t) for name, t in UNLOCK_THRESHOLDS.items()}
+
     def __init__(self, x, y, width, height):
         self.x = x
         self.y = y
@@ -295,16 +394,29 @@ class MotherboardBitGrid:
         
         for comp in self.components.values():
             total_bits = comp["bits"]
-            comp["bit_states"] = [0] * total_bits
+            comp["bit_states"] = _new_bit_states(total_bits)
+            comp["ones_count"] = 0
             comp["x"] = 0
             comp["y"] = 0
             comp["width"] = 0
             comp["height"] = 0
+            comp["_rect"] = pygame.Rect(0, 0, 0, 0)
+            comp["_panel_cache"] = {}
+
+        # (name, comp) pairs for unlocked components, rebuilt only on lock changes
+        self._rebuild_unlocked_components()
 
         self._layout_components()
+        self._layout_key = (x, y, width, height)
         
         self._init_led_grids()
 
+        # (comp_name, bit_index) pairs filled since the GUI last read them
+        self._newly_filled = []
+        self._smoothed_era_progress = None
+        # total_bits_earned the bits were last distributed for; None forces a pass
+        self._progress_key = None
+
         self.total_bits_earned = 0
         self.last_bits_count = 0
         self.last_rebirth_progress = 0
@@ -323,6 +435,11 @@ class MotherboardBitGrid:
         self._label_font = None
         self._desc_font = None
         self._lock_font = None
+        self._count_font = None
+        self._led_glow_cache = {}
+        # Timestamp and border pulse step shared by everything drawn this frame
+        self._frame_ms = 0
+        self._frame_pulse_step = 0
 
         self._text_cache = {}
         self._cache_version = 0
@@ -382,92 +499,143 @@ class MotherboardBitGrid:
         gen = self.hardware_generation
         return get_exact_bits(category, gen)
 
-    def _render_led_grid(self, screen, comp):
-        """Render component bits as a grid of LEDs filling the main area"""
-        x = comp["x"]
-        y = comp["y"]
+    def _layout_led_cells(self, comp):
+        """Precompute the LED cell rects for a component (on resize or bit-count change)"""
+        comp["_led_rects"] = []
+        comp["_bits_per_led"] = 1
+        comp["_led_layer"] = None
+
         w = comp["width"]
         h = comp["height"]
-        
+        total_bits = comp["bits"]
+
         # Safety check - don't draw if component is too small
-        if w < 50 or h < 50:
-            return
-        
-        # Get bit states
-        bit_states = comp.get("bit_states", [])
-        total_bits = comp.get("bits", 0)
-        
-        if total_bits == 0 or len(bit_states) == 0:
+        if w < 50 or h < 50 or total_bits == 0:
             return
-        
+
         # Calculate LED grid (fill the main component area)
         padding = 8
-        led_area_x = x + padding
-        led_area_y = y + padding
+        led_area_x = comp["x"] + padding
+        led_area_y = comp["y"] + padding
         led_area_w = w - padding * 2
         led_area_h = h - padding * 2 - 20  # Leave room for text at bottom
-        
+
         # Safety check for negative dimensions
         if led_area_w < 10 or led_area_h < 10:
             return
-        
+
         # Number of LEDs (limit for performance)
         num_leds = min(64, total_bits)
-        bits_per_led = max(1, total_bits // num_leds)
-        
+        comp["_bits_per_led"] = max(1, total_bits // num_leds)
+
         # Calculate grid dimensions
-        cols = int(math.sqrt(num_leds * led_area_w / led_area_h)) if led_area_h > 0 else 1
-        cols = max(1, cols)
+        cols = max(1, int(math.sqrt(num_leds * led_area_w / led_area_h)))
         rows = (num_leds + cols - 1) // cols
-        
-        led_w = led_area_w / cols if cols > 0 else 1
-        led_h = led_area_h / rows if rows > 0 else 1
-        
+
+        led_w = led_area_w / cols
+        led_h = led_area_h / rows
+
+        rects = []
         for i in range(num_leds):
-            row = i // cols
-            col = i % cols
-            
+            row, col = divmod(i, cols)
             led_x = led_area_x + col * led_w
             led_y = led_area_y + row * led_h
-            
-            # Calculate how many bits this LED represents
-            start_bit = i * bits_per_led
-            end_bit = min(start_bit + bits_per_led, len(bit_states))
-            bits_in_range = sum(bit_states[start_bit:end_bit])
-            filled_ratio = bits_in_range / bits_per_led if bits_per_led > 0 else 0
-            
-            # LED rect
-            led_rect = pygame.Rect(int(led_x) + 1, int(led_y) + 1, max(1, int(led_w) - 2), max(1, int(led_h) - 2))
-            
-            # Color based on fill
-            if filled_ratio >= 1.0:
-                # Fully lit - bright green
-                led_color = (50, 255, 50)
-                # Glow
-                glow_rect = led_rect.inflate(4, 4)
-                glow_surf = pygame.Surface((glow_rect.width, glow_rect.height), pygame.SRCALPHA)
-                pygame.draw.rect(glow_surf, ((50, 255, 50, 60)), glow_surf.get_rect(), border_radius=2)
-                screen.blit(glow_surf, glow_rect.topleft)
-            elif filled_ratio > 0:
-                # Partially lit - dimmer
-                led_color = (50, 180, 50)
-            else:
-                # Empty - dark
-                led_color = (25, 30, 45)
-            
-            pygame.draw.rect(screen, led_color, led_rect, border_radius=2)
+            rects.append(pygame.Rect(int(led_x) + 1, int(led_y) + 1, max(1, int(led_w) - 2), max(1, int(led_h) - 2)))
+        comp["_led_rects"] = rects
+
+    def _render_led_grid(self, screen, comp):
+        """Render component bits as a grid of LEDs filling the main area"""
+        led_rects = comp["_led_rects"]
+        if not led_rects:
+            return
+
+        # The LED layer only changes when bits are filled or the cells are
+        # relaid out, so between those it is a single cached blit
+        layer_key = (comp["ones_count"], comp["bits"])
+        cached = comp.get("_led_layer")
+        if cached is None or cached[0] != layer_key:
+            cached = comp["_led_layer"] = (layer_key,) + self._build_led_layer(comp)
+        screen.blit(cached[1], cached[2])
         
         # Show bits count at bottom
-        if pygame.font.get_init():
+        self._draw_bits_count(screen, comp)
+
+    def _build_led_layer(self, comp):
+        """Compose every LED of a component onto one SRCALPHA surface; returns (surface, topleft)"""
+        led_rects = comp["_led_rects"]
+        bounds = led_rects[0].unionall(led_rects).inflate(4, 4)
+        layer = pygame.Surface(bounds.size, pygame.SRCALPHA)
+        ox, oy = bounds.topleft
+
+        # Pass 1: classify every LED as empty (0), partially lit (1) or fully lit (2)
+        states = _led_fill_states(comp["bit_states"], len(led_rects), comp["_bits_per_led"])
+
+        # Pass 2: glow behind fully lit LEDs, one cached surface per LED size.
+        # BLEND_RGBA_MAX copies the glow's RGBA into the transparent layer as-is,
+        # so it blends onto the screen exactly as a direct blit would
+        glows = []
+        for led_rect, state in zip(led_rects, states):
+            if state == 2:
+                glows.append((self._get_led_glow(led_rect.width, led_rect.height),
+                              (led_rect.x - 2 - ox, led_rect.y - 2 - oy), None, pygame.BLEND_RGBA_MAX))
+        if glows:
+            layer.blits(glows, doreturn=False)
+
+        # Pass 3: LED bodies, colour looked up by state
+        led_colors = self.LED_COLORS
+        for led_rect, state in zip(led_rects, states):
+            pygame.draw.rect(layer, led_colors[state], led_rect.move(-ox, -oy), border_radius=2)
+        return layer, bounds.topleft
+
+    def _get_panel(self, comp, pulse_step):
+        """Pre-rendered background + border for a component; pulse_step None means locked"""
+        key = (comp["width"], comp["height"], pulse_step)
+        panel = comp["_panel_cache"].get(key)
+        if panel is None:
+            panel = pygame.Surface((max(1, comp["width"]), max(1, comp["height"])), pygame.SRCALPHA)
+            rect = panel.get_rect()
+            if pulse_step is None:
+                pygame.draw.rect(panel, (16, 16, 24), rect, border_radius=6)
+                pygame.draw.rect(panel, (40, 40, 55), rect, 1, border_radius=6)
+            else:
+                bg_color = tuple(max(0, c // 6) for c in comp["color"])
+                pulse = pulse_step / (self.PANEL_PULSE_STEPS - 1) * 0.15 + 0.85
+                border_draw = tuple(int(c * pulse) for c in comp["color"])
+                pygame.draw.rect(panel, bg_color, rect, border_radius=6)
+                pygame.draw.rect(panel, border_draw, rect, 2, border_radius=6)
+            comp["_panel_cache"][key] = panel
+        return panel
+
+    def _get_led_glow(self, led_w, led_h):
+        """Glow halo for a fully lit LED, 2px larger on each side"""
+        key = (led_w, led_h)
+        glow_surf = self._led_glow_cache.get(key)
+        if glow_surf is None:
+            glow_surf = pygame.Surface((led_w + 4, led_h + 4), pygame.SRCALPHA)
+            pygame.draw.rect(glow_surf, (50, 255, 50, 60), glow_surf.get_rect(), border_radius=2)
+            self._led_glow_cache[key] = glow_surf
+        return glow_surf
+
+    def _draw_bits_count(self, screen, comp):
+        """Blit the filled/total label under the LED grid, re-rendering only when it changes"""
+        if not pygame.font.get_init():
+            return
+        if self._count_font is None:
             try:
-                label_font = pygame.font.SysFont("Consolas", 11)
-            except:
-                label_font = pygame.font.Font(None, 16)
-            
-            filled = sum(bit_states)
-            bits_text = f"{filled}/{total_bits}"
-            bits_surface = label_font.render(bits_text, True, (100, 180, 200))
-            screen.blit(bits_surface, (x + w // 2 - 20, y + h - 16))
+                self._count_font = pygame.font.SysFont("Consolas", 11)
+            except pygame.error:
+                self._count_font = pygame.font.Font(None, 16)
+
+        key = (comp["ones_count"], comp["bits"])
+        cached = comp.get("_count_label")
+        now = self._frame_ms
+        # While bits stream in the count changes every frame; refresh the text
+        # at most every COUNT_LABEL_INTERVAL_MS, but immediately once it settles full
+        if cached is None or (cached[0] != key and (now - cached[2] >= self.COUNT_LABEL_INTERVAL_MS
+                                                    or key[0] == key[1])):
+            bits_surface = self._count_font.render(f"{key[0]}/{key[1]}", True, (100, 180, 200))
+            cached = comp["_count_label"] = (key, bits_surface, now)
+        screen.blit(cached[1], (comp["x"] + comp["width"] // 2 - 20, comp["y"] + comp["height"] - 16))
 
     def _get_fonts(self):
         if self._label_font is None:
@@ -506,15 +674,28 @@ class MotherboardBitGrid:
             comp["y"] = self.y + pad_y + row * (cell_h + gap_y)
             comp["width"] = cell_w
             comp["height"] = cell_h * row_span + gap_y * (row_span - 1)
+            comp["_rect"] = pygame.Rect(comp["x"], comp["y"], comp["width"], comp["height"])
+            comp["_panel_cache"].clear()
+            self._layout_led_cells(comp)
+
+    def _ensure_layout(self):
+        """Re-run layout only if the grid rect changed since the last pass"""
+        layout_key = (self.x, self.y, self.width, self.height)
+        if layout_key == self._layout_key:
+            return False
+        self._layout_key = layout_key
+        self._label_font = None
+        self._layout_components()
+        return True
 
     def update_dimensions(self, x, y, width, height):
         self.x = x
         self.y = y
         self.width = width
         self.height = height
-        self._label_font = None
-        self._layout_components()
-        self._update_led_grids()
+        # Called every frame by the accumulator; only rebuild on an actual change
+        if self._ensure_layout():
+            self._update_led_grids()
 
     def update(self, bits, total_bits_earned, rebirth_threshold, hardware_generation=0, dt=1/60, bits_per_sec=0):
         self.total_bits_earned = total_bits_earned
@@ -524,68 +705,58 @@ class MotherboardBitGrid:
         self.dt = dt
         self.bits_per_sec = bits_per_sec
         self._update_component_unlocks()
-        self._update_bits_to_progress()
+        # Distribution only depends on total_bits_earned and the unlocked set;
+        # unlock changes and capacity upgrades reset the key
+        if total_bits_earned != self._progress_key:
+            self._update_bits_to_progress()
+            self._progress_key = total_bits_earned
         self.last_bits_count = bits
 
     def _update_component_unlocks(self):
         progress = self.last_rebirth_progress
-        hw_gen = getattr(self, "hardware_generation", 0)
-
-        self.components["CPU"]["unlocked"] = True
-        self.components["BUS"]["unlocked"] = True
+        hw_gen = self.hardware_generation
 
-        unlock_thresholds = {
-            "RAM": {0: 0.1, 1: 0.05, 2: 0.03, 3: 0.0},
-            "STORAGE": {1: 0.05, 2: 0.03, 3: 0.0},
-            "GPU": {2: 0.03, 3: 0.0},
-        }
+        self._set_unlocked("CPU", True)
+        self._set_unlocked("BUS", True)
 
-        for comp_name, thresholds in unlock_thresholds.items():
+        for comp_name, thresholds in self.UNLOCK_THRESHOLDS.items():
             threshold = thresholds.get(hw_gen, 1.0)
             if progress >= threshold:
-                self.components[comp_name]["unlocked"] = True
-            elif hw_gen < min(thresholds.keys()):
-                self.components[comp_name]["unlocked"] = False
+                self._set_unlocked(comp_name, True)
+            elif hw_gen < self._UNLOCK_MIN_GENERATION[comp_name]:
+                self._set_unlocked(comp_name, False)
+
+    def _set_unlocked(self, comp_name, unlocked):
+        """Change a component's lock state, rebuilding the unlocked tuple on a real change"""
+        comp = self.components[comp_name]
+        if comp["unlocked"] != unlocked:
+            comp["unlocked"] = unlocked
+            self._rebuild_unlocked_components()
+
+    def _rebuild_unlocked_components(self):
+        self._unlocked_components = tuple(
+            (name, comp) for name, comp in self.components.items() if comp["unlocked"]
+        )
+        self._progress_key = None
 
-    def _get_total_capacity(self):
+    def _get_capacity_and_filled(self):
+        """Total bits and filled bits across unlocked components, in one pass"""
         total_capacity = 0
-        for comp in self.components.values():
-            if comp["unlocked"]:
-                total_capacity += comp["bits"]
-        return total_capacity
-
-    def _get_current_filled_bits(self):
-        if hasattr(self, '_cached_filled_bits') and self._cached_filled_bits >= 0:
-            return self._cached_filled_bits
         filled_bits = 0
-        for comp in self.components.values():
-            if comp["unlocked"]:
-                filled_bits += sum(comp["bit_states"])
-        self._cached_filled_bits = filled_bits
-        return filled_bits
-
-    def _invalidate_filled_bits_cache(self):
-        self._cached_filled_bits = -1
-
-    def _are_all_unlocked_components_full(self):
-        for comp in self.components.values():
-            if comp["unlocked"]:
-                if not all(comp["bit_states"]):
-                    return False
-        return True
+        for _, comp in self._unlocked_components:
+            total_capacity += comp["bits"]
+            filled_bits += comp["ones_count"]
+        return total_capacity, filled_bits
 
     def _update_bits_to_progress(self):
-        if self._are_all_unlocked_components_full():
-            return
-
-        total_capacity = self._get_total_capacity()
-        if total_capacity == 0:
+        # ones_count never exceeds bits, so the totals matching means every
+        # unlocked component is full (this also covers zero capacity)
+        total_capacity, current_filled_bits = self._get_capacity_and_filled()
+        if current_filled_bits >= total_capacity:
             return
 
         target_filled_bits = min(self.total_bits_earned, total_capacity)
         
-        current_filled_bits = self._get_current_filled_bits()
-        
         if target_filled_bits > current_filled_bits:
             bits_to_add = target_filled_bits - current_filled_bits
             self._distribute_bits(bits_to_add)
@@ -594,67 +765,74 @@ class MotherboardBitGrid:
         if bits_to_add <= 0:
             return
 
-        unlocked_components = [
-            (name, comp) for name, comp in self.components.items() if comp["unlocked"]
-        ]
+        unlocked_components = self._unlocked_components
         if not unlocked_components:
             return
 
-        bits_added = 0
-        while bits_added < bits_to_add:
-            best_comp = None
+        # Decide how many bits each component receives with plain integer
+        # bookkeeping: every bit goes to the least-filled component (by ratio)
+        filled = [comp["ones_count"] for _, comp in unlocked_components]
+        totals = [comp["bits"] for _, comp in unlocked_components]
+        grants = [0] * len(unlocked_components)
+        for _ in range(math.ceil(bits_to_add)):
+            best = -1
             best_ratio = 1.0
-
-            for comp_name, comp in unlocked_components:
-                filled = sum(comp["bit_states"])
-                total = comp["bits"]
-                ratio = filled / total if total > 0 else 0
+            for j, total in enumerate(totals):
+                ratio = filled[j] / total if total > 0 else 0
                 if ratio < best_ratio:
                     best_ratio = ratio
-                    best_comp = (comp_name, comp)
-
-            if best_comp:
-                _, comp = best_comp
-                found_zero = False
-                for i, val in enumerate(comp["bit_states"]):
-                    if val == 0:
-                        comp["bit_states"][i] = 1
-                        bits_added += 1
-                        # Track for LED pop effect
-                        self.pop_bit(comp_name, i)
-                        found_zero = True
-                        break
-                if not found_zero:
-                    break
+                    best = j
+            if best < 0:
+                break
+            filled[best] += 1
+            grants[best] += 1
+
+        # Then fill each component's first empty bits in one vectorized pass
+        for (comp_name, comp), grant in zip(unlocked_components, grants):
+            if not grant:
+                continue
+            indices = _fill_first_zeros(comp["bit_states"], comp["bits"], grant)
+            comp["ones_count"] += len(indices)
+            # Track for LED pop effect
+            self._newly_filled.extend((comp_name, i) for i in indices)
         
-        if bits_added > 0:
-            self._invalidate_filled_bits_cache()
-            # Track newly filled bits for visual effects
-            if not hasattr(self, '_newly_filled'):
-                self._newly_filled = []
-            # Store positions of newly filled bits (will be cleared after GUI reads them)
-    
     def get_newly_filled_bits(self):
         """Return list of (comp_name, bit_index) for newly filled bits, then clear"""
-        if not hasattr(self, '_newly_filled'):
-            self._newly_filled = []
         result = self._newly_filled
         self._newly_filled = []
         return result
     
     def pop_bit(self, comp_name, bit_index):
         """Mark a bit as newly filled for visual effect tracking"""
-        if not hasattr(self, '_newly_filled'):
-            self._newly_filled = []
         self._newly_filled.append((comp_name, bit_index))
 
     def draw(self, screen, production_rate=0):
+        self._frame_ms = time_ms = pygame.time.get_ticks()
+        # Border pulse is quantized so each step's panel can be cached
+        pulse = abs(math.sin(time_ms * 0.002))
+        self._frame_pulse_step = int(pulse * (self.PANEL_PULSE_STEPS - 1) + 0.5)
+
         self._draw_connections(screen, production_rate)
+        clip = screen.get_clip()
         for comp_name, comp in self.components.items():
+            # Skip components scrolled/clipped entirely out of view
+            if not clip.colliderect(comp["_rect"]):
+                continue
             self._draw_component(screen, comp_name, comp)
 
     def _draw_connections(self, screen, production_rate=0):
-        time_ms = pygame.time.get_ticks()
+        time_ms = self._frame_ms
+
+        # Pulse and dot timing are shared by every live connection this frame
+        production_factor = min(production_rate / 5000, 1.0)
+        # Subtle speedup when producing - keep it minimal
+        pulse_speed = 0.003 + (0.002 * production_factor)
+        pulse_step = int(abs(math.sin(time_ms * pulse_speed)) * (CONNECTION_PULSE_STEPS - 1) + 0.5)
+        live_color = _CONNECTION_PULSE_LUT[pulse_step]
+        # Subtle speedup for dots
+        dot_speed = 8 - (2 * min(production_factor, 0.5))
+        dot_offset = (time_ms // int(dot_speed)) % 40
+        dot_color = COLORS.get("electric_cyan", (0, 200, 255))
 
         for src_name, dst_name in self._connections:
             src = self.components[src_name]
@@ -672,11 +850,7 @@ class MotherboardBitGrid:
             dst_cy = dst["y"] + dst["height"] // 2
 
             if both_unlocked:
-                base_color = (70, 80, 110)
-                # Subtle speedup when producing - keep it minimal
-                pulse_speed = 0.003 + (0.002 * min(production_rate / 5000, 1.0))
-                pulse = abs(math.sin(time_ms * pulse_speed)) * 0.3 + 0.7
-                color = tuple(int(c * pulse) for c in base_color)
+                color = live_color
                 width = 2
             else:
                 color = (35, 35, 50)
@@ -688,9 +862,6 @@ class MotherboardBitGrid:
             pygame.draw.line(screen, color, (mid_x, dst_cy), (dst_cx, dst_cy), width)
 
             if both_unlocked:
-                # Subtle speedup for dots
-                dot_speed = 8 - (2 * min(production_rate / 5000, 0.5))
-                dot_offset = (time_ms // int(dot_speed)) % 40
                 total_dist = abs(mid_x - src_cx) + abs(dst_cy - src_cy) + abs(dst_cx - mid_x)
                 if total_dist > 0:
                     t = (dot_offset / 40.0)
@@ -707,24 +878,16 @@ class MotherboardBitGrid:
                         frac = (pos_along - seg1 - seg2) / (total_dist - seg1 - seg2) if (total_dist - seg1 - seg2) > 0 else 0
                         dx = mid_x + (dst_cx - mid_x) * frac
                         dy = dst_cy
-                    pygame.draw.circle(screen, COLORS.get("electric_cyan", (0, 200, 255)), (int(dx), int(dy)), 2)
+                    pygame.draw.circle(screen, dot_color, (int(dx), int(dy)), 2)
 
     def _draw_component(self, screen, comp_name, comp):
         label_font, desc_font, lock_font = self._get_fonts()
         x, y, w, h = comp["x"], comp["y"], comp["width"], comp["height"]
-        time_ms = pygame.time.get_ticks()
 
         cache_key = (comp_name, comp.get("level"), comp.get("unlocked"), comp.get("bits", 0))
 
         if comp["unlocked"]:
-            bg_color = tuple(max(0, c // 6) for c in comp["color"])
-            border_color = comp["color"]
-
-            pulse = abs(math.sin(time_ms * 0.002)) * 0.15 + 0.85
-            border_draw = tuple(int(c * pulse) for c in border_color)
-
-            pygame.draw.rect(screen, bg_color, (x, y, w, h), border_radius=6)
-            pygame.draw.rect(screen, border_draw, (x, y, w, h), 2, border_radius=6)
+            screen.blit(self._get_panel(comp, self._frame_pulse_step), (x, y))
 
             # Draw individual bits inside the component (LED grid)
             self._render_led_grid(screen, comp)
@@ -742,8 +905,7 @@ class MotherboardBitGrid:
                 self._text_cache[desc_cache_key] = desc_font.render(comp["description"], True, (140, 140, 160))
             screen.blit(self._text_cache[desc_cache_key], (x + 8, y + 24))
         else:
-            pygame.draw.rect(screen, (16, 16, 24), (x, y, w, h), border_radius=6)
-            pygame.draw.rect(screen, (40, 40, 55), (x, y, w, h), 1, border_radius=6)
+            screen.blit(self._get_panel(comp, None), (x, y))
 
             lock_icon_cache = ("lock_icon", comp_name)
             if lock_icon_cache not in self._text_cache:
@@ -759,134 +921,43 @@ class MotherboardBitGrid:
             name_rect = name_text.get_rect(center=(x + w // 2, y + h // 2 + 10))
             screen.blit(name_text, name_rect)
 
-    def _draw_component_progress(self, screen, comp):
-        """Draw component bits as a grid of LEDs filling the main area"""
-        x = comp["x"]
-        y = comp["y"]
-        w = comp["width"]
-        h = comp["height"]
-        
-        # Safety check - don't draw if component is too small
-        if w < 50 or h < 50:
-            return
-        
-        # Get bit states
-        bit_states = comp.get("bit_states", [])
-        total_bits = comp.get("bits", 0)
-        
-        if total_bits == 0 or len(bit_states) == 0:
-            return
-        
-        # Calculate LED grid (fill the main component area)
-        padding = 8
-        led_area_x = x + padding
-        led_area_y = y + padding
-        led_area_w = w - padding * 2
-        led_area_h = h - padding * 2 - 20  # Leave room for text at bottom
-        
-        # Safety check for negative dimensions
-        if led_area_w < 10 or led_area_h < 10:
-            return
-        
-        # Number of LEDs (limit for performance)
-        num_leds = min(64, total_bits)
-        bits_per_led = max(1, total_bits // num_leds)
-        
-        # Calculate grid dimensions
-        cols = int(math.sqrt(num_leds * led_area_w / led_area_h)) if led_area_h > 0 else 1
-        cols = max(1, cols)
-        rows = (num_leds + cols - 1) // cols
-        
-        led_w = led_area_w / cols if cols > 0 else 1
-        led_h = led_area_h / rows if rows > 0 else 1
-        
-        for i in range(num_leds):
-            row = i // cols
-            col = i % cols
-            
-            led_x = led_area_x + col * led_w
-            led_y = led_area_y + row * led_h
-            
-            # Calculate how many bits this LED represents
-            start_bit = i * bits_per_led
-            end_bit = min(start_bit + bits_per_led, len(bit_states))
-            bits_in_range = sum(bit_states[start_bit:end_bit])
-            filled_ratio = bits_in_range / bits_per_led if bits_per_led > 0 else 0
-            
-            # LED rect
-            led_rect = pygame.Rect(int(led_x) + 1, int(led_y) + 1, max(1, int(led_w) - 2), max(1, int(led_h) - 2))
-            
-            # Color based on fill
-            if filled_ratio >= 1.0:
-                # Fully lit - bright green
-                led_color = (50, 255, 50)
-                # Glow
-                glow_rect = led_rect.inflate(4, 4)
-                glow_surf = pygame.Surface((glow_rect.width, glow_rect.height), pygame.SRCALPHA)
-                pygame.draw.rect(glow_surf, ((50, 255, 50, 60)), glow_surf.get_rect(), border_radius=2)
-                screen.blit(glow_surf, glow_rect.topleft)
-            elif filled_ratio > 0:
-                # Partially lit - dimmer
-                led_color = (50, 180, 50)
-            else:
-                # Empty - dark
-                led_color = (25, 30, 45)
-            
-            pygame.draw.rect(screen, led_color, led_rect, border_radius=2)
-        
-        # Show bits count at bottom
-        if pygame.font.get_init():
-            try:
-                label_font = pygame.font.SysFont("Consolas", 11)
-            except:
-                label_font = pygame.font.Font(None, 16)
-            
-            filled = sum(bit_states)
-            bits_text = f"{filled}/{total_bits}"
-            bits_surface = label_font.render(bits_text, True, (100, 180, 200))
-            screen.blit(bits_surface, (x + w // 2 - 20, y + h - 16))
-
     def _draw_component_bits(self, screen, comp):
         """Draw component bits using LEDGrid"""
         self._render_led_grid(screen, comp)
 
     def reset_on_rebirth(self):
         for comp_name, comp in self.components.items():
-            comp["bit_states"] = [0] * comp["bits"]
+            comp["bit_states"] = _new_bit_states(comp["bits"])
+            comp["ones_count"] = 0
             if comp_name not in ["CPU", "BUS"]:
                 comp["unlocked"] = False
             comp["level"] = 1 if comp_name in ["CPU", "BUS"] else 0
+        self._rebuild_unlocked_components()
         for led_grid in self.led_grids.values():
             led_grid.reset()
-        self._invalidate_filled_bits_cache()
         self._smoothed_era_progress = 0
 
     def upgrade_to_era(self, era_level):
         if era_level <= 0:
             return
         if era_level >= 1:
-            self.components["RAM"]["unlocked"] = True
+            self._set_unlocked("RAM", True)
         if era_level >= 2:
-            self.components["STORAGE"]["unlocked"] = True
+            self._set_unlocked("STORAGE", True)
         if era_level >= 3:
-            self.components["GPU"]["unlocked"] = True
+            self._set_unlocked("GPU", True)
 
     def get_era_completion_percentage(self, threshold=9728):
-        if not hasattr(self, 'total_bits_earned') or self.total_bits_earned == 0:
+        if self.total_bits_earned == 0:
             return 0
         raw_progress = min(100, (self.total_bits_earned / threshold) * 100)
-        if not hasattr(self, '_smoothed_era_progress'):
+        if self._smoothed_era_progress is None:
             self._smoothed_era_progress = raw_progress
         self._smoothed_era_progress += (raw_progress - self._smoothed_era_progress) * 0.3
         return self._smoothed_era_progress
 
     def get_bit_completeness_percentage(self):
-        total_bits = 0
-        total_ones = 0
-        for comp in self.components.values():
-            if comp["unlocked"]:
-                total_bits += comp["bits"]
-                total_ones += sum(comp["bit_states"])
+        total_bits, total_ones = self._get_capacity_and_filled()
         if total_bits == 0:
             return 0
         return (total_ones / total_bits) * 100
@@ -894,12 +965,11 @@ class MotherboardBitGrid:
     def add_click_effect(self):
         """Add click burst effect to random unlocked components"""
         # Find unlocked components
-        unlocked = [name for name, comp in self.components.items() if comp["unlocked"]]
-        if not unlocked:
+        if not self._unlocked_components:
             return
         
         # Add burst to random component
-        comp_name = random.choice(unlocked)
+        comp_name, _ = random.choice(self._unlocked_components)
         
         # Use LEDGrid animate_click
         if comp_name in self.led_grids:
@@ -910,14 +980,14 @@ class MotherboardBitGrid:
         time_ms = pygame.time.get_ticks()
         
         # Trigger glow on all unlocked components
-        for comp_name in self.components:
-            if self.components[comp_name]["unlocked"]:
-                self._passive_glow_timers[comp_name] = time_ms
+        for comp_name, _ in self._unlocked_components:
+            self._passive_glow_timers[comp_name] = time_ms
 
     def upgrade_component(self, comp_name):
         if comp_name in self.components:
             comp = self.components[comp_name]
             comp["level"] += 1
-            old_bits = comp["bits"]
             comp["bits"] *= 2
-            comp["bit_states"].extend([0] * old_bits)
+            comp["bit_states"] = _grow_bit_states(comp["bit_states"], comp["bits"])
+            self._layout_led_cells(comp)
+            self._progress_key = None
@@ -1836,32 +1836,6 @@ class BitByBitGame:
             elif self.stats_button.is_clicked(event):
                 self.show_statistics()
 
-            # Handle panel toggle buttons
-            if self.generators_toggle.is_clicked(event):
-                # Handle click button
-                if self.click_button.is_clicked(event):
-                    self.handle_click()
-
-                # Handle generator purchases (only when panel is open)
-                if self.generators_panel_open:
-                    for gen_id, buttons in self.generator_buy_buttons.items():
-                        if buttons["x1"].is_clicked(event):
-                            self.buy_generator(gen_id, 1)
-                        elif buttons["x10"].is_clicked(event):
-                            self.buy_generator(gen_id, 10)
-
-                # Handle upgrade purchases (only when panel is open)
-                if self.upgrades_panel_open:
-                    for upgrade_id, button in self.upgrade_buttons.items():
-                        if button.is_clicked(event):
-                            self.buy_upgrade(upgrade_id)
-
-                # Handle header buttons
-                if self.settings_button.is_clicked(event):
-                    self.showing_settings = True
-                elif self.stats_button.is_clicked(event):
-                    self.show_statistics()
-
             # Handle panel toggle buttons
             if self.generators_toggle.is_clicked(event):
                 self.generators_panel_open = not self.generators_panel_open
@@ -1900,8 +1874,6 @@ class BitByBitGame:
                         480  # Move down when collapsed to avoid covering click button
                     )
                     self.upgrades_toggle.rect.height = 30  # Make smaller when collapsed
-                    self.upgrades_toggle.rect.height = 30  # Make smaller when collapsed
-                    self.upgrades_toggle.rect.height = 30  # Make smaller when collapsed
 
             # Handle rebirth button
             if self.state.can_rebirth() and self.rebirth_button.is_clicked(event):
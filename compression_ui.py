@@ -4,7 +4,9 @@ Enhanced compression UI components for Bit by Bit Game
 
 import pygame
 import math
+from functools import lru_cache
 from constants import COLORS
+from ui_components import get_font, render_glow_text, render_text
 
 
 class CompressionPanel:
@@ -15,6 +17,8 @@ class CompressionPanel:
         self.particles = []
         self.compression_animation = 0
         self.token_glow = 0
+        self._background = None
+        self._border_glow = None
         
     def update(self, dt):
         """Update animations and particles"""
@@ -41,32 +45,47 @@ class CompressionPanel:
             'color': COLORS["neon_purple"]
         })
     
+    def _get_background(self):
+        """Gradient panel background, interpolated once per panel size"""
+        size = self.rect.size
+        if self._background is None or self._background.get_size() != size:
+            panel_surface = pygame.Surface(size)
+            panel_surface.set_alpha(200)
+            
+            # Gradient background
+            for i in range(self.rect.height):
+                color_factor = i / self.rect.height
+                color = (
+                    int(COLORS["deep_space_blue"][0] * (1 - color_factor) + COLORS["neon_purple"][0] * color_factor * 0.3),
+                    int(COLORS["deep_space_blue"][1] * (1 - color_factor) + COLORS["neon_purple"][1] * color_factor * 0.3),
+                    int(COLORS["deep_space_blue"][2] * (1 - color_factor) + COLORS["neon_purple"][2] * color_factor * 0.3)
+                )
+                pygame.draw.line(panel_surface, color, (0, i), (self.rect.width, i))
+            self._background = panel_surface
+        return self._background
+    
+    def _get_border_glow(self):
+        """Border glow layers as (surface, offset) pairs, built once per panel size"""
+        size = self.rect.size
+        if self._border_glow is None or self._border_glow[0] != size:
+            border_color = COLORS["neon_purple"]
+            layers = []
+            for i in range(3):
+                glow_surface = pygame.Surface((self.rect.width - i * 4, self.rect.height - i * 4))
+                glow_surface.set_alpha(100 - i * 30)
+                pygame.draw.rect(glow_surface, border_color, glow_surface.get_rect(), 2)
+                layers.append((glow_surface, i * 2))
+            self._border_glow = (size, layers)
+        return self._border_glow[1]
+    
     def draw(self, screen, compressed_bits, data_shards, efficiency, rate):
         """Draw the enhanced compression panel"""
         # Draw panel background with gradient effect
-        panel_surface = pygame.Surface((self.rect.width, self.rect.height))
-        panel_surface.set_alpha(200)
-        
-        # Gradient background
-        for i in range(self.rect.height):
-            color_factor = i / self.rect.height
-            color = (
-                int(COLORS["deep_space_blue"][0] * (1 - color_factor) + COLORS["neon_purple"][0] * color_factor * 0.3),
-                int(COLORS["deep_space_blue"][1] * (1 - color_factor) + COLORS["neon_purple"][1] * color_factor * 0.3),
-                int(COLORS["deep_space_blue"][2] * (1 - color_factor) + COLORS["neon_purple"][2] * color_factor * 0.3)
-            )
-            pygame.draw.line(panel_surface, color, (0, i), (self.rect.width, i))
-        
-        screen.blit(panel_surface, self.rect)
+        screen.blit(self._get_background(), self.rect)
         
         # Draw border with glow effect
-        border_color = COLORS["neon_purple"]
-        for i in range(3):
-            alpha = 100 - i * 30
-            glow_surface = pygame.Surface((self.rect.width - i * 4, self.rect.height - i * 4))
-            glow_surface.set_alpha(alpha)
-            pygame.draw.rect(glow_surface, border_color, glow_surface.get_rect(), 2)
-            screen.blit(glow_surface, (self.rect.x + i * 2, self.rect.y + i * 2))
+        for glow_surface, offset in self._get_border_glow():
+            screen.blit(glow_surface, (self.rect.x + offset, self.rect.y + offset))
         
         # Draw compression particles
         for particle in self.particles:
@@ -77,20 +96,20 @@ class CompressionPanel:
             screen.blit(particle_surface, (particle['x'] - particle['size'], particle['y'] - particle['size']))
         
         # Title with animated glow
-        title_font = pygame.font.Font(None, 48)
+        title_font = get_font(48)
         title_text = "COMPRESSION ERA"
-        title_surface = title_font.render(title_text, True, COLORS["neon_purple"])
-        title_rect = title_surface.get_rect(centerx=self.rect.centerx, y=self.rect.y + 20)
         
-        # Title glow effect
+        # Title glow effect; the offset takes only a few integer values, so
+        # each composed variant is cached
         glow_offset = int(math.sin(self.compression_animation) * 2)
-        for i in range(3):
-            glow_alpha = 50 - i * 15
-            glow_surface = title_surface.copy()
-            glow_surface.set_alpha(glow_alpha)
-            screen.blit(glow_surface, (title_rect.x + glow_offset + i, title_rect.y + i))
-        
-        screen.blit(title_surface, title_rect)
+        layers = tuple(((glow_offset + i, i), 50 - i * 15) for i in range(3))
+        title_surface, title_text_rect = render_glow_text(
+            title_font, title_text, COLORS["neon_purple"], layers
+        )
+        title_rect = title_text_rect.copy()
+        title_rect.centerx = self.rect.centerx
+        title_rect.y = self.rect.y + 20
+        screen.blit(title_surface, title_rect.move(-title_text_rect.x, -title_text_rect.y))
 
 
 class CompressionMeter:
@@ -99,9 +118,20 @@ class CompressionMeter:
     def __init__(self, x, y, width, height):
         self.rect = pygame.Rect(x, y, width, height)
         self.animation = 0
+        # Edge glow strips keyed by (height, colour); only their alpha changes per frame
+        self._glow_surfaces = {}
         
     def update(self, dt):
         self.animation += dt * 3
+
+    def _get_glow_surface(self, fill_color):
+        key = (self.rect.height, fill_color)
+        glow_surface = self._glow_surfaces.get(key)
+        if glow_surface is None:
+            glow_surface = pygame.Surface((10, self.rect.height))
+            glow_surface.fill(fill_color)
+            self._glow_surfaces[key] = glow_surface
+        return glow_surface
         
     def draw(self, screen, efficiency):
         """Draw compression efficiency meter"""
@@ -126,15 +156,14 @@ class CompressionMeter:
         # Animated glow effect
         glow_x = self.rect.x + fill_width
         glow_alpha = (math.sin(self.animation) + 1) * 0.5
-        glow_surface = pygame.Surface((10, self.rect.height))
+        glow_surface = self._get_glow_surface(fill_color)
         glow_surface.set_alpha(int(glow_alpha * 100))
-        glow_surface.fill(fill_color)
         screen.blit(glow_surface, (glow_x - 5, self.rect.y))
         
         # Efficiency text
-        font = pygame.font.Font(None, 28)
+        font = get_font(28)
         eff_text = f"{efficiency:.1f}%"
-        text_surface = font.render(eff_text, True, COLORS["soft_white"])
+        text_surface = render_text(font, eff_text, COLORS["soft_white"])
         text_rect = text_surface.get_rect(center=self.rect.center)
         screen.blit(text_surface, text_rect)
 
@@ -199,7 +228,7 @@ class TokenDisplay:
         
         # Draw token count
         token_text = f"{tokens}"
-        text_surface = font.render(token_text, True, COLORS["gold"])
+        text_surface = render_text(font, token_text, COLORS["gold"])
         text_rect = text_surface.get_rect(midleft=(self.x + 25, self.y))
         screen.blit(text_surface, text_rect)
         
@@ -213,6 +242,20 @@ class TokenDisplay:
                 screen.blit(particle_surface, (self.x + particle['offset_x'] - 10, self.y + particle['offset_y'] - 10))
 
 
+PATTERN_PHASE_STEPS = 64
+
+
+@lru_cache(maxsize=PATTERN_PHASE_STEPS * 2)
+def _get_compression_pattern(width, height, phase_step):
+    """Full-width stripe pattern of the progress bar for one quantized animation phase"""
+    phase = phase_step * (2 * math.pi / PATTERN_PHASE_STEPS)
+    pattern = pygame.Surface((width, height), pygame.SRCALPHA)
+    for i in range(0, width, 4):
+        color_intensity = int(128 + 127 * math.sin(i * 0.1 + phase))
+        pattern.fill((color_intensity // 2, color_intensity // 3, color_intensity), (i, 0, 2, height))
+    return pattern
+
+
 class CompressionProgressBar:
     """Animated progress bar for compression visualization"""
     
@@ -242,19 +285,18 @@ class CompressionProgressBar:
         # Progress fill with compression visualization
         fill_width = int(self.rect.width * self.progress)
         if fill_width > 0:
-            fill_rect = pygame.Rect(self.rect.x, self.rect.y, fill_width, self.rect.height)
+            ticks = pygame.time.get_ticks()
             
-            # Create compression pattern
-            for i in range(0, fill_width, 4):
-                color_intensity = int(128 + 127 * math.sin(i * 0.1 + pygame.time.get_ticks() * 0.001))
-                color = (color_intensity // 2, color_intensity // 3, color_intensity)
-                segment_rect = pygame.Rect(self.rect.x + i, self.rect.y, 2, self.rect.height)
-                pygame.draw.rect(screen, color, segment_rect)
+            # Compression pattern: the stripes for the current phase are prebuilt
+            # across the whole bar and clipped to the filled width
+            phase_step = int(ticks * 0.001 / (2 * math.pi) * PATTERN_PHASE_STEPS) % PATTERN_PHASE_STEPS
+            pattern = _get_compression_pattern(self.rect.width, self.rect.height, phase_step)
+            screen.blit(pattern, self.rect.topleft, (0, 0, fill_width, self.rect.height))
             
             # Draw compression wave effect
             wave_points = []
             for x in range(0, fill_width, 5):
-                y = self.rect.centery + math.sin((x + pygame.time.get_ticks() * 0.002) * 0.05) * 3
+                y = self.rect.centery + math.sin((x + ticks * 0.002) * 0.05) * 3
                 wave_points.append((self.rect.x + x, y))
             
             if len(wave_points) > 1:
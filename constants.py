@@ -4,6 +4,7 @@ Constants and configuration for Bit by Bit Game
 
 import pygame
 import math
+from functools import lru_cache
 import sys
 import os
 from toon_parser import load_toon_file
@@ -65,10 +66,14 @@ except Exception:
 
 
 # Parse colors from config
+@lru_cache(maxsize=256)
 def parse_color(color_str):
     """Parse hex color string to RGB tuple"""
     if color_str.startswith("#"):
-        hex_str = color_str[1:]
+        hex_str = color_str[1:7]
+        if len(hex_str) == 6:
+            value = int(hex_str, 16)
+            return ((value >> 16) & 0xFF, (value >> 8) & 0xFF, value & 0xFF)
         return tuple(int(hex_str[i : i + 2], 16) for i in (0, 2, 4))
     return (255, 255, 255)  # Default white
 
@@ -1216,18 +1221,40 @@ def ensure_config_loaded():
 ensure_config_loaded()
 
 
+# (threshold, suffix) pairs, largest first; each threshold is also the divisor
+_NUMBER_SUFFIXES = (
+    (1000000000000, "T"),
+    (1000000000, "B"),
+    (1000000, "M"),
+    (1000, "K"),
+)
+
+
+@lru_cache(maxsize=4096)
+def _format_scaled(tenths, suffix):
+    return f"{tenths // 10}.{tenths % 10}{suffix}"
+
+
+def _format_int(n):
+    for threshold, suffix in _NUMBER_SUFFIXES:
+        if n >= threshold:
+            # Round to tenths in integer math (half up) so the result does
+            # not depend on float representation of n / threshold
+            tenths = (n * 10 + threshold // 2) // threshold
+            # Cache on the displayed value: a steadily growing count maps to
+            # the same string for many frames instead of filling the cache
+            return _format_scaled(tenths, suffix)
+    return str(n)
+
+
 def format_number(num):
     """Format a number with K/M/B/T suffixes"""
-    if num < 1000:
-        return str(int(num))
-    elif num < 1000000:
-        return f"{num / 1000:.1f}K"
-    elif num < 1000000000:
-        return f"{num / 1000000:.1f}M"
-    elif num < 1000000000000:
-        return f"{num / 1000000000:.1f}B"
-    else:
-        return f"{num / 1000000000000:.1f}T"
+    if not math.isfinite(num):
+        # int() cannot take inf/nan (e.g. the cost of a generator outside the
+        # current era); keep the old "infT"/"nanT" text
+        return f"{num:.1f}T"
+    # Only the integer part can reach the displayed tenth of a unit
+    return _format_int(int(num))
 
 
 def get_exact_bits(category, generation):
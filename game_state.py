@@ -5,12 +5,85 @@ Game state management for Bit by Bit Game
 import pygame
 import math
 import json
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional
 from constants import (
     CONFIG, GENERATORS, UPGRADES, HARDWARE_GENERATIONS, COST_MULT_BY_ERA,
     ERAS, ABACUS_GENERATORS, MECHANICAL_GENERATORS, ELECTROMECHANICAL_GENERATORS,
     VACUUM_TUBE_GENERATORS, ERA_UPGRADES, PRESTIGE_UPGRADES
 )
 
+# Try to import numpy for vectorized production sums
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+    np = None
+
+
+# Era index -> (generator table, era upgrade category) for the pre-transistor eras
+ERA_GENERATOR_TABLES = {
+    0: (ABACUS_GENERATORS, "abacus"),
+    1: (MECHANICAL_GENERATORS, "mechanical"),
+    2: (ELECTROMECHANICAL_GENERATORS, "electromechanical"),
+    3: (VACUUM_TUBE_GENERATORS, "vacuum_tubes"),
+}
+
+@dataclass(frozen=True, slots=True)
+class GenCfg:
+    """Immutable numbers the cost paths read for one generator"""
+
+    base_cost: float
+    cost_multiplier: Optional[float] = None  # None: use the era default
+
+    @classmethod
+    def from_config(cls, generator):
+        return cls(
+            base_cost=generator["base_cost"],
+            cost_multiplier=generator.get("cost_multiplier"),
+        )
+
+
+def _build_gen_cfgs(*tables):
+    """Flatten generator tables into id -> GenCfg, earlier tables taking precedence"""
+    cfgs = {}
+    for table in tables:
+        for gen_id, generator in table.items():
+            if gen_id not in cfgs:
+                cfgs[gen_id] = GenCfg.from_config(generator)
+    return cfgs
+
+
+# Lookup tables for get_generator_cost / get_era_generator_cost, in the same
+# precedence order as their original if/elif chains
+GENERATOR_CFGS = _build_gen_cfgs(
+    CONFIG["GENERATORS"], CONFIG.get("HARDWARE_GENERATORS", {})
+)
+ERA_GENERATOR_CFGS = _build_gen_cfgs(
+    ABACUS_GENERATORS,
+    MECHANICAL_GENERATORS,
+    ELECTROMECHANICAL_GENERATORS,
+    VACUUM_TUBE_GENERATORS,
+    CONFIG["GENERATORS"],
+    CONFIG.get("HARDWARE_GENERATORS", {}),
+)
+
+# Basic generator id -> bits needed to unlock it (0 for always-available generators)
+GENERATOR_UNLOCK_THRESHOLDS = {
+    gen_id: generator.get("unlock_threshold", 0)
+    for gen_id, generator in CONFIG["GENERATORS"].items()
+}
+
+
+@lru_cache(maxsize=None)
+def _load_toon_cached(path):
+    """Parse a TOON config file once per process; callers must not mutate the result"""
+    from toon_parser import load_toon_file
+
+    return load_toon_file(path)
+
 
 class GameState:
     def __init__(self):
@@ -30,7 +103,7 @@ class GameState:
 
         # Generators - organized by era
         self.generators = {}
-        self.unlocked_generators = ["pebble"]  # Start with pebble counter
+        self.unlocked_generators = {"pebble"}  # Start with pebble counter
 
         # Upgrades
         self.upgrades = {}
@@ -84,6 +157,18 @@ class GameState:
         self.total_prestige_currency = 0
         self.prestige_count = 0
 
+        # Cached production rate, recomputed only after invalidate_production_rate()
+        # or once era currency reaches the next generator unlock threshold
+        self._prod_rate = 0
+        self._prod_rate_dirty = True
+        self._prod_rate_unlock_at = math.inf
+
+        # cost_multiplier -> [multiplier ** 0, multiplier ** 1, ...]
+        self._cost_powers = {}
+
+        # Set by mutators, cleared by a successful save; autosave skips clean state
+        self.unsaved_changes = True
+
         # Initialize structures
         self.initialize_structures()
 
@@ -128,14 +213,12 @@ class GameState:
                 self.upgrades[upgrade_id] = {"level": 0}
 
         try:
-            from toon_parser import load_toon_file
-
-            compression_gens = load_toon_file("config/compression_generators.toon")
+            compression_gens = _load_toon_cached("config/compression_generators.toon")
             if "compression_generators" in compression_gens:
                 for gen in compression_gens["compression_generators"]:
-                    self.compression_generators[gen["id"]] = gen
+                    self.compression_generators[gen["id"]] = {"count": 0, "total_bought": 0}
 
-            compression_ups = load_toon_file("config/compression_upgrades.toon")
+            compression_ups = _load_toon_cached("config/compression_upgrades.toon")
             if "data_shard_upgrades" in compression_ups:
                 for upgrade in compression_ups["data_shard_upgrades"]:
                     self.data_shard_upgrades[upgrade["id"]] = upgrade
@@ -143,15 +226,67 @@ class GameState:
             pass
 
         # Initialize compression structures
-        for gen_id in self.compression_generators:
-            self.compression_generators[gen_id] = {"count": 0, "total_bought": 0}
-
         for upgrade_id in self.data_shard_upgrades:
             self.data_shard_upgrades[upgrade_id] = {"level": 0}
 
+        self._build_generator_arrays()
+
+    def _build_generator_arrays(self):
+        """Lay generator production config out as parallel numpy arrays.
+
+        Counts stay in self.generators; they are gathered into an array each
+        time the cached production rate is rebuilt.
+        """
+        if not HAS_NUMPY:
+            return
+
+        self._gen_index = {gen_id: i for i, gen_id in enumerate(self.generators)}
+
+        # Era 0-3: (count indices, base production, unlock threshold) per era
+        self._era_gen_arrays = {}
+        for era, (era_generators, _) in ERA_GENERATOR_TABLES.items():
+            gen_ids = [gen_id for gen_id in era_generators if gen_id in self._gen_index]
+            self._era_gen_arrays[era] = (
+                np.array([self._gen_index[g] for g in gen_ids], dtype=np.intp),
+                np.array([era_generators[g]["base_production"] for g in gen_ids], dtype=np.float64),
+                np.array([era_generators[g].get("unlock_threshold", 0) for g in gen_ids], dtype=np.float64),
+            )
+
+        # Era 4+: (count indices, base production, category index, categories)
+        hardware_generators = CONFIG.get("HARDWARE_GENERATORS", {})
+        gen_ids = [gen_id for gen_id in hardware_generators if gen_id in self._gen_index]
+        categories = sorted({hardware_generators[g]["category"] for g in gen_ids})
+        self._hw_gen_arrays = (
+            np.array([self._gen_index[g] for g in gen_ids], dtype=np.intp),
+            np.array([hardware_generators[g]["base_production"] for g in gen_ids], dtype=np.float64),
+            np.array([categories.index(hardware_generators[g]["category"]) for g in gen_ids], dtype=np.intp),
+            categories,
+        )
+
+    def invalidate_production_rate(self):
+        """Mark the cached production rate stale after generators/upgrades/multipliers change"""
+        self._prod_rate_dirty = True
+        self.unsaved_changes = True
+
     def get_production_rate(self):
-        # Use the new era progression system
-        return self.get_era_production_rate()
+        if self._prod_rate_dirty or self.get_total_currency_earned() >= self._prod_rate_unlock_at:
+            # Use the new era progression system
+            self._prod_rate = self.get_era_production_rate()
+            self._prod_rate_unlock_at = self._get_next_unlock_threshold()
+            self._prod_rate_dirty = False
+        return self._prod_rate
+
+    def _get_next_unlock_threshold(self):
+        """Lowest unreached unlock threshold among the current era's generators"""
+        if self.current_era not in ERA_GENERATOR_TABLES:
+            return math.inf
+        total_currency = self.get_total_currency_earned()
+        era_generators = ERA_GENERATOR_TABLES[self.current_era][0]
+        return min(
+            (gen.get("unlock_threshold", 0) for gen in era_generators.values()
+             if gen.get("unlock_threshold", 0) > total_currency),
+            default=math.inf,
+        )
 
     # =========================================================================
     # ERA PROGRESSION SYSTEM
@@ -181,69 +316,10 @@ class GameState:
     
     def get_era_production_rate(self):
         """Calculate production rate based on current era"""
-        base_production = 0
-        
-        # Era 0: Abacus generators
-        if self.current_era == 0:
-            for gen_id, gen_data in self.generators.items():
-                if gen_data["count"] > 0 and gen_id in ABACUS_GENERATORS:
-                    generator = ABACUS_GENERATORS[gen_id]
-                    # Check if generator is unlocked
-                    if self.is_era_generator_unlocked(gen_id):
-                        gen_production = gen_data["count"] * generator["base_production"]
-                        base_production += gen_production
-            
-            # Apply era-specific upgrades
-            era_multiplier = self.get_era_upgrade_multiplier("abacus")
-            base_production *= era_multiplier
-            
-        # Era 1: Mechanical generators
-        elif self.current_era == 1:
-            for gen_id, gen_data in self.generators.items():
-                if gen_data["count"] > 0 and gen_id in MECHANICAL_GENERATORS:
-                    generator = MECHANICAL_GENERATORS[gen_id]
-                    if self.is_era_generator_unlocked(gen_id):
-                        gen_production = gen_data["count"] * generator["base_production"]
-                        base_production += gen_production
-            
-            era_multiplier = self.get_era_upgrade_multiplier("mechanical")
-            base_production *= era_multiplier
-            
-        # Era 2: Electromechanical generators
-        elif self.current_era == 2:
-            for gen_id, gen_data in self.generators.items():
-                if gen_data["count"] > 0 and gen_id in ELECTROMECHANICAL_GENERATORS:
-                    generator = ELECTROMECHANICAL_GENERATORS[gen_id]
-                    if self.is_era_generator_unlocked(gen_id):
-                        gen_production = gen_data["count"] * generator["base_production"]
-                        base_production += gen_production
-            
-            era_multiplier = self.get_era_upgrade_multiplier("electromechanical")
-            base_production *= era_multiplier
-            
-        # Era 3: Vacuum Tube generators
-        elif self.current_era == 3:
-            for gen_id, gen_data in self.generators.items():
-                if gen_data["count"] > 0 and gen_id in VACUUM_TUBE_GENERATORS:
-                    generator = VACUUM_TUBE_GENERATORS[gen_id]
-                    if self.is_era_generator_unlocked(gen_id):
-                        gen_production = gen_data["count"] * generator["base_production"]
-                        base_production += gen_production
-            
-            era_multiplier = self.get_era_upgrade_multiplier("vacuum_tubes")
-            base_production *= era_multiplier
-            
-        # Era 4+: Transistors (modern hardware generators)
-        elif self.current_era >= 4:
-            # Use existing hardware generator logic
-            for gen_id, gen_data in self.generators.items():
-                if (gen_data["count"] > 0 and gen_id in CONFIG.get("HARDWARE_GENERATORS", {})):
-                    generator = CONFIG["HARDWARE_GENERATORS"][gen_id]
-                    category = generator["category"]
-                    if self.is_hardware_category_unlocked(category):
-                        category_multiplier = self.get_category_multiplier(category)
-                        production = gen_data["count"] * generator["base_production"] * category_multiplier
-                        base_production += production
+        if HAS_NUMPY:
+            base_production = self._get_generator_production_vectorized()
+        else:
+            base_production = self._get_generator_production()
         
         # Apply binary efficiency multiplier (from prestige upgrades)
         base_production *= self.binary_efficiency
@@ -254,6 +330,80 @@ class GameState:
         
         return base_production
     
+    def _get_generator_production(self):
+        """Era generator output before global multipliers (pure-Python path)"""
+        base_production = 0
+        generators = self.generators
+        
+        # Eras 0-3: Abacus, Mechanical, Electromechanical, Vacuum Tube generators
+        if self.current_era in ERA_GENERATOR_TABLES:
+            era_generators, upgrade_category = ERA_GENERATOR_TABLES[self.current_era]
+            total_currency = self.get_total_currency_earned()
+            for gen_id, generator in era_generators.items():
+                gen_data = generators.get(gen_id)
+                if not gen_data:
+                    continue
+                count = gen_data["count"]
+                if not count:
+                    continue
+                # Check if generator is unlocked
+                if total_currency >= generator.get("unlock_threshold", 0):
+                    base_production += count * generator["base_production"]
+            
+            # Apply era-specific upgrades
+            base_production *= self.get_era_upgrade_multiplier(upgrade_category)
+            
+        # Era 4+: Transistors (modern hardware generators)
+        elif self.current_era >= 4:
+            # Category multipliers are looked up once per category, not per generator
+            category_multipliers = {}
+            for gen_id, generator in CONFIG.get("HARDWARE_GENERATORS", {}).items():
+                gen_data = generators.get(gen_id)
+                if not gen_data:
+                    continue
+                count = gen_data["count"]
+                if not count:
+                    continue
+                category = generator["category"]
+                multiplier = category_multipliers.get(category)
+                if multiplier is None:
+                    if self.is_hardware_category_unlocked(category):
+                        multiplier = self.get_category_multiplier(category)
+                    else:
+                        multiplier = 0
+                    category_multipliers[category] = multiplier
+                if multiplier:
+                    base_production += count * generator["base_production"] * multiplier
+        
+        return base_production
+    
+    def _get_generator_production_vectorized(self):
+        """Era generator output before global multipliers, from the SoA arrays"""
+        generators = self.generators
+        counts = np.array([
+            generators[gen_id]["count"] if gen_id in generators else 0
+            for gen_id in self._gen_index
+        ], dtype=np.int64)
+        
+        # Eras 0-3: Abacus, Mechanical, Electromechanical, Vacuum Tube generators
+        if self.current_era in self._era_gen_arrays:
+            indices, base, thresholds = self._era_gen_arrays[self.current_era]
+            unlocked = thresholds <= self.get_total_currency_earned()
+            base_production = float(np.dot(counts[indices] * unlocked, base))
+            upgrade_category = ERA_GENERATOR_TABLES[self.current_era][1]
+            return base_production * self.get_era_upgrade_multiplier(upgrade_category)
+        
+        # Era 4+: Transistors (modern hardware generators)
+        if self.current_era >= 4:
+            indices, base, category_idx, categories = self._hw_gen_arrays
+            multipliers = np.array([
+                self.get_category_multiplier(c) if self.is_hardware_category_unlocked(c) else 0.0
+                for c in categories
+            ], dtype=np.float64)
+            return float(np.dot(counts[indices] * multipliers[category_idx], base))
+        
+        return 0
+    
     def is_era_generator_unlocked(self, generator_id):
         """Check if an era-specific generator is unlocked"""
         # Check which generator dictionary it belongs to
@@ -285,7 +435,7 @@ class GameState:
             if upgrade_data.get("category") == category:
                 level = self.era_upgrades.get(upgrade_id, {}).get("level", 0)
                 effect = upgrade_data.get("effect", 1)
-                multiplier *= math.pow(effect, level)
+                multiplier *= effect ** level
         
         return multiplier
     
@@ -319,43 +469,41 @@ class GameState:
     
     def get_era_generator_cost(self, generator_id, quantity=1):
         """Get the cost for an era-specific generator"""
-        # Determine which generator dict to use
-        if generator_id in ABACUS_GENERATORS:
-            generator = ABACUS_GENERATORS[generator_id]
-        elif generator_id in MECHANICAL_GENERATORS:
-            generator = MECHANICAL_GENERATORS[generator_id]
-        elif generator_id in ELECTROMECHANICAL_GENERATORS:
-            generator = ELECTROMECHANICAL_GENERATORS[generator_id]
-        elif generator_id in VACUUM_TUBE_GENERATORS:
-            generator = VACUUM_TUBE_GENERATORS[generator_id]
-        elif generator_id in CONFIG["GENERATORS"]:
-            generator = CONFIG["GENERATORS"][generator_id]
-        elif generator_id in CONFIG.get("HARDWARE_GENERATORS", {}):
-            generator = CONFIG["HARDWARE_GENERATORS"][generator_id]
-        else:
+        generator = ERA_GENERATOR_CFGS.get(generator_id)
+        if generator is None:
             return float('inf')
         
         current_count = self.generators[generator_id]["count"]
         
         # Get era-specific cost multiplier
-        era_cost_mult = COST_MULT_BY_ERA.get(self.current_era, 1.15)
-        cost_multiplier = generator.get("cost_multiplier", era_cost_mult)
+        cost_multiplier = generator.cost_multiplier
+        if cost_multiplier is None:
+            cost_multiplier = COST_MULT_BY_ERA.get(self.current_era, 1.15)
 
         if quantity == 1:
             return int(
-                generator["base_cost"]
-                * math.pow(cost_multiplier, current_count)
+                generator.base_cost
+                * self._cost_power(cost_multiplier, current_count)
             )
 
         # Bulk purchase cost calculation
-        first_cost = generator["base_cost"] * math.pow(
+        first_cost = generator.base_cost * self._cost_power(
             cost_multiplier, current_count
         )
-        ratio = math.pow(cost_multiplier, quantity) - 1
+        ratio = self._cost_power(cost_multiplier, quantity) - 1
         denominator = cost_multiplier - 1
 
         return int(first_cost * ratio / denominator)
     
+    def _cost_power(self, multiplier, exponent):
+        """multiplier ** exponent, memoised per multiplier since costs are queried every frame"""
+        powers = self._cost_powers.get(multiplier)
+        if powers is None:
+            powers = self._cost_powers[multiplier] = [1.0]
+        while len(powers) <= exponent:
+            powers.append(float(multiplier) ** len(powers))
+        return powers[exponent]
+    
     def get_era_upgrade_cost(self, upgrade_id):
         """Get the cost for an era-specific upgrade"""
         if upgrade_id not in ERA_UPGRADES:
@@ -366,7 +514,7 @@ class GameState:
         
         return int(
             upgrade["base_cost"]
-            * math.pow(upgrade["cost_multiplier"], current_level)
+            * self._cost_power(upgrade["cost_multiplier"], current_level)
         )
     
     def can_afford_era_upgrade(self, upgrade_id):
@@ -391,6 +539,7 @@ class GameState:
         if upgrade_id not in self.era_upgrades:
             self.era_upgrades[upgrade_id] = {"level": 0}
         self.era_upgrades[upgrade_id]["level"] += 1
+        self.invalidate_production_rate()
         return True
     
     def can_advance_era(self):
@@ -410,6 +559,7 @@ class GameState:
             return False
         
         self.current_era += 1
+        self.invalidate_production_rate()
         
         # Update unlocked categories for new era
         if self.current_era in ERAS:
@@ -476,6 +626,7 @@ class GameState:
         # Update currency tracking
         self.pebbles = 0
         
+        self.invalidate_production_rate()
         return True
     
     def can_invent_boolean_algebra(self):
@@ -502,6 +653,7 @@ class GameState:
         # Mark prestige upgrade as purchased
         self.prestige_upgrades["boolean_algebra"]["purchased"] = True
         
+        self.invalidate_production_rate()
         return True
     
     def can_invent_logic_gates(self):
@@ -527,6 +679,7 @@ class GameState:
         # Mark prestige upgrade as purchased
         self.prestige_upgrades["logic_gates"]["purchased"] = True
         
+        self.invalidate_production_rate()
         return True
     
     def get_binary_invention_progress(self):
@@ -556,32 +709,29 @@ class GameState:
 
     def get_generator_cost(self, generator_id, quantity=1):
         # Check both basic and hardware generators
-        if generator_id in CONFIG["GENERATORS"]:
-            generator = CONFIG["GENERATORS"][generator_id]
-        elif generator_id in CONFIG.get("HARDWARE_GENERATORS", {}):
-            generator = CONFIG["HARDWARE_GENERATORS"][generator_id]
-        else:
+        generator = GENERATOR_CFGS.get(generator_id)
+        if generator is None:
             return float('inf')  # Unknown generator
         
         current_count = self.generators[generator_id]["count"]
         
-        # Get era-specific cost multiplier (design doc: 1.15 for early eras, 1.10 for late)
-        era_cost_mult = COST_MULT_BY_ERA.get(self.hardware_generation, 1.15)
-        
         # Use generator's own multiplier if set, otherwise use era multiplier
-        cost_multiplier = generator.get("cost_multiplier", era_cost_mult)
+        # (design doc: 1.15 for early eras, 1.10 for late)
+        cost_multiplier = generator.cost_multiplier
+        if cost_multiplier is None:
+            cost_multiplier = COST_MULT_BY_ERA.get(self.hardware_generation, 1.15)
 
         if quantity == 1:
             return int(
-                generator["base_cost"]
-                * math.pow(cost_multiplier, current_count)
+                generator.base_cost
+                * self._cost_power(cost_multiplier, current_count)
             )
 
         # Bulk purchase cost calculation
-        first_cost = generator["base_cost"] * math.pow(
+        first_cost = generator.base_cost * self._cost_power(
             cost_multiplier, current_count
         )
-        ratio = math.pow(cost_multiplier, quantity) - 1
+        ratio = self._cost_power(cost_multiplier, quantity) - 1
         denominator = cost_multiplier - 1
 
         return int(first_cost * ratio / denominator)
@@ -599,7 +749,7 @@ class GameState:
 
         return int(
             upgrade["base_cost"]
-            * math.pow(upgrade["cost_multiplier"], self.upgrades[upgrade_id]["level"])
+            * self._cost_power(upgrade["cost_multiplier"], self.upgrades[upgrade_id]["level"])
         )
 
     def can_afford(self, cost):
@@ -607,13 +757,11 @@ class GameState:
 
     def is_generator_unlocked(self, generator_id):
         # Check both basic and hardware generators
-        if generator_id in CONFIG["GENERATORS"]:
-            generator = CONFIG["GENERATORS"][generator_id]
-            if "unlock_threshold" not in generator:
-                return True
+        threshold = GENERATOR_UNLOCK_THRESHOLDS.get(generator_id)
+        if threshold is not None:
             return (
                 generator_id in self.unlocked_generators
-                or self.total_bits_earned >= generator["unlock_threshold"]
+                or self.total_bits_earned >= threshold
             )
         elif generator_id in CONFIG.get("HARDWARE_GENERATORS", {}):
             generator = CONFIG["HARDWARE_GENERATORS"][generator_id]
@@ -663,7 +811,7 @@ class GameState:
         upgrade_id = category_upgrades.get(category)
         if upgrade_id and upgrade_id in CONFIG["HARDWARE_UPGRADES"]:
             level = self.upgrades.get(upgrade_id, {}).get("level", 0)
-            return math.pow(CONFIG["HARDWARE_UPGRADES"][upgrade_id]["effect"], level)
+            return CONFIG["HARDWARE_UPGRADES"][upgrade_id]["effect"] ** level
 
         return 1.0
 
@@ -678,7 +826,13 @@ class GameState:
         if self.total_bits_earned < threshold:
             return 0
         # Base tokens + bonus for era completion
-        base_tokens = int(math.log2(self.total_bits_earned) - 20)
+        # int(log2(bits) - 20) on integers: bit_length() is floor(log2), and
+        # int() truncates toward zero, so negative results round up unless
+        # bits is an exact power of two
+        bits = int(self.total_bits_earned)
+        base_tokens = bits.bit_length() - 21
+        if base_tokens < 0 and bits & (bits - 1):
+            base_tokens += 1
         era_bonus = self.hardware_generation * 5  # Bonus tokens for higher eras
         shard_bonus = self.get_rebirth_shard_bonus()
         return int((base_tokens + era_bonus) * (1 + shard_bonus))
@@ -729,6 +883,7 @@ class GameState:
             self.hardware_generation += 1
             new_gen = HARDWARE_GENERATIONS[self.hardware_generation]
             self.unlocked_hardware_categories = new_gen["unlock_categories"]
+            self.invalidate_production_rate()
             return True
         return False
 
@@ -763,13 +918,14 @@ class GameState:
         # Reset generators
         for gen_id in self.generators:
             self.generators[gen_id] = {"count": 0, "total_bought": 0}
+        self.invalidate_production_rate()
 
         # Reset upgrades
         for upgrade_id in self.upgrades:
             self.upgrades[upgrade_id] = {"level": 0}
 
         # Reset unlocks
-        self.unlocked_generators = ["rng"]
+        self.unlocked_generators = {"rng"}
 
         # Update lifetime tracking
         self.total_lifetime_bits = (
@@ -826,17 +982,19 @@ class GameState:
         # Reset generators
         for gen_id in self.generators:
             self.generators[gen_id] = {"count": 0, "total_bought": 0}
+        self.invalidate_production_rate()
 
         # Reset upgrades
         for upgrade_id in self.upgrades:
             self.upgrades[upgrade_id] = {"level": 0}
 
         # Reset unlocks
-        self.unlocked_generators = ["rng"]
+        self.unlocked_generators = {"rng"}
 
         # Keep prestige currency but reset hardware
         self.hardware_generation = 0
         self.unlocked_hardware_categories = ["cpu"]
+        self.invalidate_production_rate()
 
         # Reset era
         self.era = "entropy"
@@ -875,6 +1033,7 @@ class GameState:
             self.data_shards += shards
             self.total_data_shards += shards
             self.last_collect_bits = self.total_bits_earned
+            self.unsaved_changes = True
         return shards
 
     def get_data_shard_upgrade_cost(self, upgrade_id):
@@ -923,6 +1082,7 @@ class GameState:
         
         self.data_shards -= cost
         self.data_shard_upgrades[upgrade_id]["level"] += 1
+        self.unsaved_changes = True
         return True
     
     def get_collect_threshold(self):
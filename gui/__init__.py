@@ -17,20 +17,20 @@ import sys
 import math
 import json
 import os
-import random
+import threading
 
 from constants import (
     COLORS, CONFIG, GENERATORS, UPGRADES, WINDOW_WIDTH, WINDOW_HEIGHT,
-    FPS, get_all_generators, get_all_upgrades
+    FPS, get_all_generators, get_all_upgrades, format_number
 )
 from game_state import GameState
-from visual_effects import Particle, BinaryRain, SmartBitVisualization
-from ui_components import Button, FloatingText, LayoutManager, GameUIState
+from visual_effects import ParticleSystem, BinaryRain, SmartBitVisualization
+from ui_components import Button, FloatingText, LayoutManager, GameUIState, render_text
 from bit_grid import MotherboardBitGrid
 from compression_ui import CompressionPanel, CompressionMeter, TokenDisplay, CompressionProgressBar
 
 from .panels import ScrollablePanel
-from .cards import draw_generator_card, draw_upgrade_card, draw_panel_toggle, draw_panel_with_integrated_title, draw_scrollbar
+from .cards import draw_generator_card, is_generator_card_locked, draw_upgrade_card, draw_panel_toggle, draw_panel_with_integrated_title, draw_scrollbar
 from .modals import draw_rebirth_confirmation, draw_prestige_confirmation, draw_tutorial, draw_settings_page, draw_statistics_page
 from .top_bar import draw_top_bar
 from .accumulator import draw_accumulator, draw_data_shard_upgrades, DataShardUpgradeCard
@@ -119,7 +119,10 @@ class BitByBitGame:
         self._setup_effects()
         
         self.last_auto_save = pygame.time.get_ticks()
-        self.last_update = pygame.time.get_ticks()
+        self._save_thread = None
+        self.last_update = self.last_auto_save
+        # Clock sampled once per frame in update() for timers that only need frame precision
+        self._now_ms = self.last_auto_save
         self.last_click_time = 0
 
         self.showing_tutorial = False
@@ -166,6 +169,10 @@ class BitByBitGame:
         self._gradient_surface = None
         self._last_gradient_size = (0, 0)
 
+        # Hardware card list, redrawn only when what its visible cards show changes
+        self._hardware_panel_surface = None
+        self._hardware_panel_key = None
+
         self.cheat_mode = False
         self.cheat_purchases = set()
 
@@ -283,21 +290,21 @@ class BitByBitGame:
         pass
 
     def _setup_effects(self):
-        self.particles = []
+        self.max_particles = 100  # Performance limit for 60fps target
+        self.particles = ParticleSystem(self.max_particles)
         self.floating_texts = []
         self.motherboard_notification = MotherboardUpgradeNotification()
-        self.max_particles = 100  # Performance limit for 60fps target
-    
-    def _add_particle(self, particle):
-        """Add a particle while respecting the max limit for performance"""
-        if len(self.particles) < self.max_particles:
-            self.particles.append(particle)
-    
-    def _add_particles(self, particles):
-        """Add multiple particles while respecting the max limit"""
-        available = self.max_particles - len(self.particles)
-        if available > 0:
-            self.particles.extend(particles[:available])
+
+    @staticmethod
+    def _update_effect_list(items, dt):
+        """Update live particles/texts and drop dead ones in one in-place pass"""
+        write = 0
+        for item in items:
+            if item.lifetime > 0:
+                item.update(dt)
+                items[write] = item
+                write += 1
+        del items[write:]
 
     def setup_generator_buttons(self):
         pass  # Generator buttons are handled dynamically in _draw_hardware_panel
@@ -331,16 +338,7 @@ class BitByBitGame:
             self.component_upgrade_buttons[comp_name] = upgrade_button
 
     def format_number(self, num):
-        if num < 1000:
-            return str(int(num))
-        elif num < 1000000:
-            return f"{num / 1000:.1f}K"
-        elif num < 1000000000:
-            return f"{num / 1000000:.1f}M"
-        elif num < 1000000000000:
-            return f"{num / 1000000000:.1f}B"
-        else:
-            return f"{num / 1000000000000:.1f}T"
+        return format_number(num)
 
     def handle_window_resize(self, new_width, new_height):
         self.current_width = new_width
@@ -596,39 +594,35 @@ class BitByBitGame:
                     self.tutorial_text = ""
                 continue
 
+            # Everything below is a left-click hit test; other events stop here
+            # instead of walking every button and state predicate
+            if event.type != pygame.MOUSEBUTTONDOWN or event.button != 1:
+                continue
+
             clicked_core = False
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                if hasattr(self, 'information_core') and self.information_core:
-                    core = self.information_core
-                    dist = math.sqrt((mouse_pos[0] - core["x"]) ** 2 + (mouse_pos[1] - core["y"]) ** 2)
-                    if dist < core["radius"]:
-                        clicked_core = True
-                        self.handle_click()
-                
-                # Check for abacus click in Era 0
-                current_computing_era = getattr(self.state, 'current_era', 0)
-                if current_computing_era == 0:
-                    abacus_area = getattr(self.state, '_abacus_click_area', None)
-                    if abacus_area and abacus_area.collidepoint(mouse_pos):
-                        clicked_core = True
-                        self.handle_click()
+            if hasattr(self, 'information_core') and self.information_core:
+                core = self.information_core
+                dist = math.sqrt((mouse_pos[0] - core["x"]) ** 2 + (mouse_pos[1] - core["y"]) ** 2)
+                if dist < core["radius"]:
+                    clicked_core = True
+                    self.handle_click()
+            
+            # Check for abacus click in Era 0
+            current_computing_era = getattr(self.state, 'current_era', 0)
+            if current_computing_era == 0:
+                abacus_area = getattr(self.state, '_abacus_click_area', None)
+                if abacus_area and abacus_area.collidepoint(mouse_pos):
+                    clicked_core = True
+                    self.handle_click()
             
             # Only click button if core wasn't clicked
             if not clicked_core and self.click_button.is_clicked(event):
                 self.handle_click()
 
-            if (
-                self.hardware_panel_open
-                and event.type == pygame.MOUSEBUTTONDOWN
-                and event.button == 1
-            ):
+            if self.hardware_panel_open:
                 self.handle_generator_card_clicks(mouse_pos)
 
-            if (
-                self.upgrades_panel_open
-                and event.type == pygame.MOUSEBUTTONDOWN
-                and event.button == 1
-            ):
+            if self.upgrades_panel_open:
                 self.handle_upgrade_card_clicks(mouse_pos)
 
             if self.settings_button.is_clicked(event):
@@ -657,20 +651,21 @@ class BitByBitGame:
             if self.upgrades_toggle.is_clicked(event):
                 self.upgrades_panel_open = not self.upgrades_panel_open
 
-            if self.state.can_rebirth(self.bit_grid) and self.rebirth_button.is_clicked(event):
+            # Hit-test first; the eligibility checks only run for a click on the button
+            if self.rebirth_button.is_clicked(event) and self.state.can_rebirth(self.bit_grid):
                 self.showing_rebirth_confirmation = True
 
-            if self.state.can_prestige() and self.prestige_button.is_clicked(event):
+            if self.prestige_button.is_clicked(event) and self.state.can_prestige():
                 self.showing_prestige_confirmation = True
 
-            if self.state.can_collect_data_shards() and self.collect_shards_button.is_clicked(event):
+            if self.collect_shards_button.is_clicked(event) and self.state.can_collect_data_shards():
                 shards_collected = self.state.collect_data_shards()
                 if shards_collected > 0:
                     self.create_shards_collected_effect(shards_collected)
 
             if self.state.era == "compression":
                 for card in self.data_shard_upgrade_cards:
-                    if card.contains(mouse_pos) and event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                    if card.contains(mouse_pos):
                         if self.state.can_purchase_data_shard_upgrade(card.upgrade_id):
                             self.state.purchase_data_shard_upgrade(card.upgrade_id)
 
@@ -707,6 +702,7 @@ class BitByBitGame:
         self.state.bits += click_power
         self.state.total_bits_earned += click_power
         self.state.total_clicks += 1
+        self.state.unsaved_changes = True
 
         self.last_click_time = pygame.time.get_ticks()
 
@@ -718,9 +714,7 @@ class BitByBitGame:
                 FloatingText(mouse_x, mouse_y, f"+{self.format_number(click_power)}")
             )
 
-            self._add_particle(
-                Particle(mouse_x, mouse_y, COLORS["matrix_green"], "click")
-            )
+            self.particles.emit(mouse_x, mouse_y, (COLORS["matrix_green"],), "click")
 
         self.check_tutorial()
 
@@ -740,22 +734,13 @@ class BitByBitGame:
                 self.state.bits -= cost
             self.state.generators[generator_id]["count"] += quantity
             self.state.generators[generator_id]["total_bought"] += quantity
+            self.state.invalidate_production_rate()
 
             self.bit_grid.add_purchase_effect()
 
             if self.state.visual_settings["particle_effects"]:
                 mouse_x, mouse_y = pygame.mouse.get_pos()
-                particles_to_add = []
-                for _ in range(4):
-                    particles_to_add.append(
-                        Particle(
-                            mouse_x,
-                            mouse_y,
-                            COLORS["electric_cyan"],
-                            "purchase",
-                        )
-                    )
-                self._add_particles(particles_to_add)
+                self.particles.emit(mouse_x, mouse_y, (COLORS["electric_cyan"],), "purchase", 4)
 
     def buy_upgrade(self, upgrade_id):
         if not self.cheat_mode and not self.state.is_upgrade_unlocked(upgrade_id):
@@ -775,6 +760,7 @@ class BitByBitGame:
             if not self.cheat_mode:
                 self.state.bits -= cost
             self.state.upgrades[upgrade_id]["level"] += 1
+            self.state.invalidate_production_rate()
 
             self.bit_grid.add_purchase_effect()
 
@@ -783,15 +769,9 @@ class BitByBitGame:
                 button_center_x = button_rect.centerx
                 button_center_y = button_rect.centery
 
-                for _ in range(4):
-                    self.particles.append(
-                        Particle(
-                            button_center_x,
-                            button_center_y,
-                            COLORS["neon_purple"],
-                            "purchase",
-                        )
-                    )
+                self.particles.emit(
+                    button_center_x, button_center_y, (COLORS["neon_purple"],), "purchase", 4
+                )
 
     def handle_generator_card_clicks(self, mouse_pos):
         panel = self.hardware_scroll_panel
@@ -910,17 +890,13 @@ class BitByBitGame:
                 button_center_x = button_rect.centerx
                 button_center_y = button_rect.centery
 
-                for _ in range(6):
-                    self.particles.append(
-                        Particle(
-                            button_center_x,
-                            button_center_y,
-                            comp["color"],
-                            "purchase",
-                        )
-                    )
+                self.particles.emit(
+                    button_center_x, button_center_y, (comp["color"],), "purchase", 6
+                )
 
     def update(self, dt):
+        self._now_ms = pygame.time.get_ticks()
+
         if self.state.visual_settings["binary_rain"]:
             self.binary_rain.update(dt)
         
@@ -956,6 +932,7 @@ class BitByBitGame:
             self.state.bits += production_int
             self.state.total_bits_earned += production_int
             self.production_accumulator -= production_int
+            self.state.unsaved_changes = True
 
         for gen_id, generator in CONFIG["GENERATORS"].items():
             if "unlock_threshold" in generator:
@@ -963,23 +940,20 @@ class BitByBitGame:
                     gen_id not in self.state.unlocked_generators
                     and self.state.total_bits_earned >= generator["unlock_threshold"]
                 ):
-                    self.state.unlocked_generators.append(gen_id)
+                    self.state.unlocked_generators.add(gen_id)
 
         if self.state.visual_settings["particle_effects"]:
-            self.particles = [p for p in self.particles if p.lifetime > 0]
-            for particle in self.particles:
-                particle.update(dt)
-
-            self.floating_texts = [t for t in self.floating_texts if t.lifetime > 0]
-            for text in self.floating_texts:
-                text.update(dt)
+            self.particles.update(dt)
+            self._update_effect_list(self.floating_texts, dt)
         else:
             self.particles.clear()
             self.floating_texts.clear()
 
-        current_time = pygame.time.get_ticks()
+        current_time = self._now_ms
         if current_time - self.last_auto_save > CONFIG["AUTO_SAVE_INTERVAL"]:
-            self.save_game()
+            # Nothing to write if no mutator has touched the state since the last save
+            if self.state.unsaved_changes:
+                self.save_game(background=True)
             self.last_auto_save = current_time
 
         # Clear old messages after 3 seconds
@@ -988,31 +962,29 @@ class BitByBitGame:
 
     def _draw_save_feedback(self):
         """Draw save/load feedback messages on screen"""
-        current_time = pygame.time.get_ticks()
+        current_time = self._now_ms
         
         # Draw save error
         if self.last_save_error:
-            text = self.small_font.render(self.last_save_error, True, COLORS["red_error"])
+            text = render_text(self.small_font, self.last_save_error, COLORS["red_error"])
             text_rect = text.get_rect(center=(self.current_width // 2, 100))
             self.screen.blit(text, text_rect)
         
         # Draw load error
         if self.last_load_error:
-            text = self.small_font.render(self.last_load_error, True, COLORS["red_error"])
+            text = render_text(self.small_font, self.last_load_error, COLORS["red_error"])
             text_rect = text.get_rect(center=(self.current_width // 2, 100))
             self.screen.blit(text, text_rect)
         
         # Draw save success
         if self.save_success_message and current_time - self.state.last_save_time < 3000:
-            text = self.small_font.render(self.save_success_message, True, COLORS["matrix_green"])
+            text = render_text(self.small_font, self.save_success_message, COLORS["matrix_green"])
             text_rect = text.get_rect(center=(self.current_width // 2, 100))
             self.screen.blit(text, text_rect)
 
     def draw(self):
         self._draw_background()
 
-        draw_circuit_background(self.screen, self.current_width, self.current_height)
-
         if self.state.visual_settings["binary_rain"]:
             self.binary_rain.draw(self.screen)
 
@@ -1028,13 +1000,13 @@ class BitByBitGame:
 
             if self.state.prestige_count > 0:
                 prestige_text = f"🔧 {self.state.prestige_currency} Quantum Fragments (+{int((self.state.get_prestige_bonus()-1)*100)}% prod)"
-                prestige_surface = self.small_font.render(prestige_text, True, COLORS["quantum_violet"])
+                prestige_surface = render_text(self.small_font, prestige_text, COLORS["quantum_violet"])
                 prestige_rect = prestige_surface.get_rect(center=(self.current_width // 2, 55))
                 self.screen.blit(prestige_surface, prestige_rect)
 
             if self.cheat_mode:
                 cheat_text = "⚡ CHEAT MODE: FREE UPGRADES ⚡"
-                cheat_surface = self.large_font.render(cheat_text, True, COLORS["red_error"])
+                cheat_surface = render_text(self.large_font, cheat_text, COLORS["red_error"])
                 cheat_rect = cheat_surface.get_rect(center=(self.current_width // 2, 80))
                 self.screen.blit(cheat_surface, cheat_rect)
 
@@ -1128,7 +1100,9 @@ class BitByBitGame:
     def _draw_background(self):
         if (self._gradient_surface is None or 
             self._last_gradient_size != (self.current_width, self.current_height)):
-            self._gradient_surface = pygame.Surface((self.current_width, self.current_height))
+            # The gradient only varies vertically: fill a one-pixel column and
+            # stretch it across the width instead of drawing a line per row
+            column = pygame.Surface((1, self.current_height))
             for i in range(self.current_height):
                 color_ratio = i / self.current_height
                 color = (
@@ -1136,7 +1110,10 @@ class BitByBitGame:
                     int(COLORS["deep_space_blue"][1] + (COLORS["deep_space_gradient_end"][1] - COLORS["deep_space_blue"][1]) * color_ratio),
                     int(COLORS["deep_space_blue"][2] + (COLORS["deep_space_gradient_end"][2] - COLORS["deep_space_blue"][2]) * color_ratio),
                 )
-                pygame.draw.line(self._gradient_surface, color, (0, i), (self.current_width, i))
+                column.set_at((0, i), color)
+            self._gradient_surface = pygame.transform.scale(column, (self.current_width, self.current_height))
+            # The circuit traces are static too, so they are baked into the same surface
+            draw_circuit_background(self._gradient_surface, self.current_width, self.current_height)
             self._last_gradient_size = (self.current_width, self.current_height)
         self.screen.blit(self._gradient_surface, (0, 0))
 
@@ -1158,10 +1135,10 @@ class BitByBitGame:
         panel = self.hardware_scroll_panel
         draw_panel_with_integrated_title(self.screen, panel, COLORS["electric_cyan"], self.medium_font, self.tiny_font)
 
-        scroll_surface = pygame.Surface((panel.rect.width - 20, panel.rect.height - 60))
-        scroll_surface.fill((18, 20, 28))
-
+        surface_size = (panel.rect.width - 20, panel.rect.height - 60)
         y_offset = -panel.get_scroll_offset()
+        visible_height = surface_size[1]
+        visible_cards = []
 
         all_generators = get_all_generators()
         basic_generators = GENERATORS if GENERATORS else CONFIG["GENERATORS"]
@@ -1173,36 +1150,53 @@ class BitByBitGame:
                 if not self.state.is_era_generator_unlocked(gen_id):
                     continue
 
-            count = self.state.generators.get(gen_id, {}).get("count", 0)
-            cost = self.state.get_generator_cost(gen_id)
-            if gen_id in CONFIG["GENERATORS"]:
-                gen_cfg = CONFIG["GENERATORS"][gen_id]
-                production = count * gen_cfg["base_production"]
-            elif gen_id in CONFIG.get("HARDWARE_GENERATORS", {}):
-                gen_cfg = CONFIG["HARDWARE_GENERATORS"][gen_id]
-                category = gen_cfg["category"]
-                if self.state.is_hardware_category_unlocked(category):
-                    category_multiplier = self.state.get_category_multiplier(category)
-                    production = count * gen_cfg["base_production"] * category_multiplier
+            card_height = 90
+            card_y = y_offset + 8
+
+            # Cull before the per-card cost and production lookups
+            if card_y + card_height > -20 and card_y < visible_height:
+                count = self.state.generators.get(gen_id, {}).get("count", 0)
+                cost = self.state.get_generator_cost(gen_id)
+                if gen_id in CONFIG["GENERATORS"]:
+                    gen_cfg = CONFIG["GENERATORS"][gen_id]
+                    production = count * gen_cfg["base_production"]
+                elif gen_id in CONFIG.get("HARDWARE_GENERATORS", {}):
+                    gen_cfg = CONFIG["HARDWARE_GENERATORS"][gen_id]
+                    category = gen_cfg["category"]
+                    if self.state.is_hardware_category_unlocked(category):
+                        category_multiplier = self.state.get_category_multiplier(category)
+                        production = count * gen_cfg["base_production"] * category_multiplier
+                    else:
+                        production = 0
                 else:
                     production = 0
-            else:
-                production = 0
 
-            card_height = 90
-            card_y = y_offset + 8
+                cost_x10 = self.state.get_generator_cost(gen_id, 10)
 
-            cost_x10 = self.state.get_generator_cost(gen_id, 10)
+                visible_cards.append((
+                    gen_id, card_y, count, cost, production,
+                    self.can_afford(cost), self.can_afford(cost_x10),
+                    is_generator_card_locked(gen_id, self.state, CONFIG),
+                ))
 
-            if card_y + card_height > -20 and card_y < scroll_surface.get_height():
+            y_offset += card_height + 14
+
+        # Cards only change on scroll, purchases, affordability or unlocks, so
+        # most frames reuse the previous frame's surface
+        panel_key = (surface_size, self.medium_font, tuple(visible_cards))
+        scroll_surface = self._hardware_panel_surface
+        if scroll_surface is None or panel_key != self._hardware_panel_key:
+            if scroll_surface is None or scroll_surface.get_size() != surface_size:
+                scroll_surface = self._hardware_panel_surface = pygame.Surface(surface_size)
+            scroll_surface.fill((18, 20, 28))
+            for gen_id, card_y, count, cost, production, can_afford_x1, can_afford_x10, _ in visible_cards:
                 draw_generator_card(
                     scroll_surface, 10, card_y, panel.rect.width - 40, card_height,
-                    generator, gen_id, count, cost, production, 
-                    self.can_afford(cost), self.can_afford(cost_x10),
+                    all_generators[gen_id], gen_id, count, cost, production,
+                    can_afford_x1, can_afford_x10,
                     self.state, CONFIG, self.medium_font, self.small_font, self.tiny_font
                 )
-
-            y_offset += card_height + 14
+            self._hardware_panel_key = panel_key
 
         panel.set_content_height(y_offset + panel.get_scroll_offset() + 30)
         # Content starts below title bar (title bar is 48px, so start at 52 for 4px margin)
@@ -1229,10 +1223,13 @@ class BitByBitGame:
         scroll_surface.fill((18, 20, 28))
 
         y_offset = -panel.get_scroll_offset()
+        visible_height = scroll_surface.get_height()
 
         all_upgrades = get_all_upgrades()
         basic_upgrades = UPGRADES if UPGRADES else CONFIG["UPGRADES"]
         hardware_upgrades = CONFIG.get("HARDWARE_UPGRADES", {})
+        # Sampled once for every card's BUY hover and the scrollbar
+        mouse_pos = pygame.mouse.get_pos()
 
         for upgrade_id, upgrade in all_upgrades.items():
             if not self.cheat_mode:
@@ -1243,19 +1240,20 @@ class BitByBitGame:
                     if not self.state.is_hardware_category_unlocked(upgrade["category"]):
                         continue
 
-            level = self.state.upgrades.get(upgrade_id, {}).get("level", 0)
-            cost = self.state.get_upgrade_cost(upgrade_id)
-            can_afford = self.can_afford(cost) and level < upgrade["max_level"]
-
             card_height = 85
             card_y = y_offset + 8
 
-            if card_y + card_height > -20 and card_y < scroll_surface.get_height():
+            # Cull before the per-card level and cost lookups
+            if card_y + card_height > -20 and card_y < visible_height:
+                level = self.state.upgrades.get(upgrade_id, {}).get("level", 0)
+                cost = self.state.get_upgrade_cost(upgrade_id)
+                can_afford = self.can_afford(cost) and level < upgrade["max_level"]
+
                 draw_upgrade_card(
                     scroll_surface, 10, card_y, panel.rect.width - 40, card_height,
                     upgrade, upgrade_id, level, cost, can_afford,
                     self.upgrade_card_buttons, self.medium_font, self.small_font, self.tiny_font, COLORS,
-                    panel.rect
+                    panel.rect, mouse_pos
                 )
 
             y_offset += card_height + 14
@@ -1265,7 +1263,7 @@ class BitByBitGame:
         self.screen.blit(scroll_surface, (panel.rect.x + 10, panel.rect.y + 52))
 
         if panel.content_height > panel.rect.height - 60:
-            draw_scrollbar(self.screen, panel, pygame.mouse.get_pos())
+            draw_scrollbar(self.screen, panel, mouse_pos)
 
     def handle_settings_events(self, event):
         mouse_pos = pygame.mouse.get_pos()
@@ -1277,10 +1275,13 @@ class BitByBitGame:
 
             if self._settings_rects["crt"].collidepoint(mouse_pos):
                 self.state.visual_settings["crt_effects"] = not self.state.visual_settings["crt_effects"]
+                self.state.unsaved_changes = True
             elif self._settings_rects["rain"].collidepoint(mouse_pos):
                 self.state.visual_settings["binary_rain"] = not self.state.visual_settings["binary_rain"]
+                self.state.unsaved_changes = True
             elif self._settings_rects["particle"].collidepoint(mouse_pos):
                 self.state.visual_settings["particle_effects"] = not self.state.visual_settings["particle_effects"]
+                self.state.unsaved_changes = True
             elif self._settings_rects["contrast"].collidepoint(mouse_pos):
                 self.high_contrast_mode = not self.high_contrast_mode
                 self._update_button_accessibility()
@@ -1321,13 +1322,7 @@ class BitByBitGame:
         center_x = WINDOW_WIDTH // 2
         center_y = 200
 
-        particles_to_add = []
-        for _ in range(50):
-            color = random.choice(
-                [COLORS["electric_cyan"], COLORS["neon_purple"], COLORS["gold"]]
-            )
-            particles_to_add.append(Particle(center_x, center_y, color, "burst"))
-        self._add_particles(particles_to_add)
+        burst_count = 50
 
         if (
             hasattr(self.state, "data_shards")
@@ -1342,27 +1337,24 @@ class BitByBitGame:
                     COLORS["gold"],
                 )
             )
-            particles_to_add = []
-            for _ in range(10):
-                particle_color = random.choice(
-                    [COLORS["electric_cyan"], COLORS["neon_purple"], COLORS["gold"]]
-                )
-                particles_to_add.append(
-                    Particle(center_x, center_y, particle_color, "burst")
-                )
-            self._add_particles(particles_to_add)
+            # Shards earned add 10 more particles to the same burst
+            burst_count += 10
+
+        self.particles.emit(
+            center_x, center_y,
+            (COLORS["electric_cyan"], COLORS["neon_purple"], COLORS["gold"]),
+            "burst", burst_count,
+        )
 
     def create_prestige_effect(self):
         center_x = WINDOW_WIDTH // 2
         center_y = 200
 
-        particles_to_add = []
-        for _ in range(150):
-            color = random.choice(
-                [COLORS["quantum_violet"], COLORS["gold"], COLORS["electric_cyan"], COLORS["neon_purple"]]
-            )
-            particles_to_add.append(Particle(center_x, center_y, color, "burst"))
-        self._add_particles(particles_to_add)
+        self.particles.emit(
+            center_x, center_y,
+            (COLORS["quantum_violet"], COLORS["gold"], COLORS["electric_cyan"], COLORS["neon_purple"]),
+            "burst", 150,
+        )
 
         currency_earned = self.state.get_prestige_currency_earned()
         self.floating_texts.append(
@@ -1391,9 +1383,7 @@ class BitByBitGame:
         center_x = WINDOW_WIDTH // 2
         center_y = 200
 
-        for _ in range(30):
-            color = COLORS["gold"]
-            self.particles.append(Particle(center_x, center_y, color, "burst"))
+        self.particles.emit(center_x, center_y, (COLORS["gold"],), "burst", 30)
 
         self.floating_texts.append(
             FloatingText(
@@ -1408,18 +1398,16 @@ class BitByBitGame:
         center_x = self.current_width // 2
         center_y = int(250 * (self.current_height / self.base_height))
 
-        particles_to_add = []
-        for _ in range(100):
-            color = random.choice(
-                [
-                    COLORS["electric_cyan"],
-                    COLORS["neon_purple"],
-                    COLORS["gold"],
-                    COLORS["signal_orange"],
-                ]
-            )
-            particles_to_add.append(Particle(center_x, center_y, color, "burst"))
-        self._add_particles(particles_to_add)
+        self.particles.emit(
+            center_x, center_y,
+            (
+                COLORS["electric_cyan"],
+                COLORS["neon_purple"],
+                COLORS["gold"],
+                COLORS["signal_orange"],
+            ),
+            "burst", 100,
+        )
 
         from constants import HARDWARE_GENERATIONS
         current_gen = HARDWARE_GENERATIONS[self.state.hardware_generation]
@@ -1462,10 +1450,15 @@ class BitByBitGame:
             self.state.has_seen_tutorial = True
             center_x = WINDOW_WIDTH // 2
             center_y = 250
-            color = COLORS["matrix_green"]
-            self.particles.append(Particle(center_x, center_y, color, "burst"))
+            self.particles.emit(center_x, center_y, (COLORS["matrix_green"],), "burst")
+
+    def save_game(self, background=False):
+        """Snapshot the state and write it to the save file.
 
-    def save_game(self):
+        Encoding always happens here so the snapshot is consistent; with
+        background=True the file write runs on a daemon thread so autosave
+        does not stall the frame.
+        """
         save_data = {
             "version": "1.1.0",
             "timestamp": pygame.time.get_ticks(),
@@ -1476,7 +1469,7 @@ class BitByBitGame:
                 "start_time": self.state.start_time,
                 "total_play_time": self.state.total_play_time,
                 "generators": self.state.generators,
-                "unlocked_generators": self.state.unlocked_generators,
+                "unlocked_generators": sorted(self.state.unlocked_generators),
                 "upgrades": self.state.upgrades,
                 "tutorial_step": self.state.tutorial_step,
                 "has_seen_tutorial": self.state.has_seen_tutorial,
@@ -1501,6 +1494,30 @@ class BitByBitGame:
             },
         }
 
+        try:
+            payload = json.dumps(save_data, separators=(",", ":"))
+        except Exception as e:
+            error_msg = f"Failed to save game: {e}"
+            print(error_msg)
+            self.last_save_error = error_msg
+            self.save_success_message = None
+            return
+
+        writer_busy = self._save_thread is not None and self._save_thread.is_alive()
+        if background:
+            if writer_busy:
+                # Leave unsaved_changes set so the next autosave retries
+                return
+            self.state.unsaved_changes = False
+            self._save_thread = threading.Thread(target=self._write_save, args=(payload,), daemon=True)
+            self._save_thread.start()
+        else:
+            if writer_busy:
+                self._save_thread.join()
+            self.state.unsaved_changes = False
+            self._write_save(payload)
+
+    def _write_save(self, payload):
         save_file = CONFIG["SAVE_FILE"]
         backup_file = save_file + ".backup"
         temp_file = save_file + ".tmp"
@@ -1508,16 +1525,14 @@ class BitByBitGame:
         try:
             # Write to temp file first
             with open(temp_file, "w") as f:
-                json.dump(save_data, f, indent=2)
+                f.write(payload)
             
             # If there's an existing save, back it up
             if os.path.exists(save_file):
-                if os.path.exists(backup_file):
-                    os.remove(backup_file)
-                os.rename(save_file, backup_file)
+                os.replace(save_file, backup_file)
             
-            # Rename temp to actual save
-            os.rename(temp_file, save_file)
+            # Atomically move temp over the actual save
+            os.replace(temp_file, save_file)
             
             self.state.last_save_time = pygame.time.get_ticks()
             self.last_save_error = None
@@ -1532,6 +1547,7 @@ class BitByBitGame:
                     pass
             error_msg = f"Failed to save game: {e}"
             print(error_msg)
+            self.state.unsaved_changes = True
             self.last_save_error = error_msg
             self.save_success_message = None
 
@@ -1590,7 +1606,7 @@ class BitByBitGame:
                 self.state.data_shard_upgrades = state_data.get("data_shard_upgrades", {})
             
             self.state.generators = state_data.get("generators", self.state.generators)
-            self.state.unlocked_generators = state_data.get("unlocked_generators", ["rng"])
+            self.state.unlocked_generators = set(state_data.get("unlocked_generators", ["rng"]))
             self.state.upgrades = state_data.get("upgrades", self.state.upgrades)
             self.state.tutorial_step = state_data.get("tutorial_step", 0)
             self.state.has_seen_tutorial = state_data.get("has_seen_tutorial", False)
@@ -1604,6 +1620,7 @@ class BitByBitGame:
                 for gen_id in CONFIG["HARDWARE_GENERATORS"]:
                     if gen_id not in self.state.generators:
                         self.state.generators[gen_id] = {"count": 0, "total_bought": 0}
+            self.state.invalidate_production_rate()
             
             for upgrade_id in CONFIG["UPGRADES"]:
                 if upgrade_id not in self.state.upgrades:
@@ -1618,11 +1635,10 @@ class BitByBitGame:
                 offline_time = min(
                     (pygame.time.get_ticks() - save_data["timestamp"]) / 1000, 86400
                 )
-                offline_production = (
-                    self.state.get_production_rate() * offline_time * 0.75
-                )
-
-                if offline_production > 0:
+                # A non-positive gap (e.g. clock skew) earns nothing; skip the rate lookup
+                production_rate = self.state.get_production_rate() if offline_time > 0 else 0
+                if production_rate > 0:
+                    offline_production = production_rate * offline_time * 0.75
                     self.state.bits += offline_production
                     self.state.total_bits_earned += offline_production
                     print(f"Offline progress: {self.format_number(offline_production)} bits")
@@ -1654,6 +1670,7 @@ class BitByBitGame:
                 self.state.generators = state_data.get("generators", {})
                 self.state.upgrades = state_data.get("upgrades", {})
                 self.state.hardware_generation = state_data.get("hardware_generation", 0)
+                self.state.invalidate_production_rate()
                 self.last_load_error = "Restored from backup"
                 print("Restored game from backup")
             except Exception as e:
@@ -1712,6 +1729,11 @@ class BitByBitGame:
 
             self.handle_events()
             self.update(dt)
+
+            # Minimized/hidden window: keep simulating but render nothing
+            if not pygame.display.get_active():
+                continue
+
             self.draw()
 
             pygame.display.flip()
@@ -5,7 +5,9 @@ Accumulator drawing functions
 import pygame
 import math
 import random
+from functools import lru_cache
 from constants import COLORS, CONFIG, FPS, format_number, ERAS
+from ui_components import get_font, render_glow_text, render_text
 
 
 class AccumulatorDisplayState:
@@ -18,6 +20,10 @@ class AccumulatorDisplayState:
 
 _accumulator_state = AccumulatorDisplayState()
 
+# ((dx, dy), alpha) glow copies behind the compression-era headline texts
+_BITS_GLOW_LAYERS = (((3, 3), 20), ((2, 2), 40), ((1, 1), 60), ((-1, -1), 50), ((-2, -2), 30))
+_RATE_GLOW_LAYERS = (((2, 2), 30), ((-1, -1), 60))
+
 
 def draw_accumulator(screen, state, bit_grid, compression_panel, compression_meter,
                      token_display, compression_progress, current_width, current_height,
@@ -90,30 +96,22 @@ def draw_compression_accumulator(screen, state, compression_panel, compression_m
     
     bits_y = int(320 * scale_y)
     bits_str = f"{format_number(int(display_state.display_compressed_bits))} COMPRESSED BITS"
-    bits_text = monospace_font.render(bits_str, True, COLORS["neon_purple"])
-    bits_rect = bits_text.get_rect(center=(center_x, bits_y))
-
-    for offset, alpha in [((3, 3), 20), ((2, 2), 40), ((1, 1), 60), ((-1, -1), 50), ((-2, -2), 30)]:
-        glow_pos = (bits_rect.x + offset[0], bits_rect.y + offset[1])
-        glow_surface = bits_text.copy()
-        glow_surface.set_alpha(alpha)
-        screen.blit(glow_surface, glow_pos)
-
-    screen.blit(bits_text, bits_rect)
+    bits_surface, bits_text_rect = render_glow_text(
+        monospace_font, bits_str, COLORS["neon_purple"], _BITS_GLOW_LAYERS
+    )
+    bits_rect = bits_text_rect.copy()
+    bits_rect.center = (center_x, bits_y)
+    screen.blit(bits_surface, bits_rect.move(-bits_text_rect.x, -bits_text_rect.y))
 
     rate_y = int(350 * scale_y)
     efficiency = getattr(state, 'efficiency', 1.0) * 100
     rate_str = f"+{format_number(int(display_state.display_rate))} cb/s @ {efficiency:.1f}% efficiency"
-    rate_text = medium_font.render(rate_str, True, COLORS["electric_cyan"])
-    rate_rect = rate_text.get_rect(center=(center_x, rate_y))
-
-    for offset, alpha in [((2, 2), 30), ((-1, -1), 60)]:
-        glow_pos = (rate_rect.x + offset[0], rate_rect.y + offset[1])
-        glow_surface = rate_text.copy()
-        glow_surface.set_alpha(alpha)
-        screen.blit(glow_surface, glow_pos)
-
-    screen.blit(rate_text, rate_rect)
+    rate_surface, rate_text_rect = render_glow_text(
+        medium_font, rate_str, COLORS["electric_cyan"], _RATE_GLOW_LAYERS
+    )
+    rate_rect = rate_text_rect.copy()
+    rate_rect.center = (center_x, rate_y)
+    screen.blit(rate_surface, rate_rect.move(-rate_text_rect.x, -rate_text_rect.y))
 
 
 def draw_standard_accumulator(screen, state, bit_grid, current_width, current_height,
@@ -160,7 +158,7 @@ def draw_standard_accumulator(screen, state, bit_grid, current_width, current_he
     pygame.draw.rect(screen, (5, 8, 18), acc_rect, border_radius=8)
 
     # ===== TITLE =====
-    title_text = small_font.render("◈ MOTHERBOARD ◈", True, COLORS["muted_blue"])
+    title_text = render_text(small_font, "◈ MOTHERBOARD ◈", COLORS["muted_blue"])
     title_rect = title_text.get_rect(center=(cx, acc_y + int(20 * scale_y)))
     screen.blit(title_text, title_rect)
 
@@ -191,7 +189,7 @@ def draw_standard_accumulator(screen, state, bit_grid, current_width, current_he
         pygame.draw.rect(screen, bar_color, (bar_x, bar_y, fill_w, bar_h), border_radius=3)
     
     # Progress text
-    pct_text = small_font.render(f"REBIRTH PROGRESS: {bit_percent:.1f}%", True, COLORS["muted_blue"])
+    pct_text = render_text(small_font, f"REBIRTH PROGRESS: {bit_percent:.1f}%", COLORS["muted_blue"])
     pct_rect = pct_text.get_rect(center=(cx, bar_y - 12))
     screen.blit(pct_text, pct_rect)
 
@@ -201,7 +199,7 @@ def _draw_binary_stream(screen, x, y_start, char_height, COLORS):
     time_ms = pygame.time.get_ticks()
     
     num_digits = 8
-    binary_font = pygame.font.Font(None, 18)
+    binary_font = get_font(18)
     
     for i in range(num_digits):
         offset = (time_ms // 300 + i * 50) % 300
@@ -276,15 +274,15 @@ def draw_data_shard_upgrades(screen, state, panel_rect, small_font, medium_font,
         pygame.draw.rect(screen, border_color, card.rect, 2, border_radius=8)
         
         icon = upgrade.get("icon", "💎")
-        icon_surface = medium_font.render(icon, True, COLORS["soft_white"])
+        icon_surface = render_text(medium_font, icon, COLORS["soft_white"])
         screen.blit(icon_surface, (card.rect.x + 8, card.rect.y + 5))
         
         name = upgrade.get("name", upgrade_id)
-        name_surface = small_font.render(name, True, COLORS["soft_white"])
+        name_surface = render_text(small_font, name, COLORS["soft_white"])
         screen.blit(name_surface, (card.rect.x + 35, card.rect.y + 5))
         
         level_text = f"{current_level}/{max_level}"
-        level_surface = small_font.render(level_text, True, COLORS["muted_blue"])
+        level_surface = render_text(small_font, level_text, COLORS["muted_blue"])
         screen.blit(level_surface, (card.rect.x + 35, card.rect.y + 22))
         
         effect_type = upgrade.get("effect_type", "")
@@ -297,17 +295,17 @@ def draw_data_shard_upgrades(screen, state, panel_rect, small_font, medium_font,
                 bonus_text = f"+{bonus}%"
             else:
                 bonus_text = f"+{bonus}"
-            bonus_surface = small_font.render(bonus_text, True, COLORS["matrix_green"])
+            bonus_surface = render_text(small_font, bonus_text, COLORS["matrix_green"])
             screen.blit(bonus_surface, (card.rect.x + 8, card.rect.y + 45))
         
         if is_maxed:
             max_text = "MAX"
-            max_surface = small_font.render(max_text, True, COLORS["matrix_green"])
+            max_surface = render_text(small_font, max_text, COLORS["matrix_green"])
             screen.blit(max_surface, (card.rect.x + card_width - 35, card.rect.y + card_height - 18))
         elif cost is not None:
             cost_text = f"💎{cost}"
             cost_color = COLORS["gold"] if can_afford else COLORS["signal_orange"]
-            cost_surface = small_font.render(cost_text, True, cost_color)
+            cost_surface = render_text(small_font, cost_text, cost_color)
             screen.blit(cost_surface, (card.rect.x + card_width - 50, card.rect.y + card_height - 18))
     
     return cards
@@ -318,6 +316,21 @@ def draw_data_shard_upgrades(screen, state, panel_rect, small_font, medium_font,
 # Abacus Era and Mechanical Era visual rendering
 # =============================================================================
 
+@lru_cache(maxsize=2)
+def _get_abacus_frame(acc_width, acc_height):
+    """Wooden abacus frame with its grain lines, drawn once per size"""
+    frame = pygame.Surface((acc_width, acc_height), pygame.SRCALPHA)
+    frame_color = (101, 67, 33)  # Dark wood
+    pygame.draw.rect(frame, frame_color, (0, 0, acc_width, acc_height), border_radius=8)
+    
+    # Wood grain lines
+    for i in range(0, acc_height, 8):
+        pygame.draw.line(frame, (90, 55, 25), (0, i), (acc_width, i), 1)
+    
+    pygame.draw.rect(frame, (70, 45, 20), (0, 0, acc_width, acc_height), 4, border_radius=8)
+    return frame
+
+
 def draw_abacus_accumulator(screen, state, current_width, current_height,
                            base_width, base_height, monospace_font, medium_font, small_font, COLORS, display_state):
     """Draw abacus-style accumulator for Era 0"""
@@ -338,17 +351,10 @@ def draw_abacus_accumulator(screen, state, current_width, current_height,
     cx = acc_x + acc_width // 2
     
     # Draw wooden frame background with wood grain effect
-    frame_color = (101, 67, 33)  # Dark wood
-    pygame.draw.rect(screen, frame_color, (acc_x, acc_y, acc_width, acc_height), border_radius=8)
-    
-    # Wood grain lines
-    for i in range(0, acc_height, 8):
-        pygame.draw.line(screen, (90, 55, 25), (acc_x, acc_y + i), (acc_x + acc_width, acc_y + i), 1)
-    
-    pygame.draw.rect(screen, (70, 45, 20), (acc_x, acc_y, acc_width, acc_height), 4, border_radius=8)
+    screen.blit(_get_abacus_frame(acc_width, acc_height), (acc_x, acc_y))
     
     # Title - "ABACUS" with nicer styling
-    title_surf = small_font.render("◈ ABACUS ◈", True, (210, 180, 140))
+    title_surf = render_text(small_font, "◈ ABACUS ◈", (210, 180, 140))
     title_rect = title_surf.get_rect(center=(cx, acc_y + int(25 * scale_y)))
     screen.blit(title_surf, title_rect)
     
@@ -430,13 +436,13 @@ def draw_abacus_accumulator(screen, state, current_width, current_height,
     # Click instruction with pulsing effect
     pulse = (math.sin(pygame.time.get_ticks() / 300.0) + 1) / 2  # 0 to 1
     click_color = (150 + int(pulse * 50), 120 + int(pulse * 30), 70)
-    click_text = small_font.render("[ CLICK ABACUS TO ADD PEBBLES ]", True, click_color)
+    click_text = render_text(small_font, "[ CLICK ABACUS TO ADD PEBBLES ]", click_color)
     click_rect = click_text.get_rect(center=(cx, acc_y + acc_height - int(25 * scale_y)))
     screen.blit(click_text, click_rect)
     
     # Show pebbles count with nice formatting
     pebble_count = getattr(state, 'pebbles', state.bits)
-    currency_text = monospace_font.render(f"{format_number(pebble_count)}", True, (60, 40, 15))
+    currency_text = render_text(monospace_font, f"{format_number(pebble_count)}", (60, 40, 15))
     currency_rect = currency_text.get_rect(center=(cx, acc_y + int(42 * scale_y)))
     
     # Currency background
@@ -449,13 +455,13 @@ def draw_abacus_accumulator(screen, state, current_width, current_height,
     screen.blit(currency_text, currency_rect)
     
     # Currency label
-    label_text = small_font.render("pebbles", True, (100, 80, 50))
+    label_text = render_text(small_font, "pebbles", (100, 80, 50))
     label_rect = label_text.get_rect(center=(cx, currency_rect.y + currency_rect.height + 12))
     screen.blit(label_text, label_rect)
     
     # Show production rate
     rate = state.get_production_rate()
-    rate_text = small_font.render(f"+{format_number(int(rate))} / sec", True, (120, 100, 60))
+    rate_text = render_text(small_font, f"+{format_number(int(rate))} / sec", (120, 100, 60))
     rate_rect = rate_text.get_rect(center=(cx, acc_y + acc_height - int(50 * scale_y)))
     screen.blit(rate_text, rate_rect)
     
@@ -466,6 +472,7 @@ def draw_abacus_accumulator(screen, state, current_width, current_height,
 def draw_mechanical_accumulator(screen, state, current_width, current_height,
                                 base_width, base_height, monospace_font, medium_font, small_font, COLORS, display_state):
     """Draw mechanical gear-style accumulator for Era 1"""
+    time_ms = pygame.time.get_ticks()
     
     scale_x = current_width / base_width
     scale_y = current_height / base_height
@@ -496,7 +503,7 @@ def draw_mechanical_accumulator(screen, state, current_width, current_height,
     pygame.draw.rect(screen, (140, 130, 100), (acc_x, acc_y, acc_width, acc_height), 4, border_radius=8)
     
     # Title
-    title_text = small_font.render("◈ MECHANICAL COMPUTER ◈", True, (218, 165, 32))
+    title_text = render_text(small_font, "◈ MECHANICAL COMPUTER ◈", (218, 165, 32))
     title_rect = title_text.get_rect(center=(cx, acc_y + int(25 * scale_y)))
     screen.blit(title_text, title_rect)
     
@@ -520,7 +527,7 @@ def draw_mechanical_accumulator(screen, state, current_width, current_height,
     ]
     
     production = state.get_production_rate()
-    rotation_offset = (pygame.time.get_ticks() / 1000.0) * (1 + production / 500)
+    rotation_offset = (time_ms / 1000.0) * (1 + production / 500)
     
     for gear in gears:
         gx = inner_x + gear["x"] * inner_w
@@ -559,7 +566,7 @@ def draw_mechanical_accumulator(screen, state, current_width, current_height,
     pygame.draw.rect(screen, (120, 110, 80), (lever_x - lever_base_w//2, lever_y, lever_base_w, lever_base_h), 2, border_radius=4)
     
     # Lever arm (animated)
-    lever_offset = math.sin(pygame.time.get_ticks() / 150.0) * 8
+    lever_offset = math.sin(time_ms / 150.0) * 8
     pygame.draw.line(screen, (100, 95, 70), (lever_x, lever_y + 10), 
                     (lever_x + lever_offset, lever_y - 15), 8)
     pygame.draw.line(screen, (150, 140, 100), (lever_x, lever_y + 10), 
@@ -580,30 +587,30 @@ def draw_mechanical_accumulator(screen, state, current_width, current_height,
     pygame.draw.rect(screen, (30, 28, 25), (curr_bg_x, curr_bg_y, curr_bg_w, curr_bg_h), border_radius=6)
     pygame.draw.rect(screen, (218, 165, 32), (curr_bg_x, curr_bg_y, curr_bg_w, curr_bg_h), 2, border_radius=6)
     
-    currency_text = monospace_font.render(f"{format_number(ticks_count)}", True, (218, 165, 32))
+    currency_text = render_text(monospace_font, f"{format_number(ticks_count)}", (218, 165, 32))
     currency_rect = currency_text.get_rect(center=(cx, curr_bg_y + curr_bg_h // 2))
     screen.blit(currency_text, currency_rect)
     
     # Label
-    label_text = small_font.render("ticks", True, (150, 130, 80))
+    label_text = render_text(small_font, "ticks", (150, 130, 80))
     label_rect = label_text.get_rect(center=(cx, curr_bg_y + curr_bg_h + 12))
     screen.blit(label_text, label_rect)
     
     # Production rate
-    rate_text = small_font.render(f"+{format_number(int(production))} ticks/sec", True, (140, 120, 70))
+    rate_text = render_text(small_font, f"+{format_number(int(production))} ticks/sec", (140, 120, 70))
     rate_rect = rate_text.get_rect(center=(cx, acc_y + acc_height - int(25 * scale_y)))
     screen.blit(rate_text, rate_rect)
     
     # Click instruction
-    pulse = (math.sin(pygame.time.get_ticks() / 300.0) + 1) / 2
+    pulse = (math.sin(time_ms / 300.0) + 1) / 2
     click_color = (180 + int(pulse * 40), 150 + int(pulse * 30), 80)
-    click_text = small_font.render("[ CLICK TO CRANK THE MACHINE ]", True, click_color)
+    click_text = render_text(small_font, "[ CLICK TO CRANK THE MACHINE ]", click_color)
     click_rect = click_text.get_rect(center=(cx, acc_y + acc_height - int(45 * scale_y)))
     screen.blit(click_text, click_rect)
     
     # Store clickable area
     state._abacus_click_area = pygame.Rect(inner_x, inner_y, inner_w, inner_h)
     
-    rate_text = small_font.render(f"+{format_number(int(production))} ticks/sec", True, (180, 150, 100))
+    rate_text = render_text(small_font, f"+{format_number(int(production))} ticks/sec", (180, 150, 100))
     rate_rect = rate_text.get_rect(center=(cx, acc_y + acc_height - int(25 * scale_y)))
     screen.blit(rate_text, rate_rect)
@@ -2,8 +2,11 @@
 Card drawing functions for generators and upgrades
 """
 
+from functools import lru_cache
+
 import pygame
 from constants import COLORS, format_number
+from ui_components import get_font, render_text
 
 UI_ARROW_DOWN = "▼"
 UI_ARROW_RIGHT = "▶"
@@ -17,8 +20,16 @@ except:
     UI_ARROW_RIGHT = ">"
 
 
-def draw_panel_toggle(screen, button, is_open, small_font):
-    """Draw panel toggle button with clear visual affordances"""
+TOGGLE_GLOW_MARGIN = 6
+
+
+@lru_cache(maxsize=16)
+def _get_panel_toggle_surface(width, height, is_open, title_text, small_font):
+    """Pre-render a panel toggle (glow, body, border, arrow and title) for one state.
+
+    The surface is TOGGLE_GLOW_MARGIN pixels larger than the button on every side
+    so the open-state glow fits.
+    """
     if is_open:
         bg_color = (60, 70, 95)
         border_color = COLORS["electric_cyan"]
@@ -28,17 +39,19 @@ def draw_panel_toggle(screen, button, is_open, small_font):
         border_color = (80, 90, 120)
         text_color = (160, 170, 200)
 
-    pygame.draw.rect(screen, bg_color, button.rect, border_radius=10)
-    
-    # Draw subtle gradient overlay for depth
-    gradient_rect = button.rect.inflate(-4, -4)
-    overlay_color = (*bg_color, 40)
-    pygame.draw.rect(screen, (*bg_color, 30), gradient_rect, 1, border_radius=8)
+    m = TOGGLE_GLOW_MARGIN
+    surface = pygame.Surface((width + m * 2, height + m * 2), pygame.SRCALPHA)
+    rect = pygame.Rect(m, m, width, height)
 
-    glow_intensity = 60 if is_open else 20
+    body_color = bg_color
     if is_open:
+        # Layers share one colour, so starting from it at zero alpha makes the
+        # blits accumulate coverage only
+        surface.fill((*border_color, 0))
+        glow_intensity = 60
+        remaining = 1.0
         for i in range(3):
-            glow_rect = button.rect.inflate(6 + i * 3, 6 + i * 3)
+            glow_rect = rect.inflate(6 + i * 3, 6 + i * 3)
             glow_alpha = glow_intensity - i * 15
             glow_surf = pygame.Surface(
                 (glow_rect.width, glow_rect.height), pygame.SRCALPHA
@@ -49,19 +62,25 @@ def draw_panel_toggle(screen, button, is_open, small_font):
                 (0, 0, glow_rect.width, glow_rect.height),
                 border_radius=10 + i * 2,
             )
-            screen.blit(glow_surf, glow_rect.topleft)
+            surface.blit(glow_surf, glow_rect.topleft)
+            remaining *= 1 - glow_alpha / 255
+        # The glow also tints the body it was drawn over
+        body_color = tuple(
+            int(b * remaining + g * (1 - remaining)) for b, g in zip(bg_color, border_color)
+        )
 
-    pygame.draw.rect(screen, border_color, button.rect, 2, border_radius=10)
+    pygame.draw.rect(surface, body_color, rect, border_radius=10)
+    pygame.draw.rect(surface, border_color, rect, 2, border_radius=10)
 
     # Draw arrow indicator
-    arrow_x = button.rect.x + 15
-    arrow_y = button.rect.centery
+    arrow_x = rect.x + 15
+    arrow_y = rect.centery
     arrow_size = 5
-    
+
     if is_open:
         # Down arrow
         pygame.draw.polygon(
-            screen, text_color,
+            surface, text_color,
             [(arrow_x, arrow_y - arrow_size),
              (arrow_x + arrow_size * 1.5, arrow_y + arrow_size),
              (arrow_x - arrow_size * 1.5, arrow_y + arrow_size)]
@@ -69,22 +88,28 @@ def draw_panel_toggle(screen, button, is_open, small_font):
     else:
         # Right arrow
         pygame.draw.polygon(
-            screen, text_color,
+            surface, text_color,
             [(arrow_x - arrow_size, arrow_y - arrow_size * 1.5),
              (arrow_x + arrow_size, arrow_y),
              (arrow_x - arrow_size, arrow_y + arrow_size * 1.5)]
         )
 
-    # Draw panel title text
+    text_surface = render_text(small_font, title_text, text_color)
+    text_rect = text_surface.get_rect(center=(rect.centerx + 5, rect.centery))
+    surface.blit(text_surface, text_rect)
+    return surface
+
+
+def draw_panel_toggle(screen, button, is_open, small_font):
+    """Draw panel toggle button with clear visual affordances"""
     # Extract the arrow indicator and title
     title_text = button.text
     if title_text.startswith(UI_ARROW_DOWN) or title_text.startswith(UI_ARROW_RIGHT):
         title_text = title_text[1:].strip()
-    text_surface = small_font.render(title_text, True, text_color)
-    text_rect = text_surface.get_rect(
-        center=(button.rect.centerx + 5, button.rect.centery)
+    surface = _get_panel_toggle_surface(
+        button.rect.width, button.rect.height, is_open, title_text, small_font
     )
-    screen.blit(text_surface, text_rect)
+    screen.blit(surface, (button.rect.x - TOGGLE_GLOW_MARGIN, button.rect.y - TOGGLE_GLOW_MARGIN))
 
 
 def draw_panel_with_integrated_title(screen, panel, title_color=None, medium_font=None, tiny_font=None):
@@ -125,12 +150,12 @@ def draw_panel_with_integrated_title(screen, panel, title_color=None, medium_fon
     )
 
     if medium_font:
-        title_surface = medium_font.render(panel.title, True, title_color)
+        title_surface = render_text(medium_font, panel.title, title_color)
         title_text_rect = title_surface.get_rect(
             center=(panel.rect.centerx, panel.rect.y + title_bar_height // 2)
         )
         
-        shadow_surface = medium_font.render(panel.title, True, (0, 0, 0))
+        shadow_surface = render_text(medium_font, panel.title, (0, 0, 0))
         shadow_rect = title_text_rect.copy()
         shadow_rect.x += 1
         shadow_rect.y += 1
@@ -239,6 +264,53 @@ def draw_scrollbar(screen, panel, mouse_pos=None):
     )
 
 
+CARD_GLOW_MARGIN = 3
+
+
+@lru_cache(maxsize=32)
+def _get_card_chrome(width, height, bg_color, border_color, accent_color, glow, icon_box_size):
+    """Pre-render a card's static chrome: background, glow, border, accent bar and icon box.
+
+    The surface is CARD_GLOW_MARGIN pixels larger than the card on every side so
+    the affordable glow fits; blit it at (x - CARD_GLOW_MARGIN, y - CARD_GLOW_MARGIN).
+    """
+    m = CARD_GLOW_MARGIN
+    surface = pygame.Surface((width + m * 2, height + m * 2), pygame.SRCALPHA)
+    card_rect = pygame.Rect(m, m, width, height)
+
+    if glow:
+        # Drawn first straight into the transparent surface, then the card body
+        # is painted with the glow already blended in so alpha is applied once.
+        pygame.draw.rect(surface, (*border_color, 25), surface.get_rect(), border_radius=10)
+        body_color = tuple(
+            (b * (255 - 25) + g * 25) // 255 for b, g in zip(bg_color, border_color)
+        )
+    else:
+        body_color = bg_color
+
+    pygame.draw.rect(surface, body_color, card_rect, border_radius=8)
+    pygame.draw.rect(surface, border_color, card_rect, 2, border_radius=8)
+
+    accent_rect = pygame.Rect(m, m, 5, height)
+    pygame.draw.rect(surface, accent_color, accent_rect, border_top_left_radius=8, border_bottom_left_radius=8)
+
+    icon_box = pygame.Rect(m + 12, m + (height - icon_box_size) // 2, icon_box_size, icon_box_size)
+    icon_bg_color = tuple(max(0, c - 15) for c in bg_color)
+    pygame.draw.rect(surface, icon_bg_color, icon_box, border_radius=6)
+    pygame.draw.rect(surface, accent_color, icon_box, 1, border_radius=6)
+    return surface
+
+
+def is_generator_card_locked(gen_id, state, config):
+    """Whether a generator card should be drawn in its locked style"""
+    if gen_id in config["GENERATORS"]:
+        return not state.is_generator_unlocked(gen_id)
+    if gen_id in config.get("HARDWARE_GENERATORS", {}):
+        generator_cfg = config["HARDWARE_GENERATORS"][gen_id]
+        return not state.is_hardware_category_unlocked(generator_cfg.get("category", ""))
+    return False
+
+
 def draw_generator_card(
     screen,
     x,
@@ -259,16 +331,8 @@ def draw_generator_card(
     tiny_font,
 ):
     """Draw individual generator card - clean, scannable design with integrated buttons"""
-    card_rect = pygame.Rect(x, y, width, height)
 
-    is_locked = False
-    if gen_id in config["GENERATORS"]:
-        if not state.is_generator_unlocked(gen_id):
-            is_locked = True
-    elif gen_id in config.get("HARDWARE_GENERATORS", {}):
-        generator_cfg = config["HARDWARE_GENERATORS"][gen_id]
-        if not state.is_hardware_category_unlocked(generator_cfg.get("category", "")):
-            is_locked = True
+    is_locked = is_generator_card_locked(gen_id, state, config)
 
     if is_locked:
         bg_color = (18, 20, 28)
@@ -292,33 +356,12 @@ def draw_generator_card(
         cost_color = (90, 100, 120)
         accent_color = (45, 55, 70)
 
-    # Draw card background with rounded corners
-    pygame.draw.rect(screen, bg_color, card_rect, border_radius=8)
-
-    # Draw subtle glow for affordable cards
-    if can_afford_x1:
-        glow_rect = card_rect.inflate(6, 6)
-        glow_surf = pygame.Surface((glow_rect.width, glow_rect.height), pygame.SRCALPHA)
-        pygame.draw.rect(glow_surf, (*border_color, 25), (0, 0, glow_rect.width, glow_rect.height), border_radius=10)
-        screen.blit(glow_surf, glow_rect.topleft)
+    # Card background, glow, border, accent bar and icon box come from a cached template
+    chrome = _get_card_chrome(width, height, bg_color, border_color, accent_color, bool(can_afford_x1), 50)
+    screen.blit(chrome, (x - CARD_GLOW_MARGIN, y - CARD_GLOW_MARGIN))
 
-    # Draw card border
-    pygame.draw.rect(screen, border_color, card_rect, 2, border_radius=8)
-
-    # Draw left accent bar (replaces the thin line)
-    accent_rect = pygame.Rect(x, y, 5, height)
-    pygame.draw.rect(screen, accent_color, accent_rect, border_top_left_radius=8, border_bottom_left_radius=8)
-
-    # Draw icon in dedicated square area
     icon_box_size = 50
-    icon_box_x = x + 12
-    icon_box_y = y + (height - icon_box_size) // 2
-    icon_box = pygame.Rect(icon_box_x, icon_box_y, icon_box_size, icon_box_size)
-    
-    # Icon background
-    icon_bg_color = tuple(max(0, c - 15) for c in bg_color)
-    pygame.draw.rect(screen, icon_bg_color, icon_box, border_radius=6)
-    pygame.draw.rect(screen, accent_color, icon_box, 1, border_radius=6)
+    icon_box = pygame.Rect(x + 12, y + (height - icon_box_size) // 2, icon_box_size, icon_box_size)
     
     icon_text = generator.get("icon", "🎲")
     if is_locked:
@@ -329,8 +372,8 @@ def draw_generator_card(
         icon_fg_color = (80, 90, 110)
     
     try:
-        icon_font = pygame.font.SysFont("segoe ui emoji", 36)
-        icon_surface = icon_font.render(icon_text, True, icon_fg_color)
+        icon_font = get_font(36, "segoe ui emoji")
+        icon_surface = render_text(icon_font, icon_text, icon_fg_color)
         icon_rect = icon_surface.get_rect(center=icon_box.center)
         screen.blit(icon_surface, icon_rect)
     except (pygame.error, UnicodeEncodeError):
@@ -341,30 +384,30 @@ def draw_generator_card(
     text_x = x + 75
     
     # Generator name
-    name_text = medium_font.render(generator["name"], True, name_color)
+    name_text = render_text(medium_font, generator["name"], name_color)
     screen.blit(name_text, (text_x, y + 8))
     
     # Production info line
     if production > 0:
-        qty_prod_text = small_font.render(
-            f"{count} owned  →  +{format_number(production)}/s",
-            True, info_color
+        qty_prod_text = render_text(
+            small_font,
+            f"{count} owned  →  +{format_number(production)}/s", info_color
         )
     else:
-        qty_prod_text = small_font.render(f"{count} owned", True, info_color)
+        qty_prod_text = render_text(small_font, f"{count} owned", info_color)
     screen.blit(qty_prod_text, (text_x, y + 28))
 
     # Flavor text (if exists)
     flavor = generator.get("flavor", "")
     if flavor:
-        flavor_text = tiny_font.render(flavor[:35] + ("..." if len(flavor) > 35 else ""), True, (60, 65, 80))
+        flavor_text = render_text(tiny_font, flavor[:35] + ("..." if len(flavor) > 35 else ""), (60, 65, 80))
         screen.blit(flavor_text, (text_x, y + 46))
 
     # Cost display (in the cost_color area, top right)
     cost_str = format_number(cost)
-    cost_label = tiny_font.render("COST:", True, cost_color)
+    cost_label = render_text(tiny_font, "COST:", cost_color)
     screen.blit(cost_label, (x + width - 105, y + 8))
-    cost_text = small_font.render(cost_str, True, cost_color)
+    cost_text = render_text(small_font, cost_str, cost_color)
     screen.blit(cost_text, (x + width - 105, y + 22))
 
     if is_locked:
@@ -374,7 +417,7 @@ def draw_generator_card(
         else:
             category = generator.get("category", "")
             req_text = f"Requires {category.upper()}" if category else "Locked"
-        locked_text = small_font.render(req_text, True, (55, 60, 75))
+        locked_text = render_text(small_font, req_text, (55, 60, 75))
         screen.blit(locked_text, (text_x, y + 62))
 
     # Integrated BUY buttons at bottom right of card
@@ -397,7 +440,7 @@ def draw_generator_card(
         btn1_rect = pygame.Rect(x + width - btn_width * 2 - btn_spacing * 2 - 8, btn_y, btn_width, btn_height)
         pygame.draw.rect(screen, x10_btn_color, btn1_rect, border_radius=4)
         pygame.draw.rect(screen, x10_btn_border, btn1_rect, 1, border_radius=4)
-        btn1_text = tiny_font.render("x10", True, x10_btn_text)
+        btn1_text = render_text(tiny_font, "x10", x10_btn_text)
         btn1_text_rect = btn1_text.get_rect(center=btn1_rect.center)
         screen.blit(btn1_text, btn1_text_rect)
 
@@ -414,7 +457,7 @@ def draw_generator_card(
         btn2_rect = pygame.Rect(x + width - btn_width - btn_spacing - 8, btn_y, btn_width, btn_height)
         pygame.draw.rect(screen, x1_btn_color, btn2_rect, border_radius=4)
         pygame.draw.rect(screen, x1_btn_border, btn2_rect, 1, border_radius=4)
-        btn2_text = tiny_font.render("x1", True, x1_btn_text)
+        btn2_text = render_text(tiny_font, "x1", x1_btn_text)
         btn2_text_rect = btn2_text.get_rect(center=btn2_rect.center)
         screen.blit(btn2_text, btn2_text_rect)
 
@@ -436,9 +479,12 @@ def draw_upgrade_card(
     tiny_font,
     COLORS,
     panel_rect=None,
+    mouse_pos=None,
 ):
-    """Draw individual upgrade card - clean, scannable design with integrated button"""
-    card_rect = pygame.Rect(x, y, width, height)
+    """Draw individual upgrade card - clean, scannable design with integrated button.
+
+    mouse_pos lets the caller sample the mouse once for a whole panel of cards.
+    """
 
     max_level = upgrade["max_level"]
     is_maxed = level >= max_level
@@ -465,33 +511,12 @@ def draw_upgrade_card(
         cost_color = (80, 70, 100)
         accent_color = (50, 40, 75)
 
-    # Draw card background with rounded corners
-    pygame.draw.rect(screen, bg_color, card_rect, border_radius=8)
+    # Card background, glow, border, accent bar and icon box come from a cached template
+    chrome = _get_card_chrome(width, height, bg_color, border_color, accent_color, bool(can_afford or is_maxed), 46)
+    screen.blit(chrome, (x - CARD_GLOW_MARGIN, y - CARD_GLOW_MARGIN))
 
-    # Draw subtle glow for affordable/maxed cards
-    if can_afford or is_maxed:
-        glow_rect = card_rect.inflate(6, 6)
-        glow_surf = pygame.Surface((glow_rect.width, glow_rect.height), pygame.SRCALPHA)
-        pygame.draw.rect(glow_surf, (*border_color, 25), (0, 0, glow_rect.width, glow_rect.height), border_radius=10)
-        screen.blit(glow_surf, glow_rect.topleft)
-
-    # Draw card border
-    pygame.draw.rect(screen, border_color, card_rect, 2, border_radius=8)
-
-    # Draw left accent bar
-    accent_rect = pygame.Rect(x, y, 5, height)
-    pygame.draw.rect(screen, accent_color, accent_rect, border_top_left_radius=8, border_bottom_left_radius=8)
-
-    # Draw icon in dedicated square area
     icon_box_size = 46
-    icon_box_x = x + 12
-    icon_box_y = y + (height - icon_box_size) // 2
-    icon_box = pygame.Rect(icon_box_x, icon_box_y, icon_box_size, icon_box_size)
-    
-    # Icon background
-    icon_bg_color = tuple(max(0, c - 15) for c in bg_color)
-    pygame.draw.rect(screen, icon_bg_color, icon_box, border_radius=6)
-    pygame.draw.rect(screen, accent_color, icon_box, 1, border_radius=6)
+    icon_box = pygame.Rect(x + 12, y + (height - icon_box_size) // 2, icon_box_size, icon_box_size)
     
     icon_text = upgrade.get("icon", "⚡")
     if is_maxed:
@@ -502,8 +527,8 @@ def draw_upgrade_card(
         icon_fg_color = (70, 60, 90)
     
     try:
-        icon_font = pygame.font.SysFont("segoe ui emoji", 32)
-        icon_surface = icon_font.render(icon_text, True, icon_fg_color)
+        icon_font = get_font(32, "segoe ui emoji")
+        icon_surface = render_text(icon_font, icon_text, icon_fg_color)
         icon_rect = icon_surface.get_rect(center=icon_box.center)
         screen.blit(icon_surface, icon_rect)
     except (pygame.error, UnicodeEncodeError):
@@ -513,17 +538,17 @@ def draw_upgrade_card(
     text_x = x + 70
     
     # Upgrade name
-    name_text = medium_font.render(upgrade["name"], True, name_color)
+    name_text = render_text(medium_font, upgrade["name"], name_color)
     screen.blit(name_text, (text_x, y + 6))
     
     # Level indicator
     level_color = COLORS["gold"] if is_maxed else COLORS["neon_purple"]
-    level_text = small_font.render(f"Lv {level}/{max_level}", True, level_color)
+    level_text = render_text(small_font, f"Lv {level}/{max_level}", level_color)
     screen.blit(level_text, (text_x, y + 24))
 
     # Effect description
     effect_text = upgrade.get("description", "Increases production")
-    desc_text = small_font.render(effect_text[:40] + ("..." if len(effect_text) > 40 else ""), True, info_color)
+    desc_text = render_text(small_font, effect_text[:40] + ("..." if len(effect_text) > 40 else ""), info_color)
     screen.blit(desc_text, (text_x, y + 42))
 
     # Progress bar
@@ -538,13 +563,13 @@ def draw_upgrade_card(
 
     # Cost and integrated BUY button area
     if is_maxed:
-        maxed_text = small_font.render("★ MAXED", True, COLORS["gold"])
+        maxed_text = render_text(small_font, "★ MAXED", COLORS["gold"])
         screen.blit(maxed_text, (x + width - 95, y + 50))
     else:
         cost_str = format_number(cost)
-        cost_label = tiny_font.render("COST:", True, cost_color)
+        cost_label = render_text(tiny_font, "COST:", cost_color)
         screen.blit(cost_label, (x + width - 110, y + 50))
-        cost_text = small_font.render(cost_str, True, cost_color)
+        cost_text = render_text(small_font, cost_str, cost_color)
         screen.blit(cost_text, (x + width - 110, y + 62))
 
         # Integrated BUY button
@@ -582,7 +607,8 @@ def draw_upgrade_card(
         btn.is_enabled = can_afford
         
         if panel_rect:
-            mouse_pos = pygame.mouse.get_pos()
+            if mouse_pos is None:
+                mouse_pos = pygame.mouse.get_pos()
             adjusted_mouse = (mouse_pos[0] - panel_rect.x, mouse_pos[1] - panel_rect.y)
             btn.update(adjusted_mouse)
         btn.draw(screen)
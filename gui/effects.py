@@ -3,36 +3,57 @@ Visual effects drawing functions
 """
 
 import pygame
+from functools import lru_cache
 from constants import COLORS
+from ui_components import get_font
 
 
 def draw_effects(screen, particles, floating_texts):
     """Draw particles and floating texts"""
-    for particle in particles:
-        particle.draw(screen)
+    pairs = particles.blit_pairs()
+    if pairs:
+        # Every particle uses the same additive blend, so they go through one
+        # batched call (fblits on pygame-ce, blits elsewhere)
+        fblits = getattr(screen, "fblits", None)
+        if fblits is not None:
+            fblits(pairs, pygame.BLEND_RGB_ADD)
+        else:
+            screen.blits(
+                [(sprite, dest, None, pygame.BLEND_RGB_ADD) for sprite, dest in pairs],
+                doreturn=False,
+            )
 
     for text in floating_texts:
         text.draw(screen)
 
 
-def draw_crt_overlay(screen, current_width, current_height):
-    """Draw CRT scanline overlay effect with vignette for cyberpunk aesthetic"""
+@lru_cache(maxsize=2)
+def _get_crt_overlay(current_width, current_height):
+    """Scanlines and corner vignette baked into one translucent surface per size"""
+    overlay = pygame.Surface((current_width, current_height), pygame.SRCALPHA)
+    
     # Scanlines
     for y in range(0, current_height, 3):
-        pygame.draw.line(screen, (0, 0, 0, 25), (0, y), (current_width, y))
+        overlay.fill((0, 0, 0, 25), pygame.Rect(0, y, current_width, 1))
     
-    # Subtle vignette effect at corners
+    # Subtle vignette effect at corners; drawn outermost first so each
+    # smaller, darker square overwrites the fainter ones around it
     vignette_strength = 40
     corners = [
         (0, 0), (current_width, 0), 
         (0, current_height), (current_width, current_height)
     ]
     for cx, cy in corners:
-        # Draw gradient vignette corners
-        for i in range(50):
+        for i in reversed(range(50)):
             alpha = int(vignette_strength * (1 - i / 50))
             rect = pygame.Rect(cx - i*2 if cx > 0 else 0, cy - i*2 if cy > 0 else 0, i*4, i*4)
-            pygame.draw.rect(screen, (0, 0, 0, alpha // 4), rect)
+            pygame.draw.rect(overlay, (0, 0, 0, alpha // 4), rect)
+    return overlay
+
+
+def draw_crt_overlay(screen, current_width, current_height):
+    """Draw CRT scanline overlay effect with vignette for cyberpunk aesthetic"""
+    screen.blit(_get_crt_overlay(current_width, current_height), (0, 0))
 
 
 def draw_circuit_background(screen, current_width, current_height):
@@ -53,44 +74,6 @@ def draw_circuit_background(screen, current_width, current_height):
             pygame.draw.circle(screen, node_color, (x, y), node_radius)
 
 
-def _get_gradient_surface(screen, current_width, current_height, cached_gradient, last_size):
-    """Get or create gradient background surface"""
-    if (cached_gradient is None or 
-        last_size != (current_width, current_height)):
-        gradient_surface = pygame.Surface((current_width, current_height))
-        for i in range(current_height):
-            color_ratio = i / current_height
-            color = (
-                int(
-                    COLORS["deep_space_blue"][0]
-                    + (
-                        COLORS["deep_space_gradient_end"][0]
-                        - COLORS["deep_space_blue"][0]
-                    )
-                    * color_ratio
-                ),
-                int(
-                    COLORS["deep_space_blue"][1]
-                    + (
-                        COLORS["deep_space_gradient_end"][1]
-                        - COLORS["deep_space_blue"][1]
-                    )
-                    * color_ratio
-                ),
-                int(
-                    COLORS["deep_space_blue"][2]
-                    + (
-                        COLORS["deep_space_gradient_end"][2]
-                        - COLORS["deep_space_blue"][2]
-                    )
-                    * color_ratio
-                ),
-            )
-            pygame.draw.line(gradient_surface, color, (0, i), (current_width, i))
-        return gradient_surface, (current_width, current_height)
-    return cached_gradient, last_size
-
-
 def draw_tooltips(screen, mouse_pos, hardware_panel_open, upgrades_panel_open,
                   hardware_scroll_panel, upgrades_scroll_panel, state, config,
                   small_font, tiny_font, current_width, current_height, COLORS):
@@ -166,9 +149,10 @@ def draw_tooltips(screen, mouse_pos, hardware_panel_open, upgrades_panel_open,
             y_offset += card_height + 14
 
 
-def _draw_tooltip_box(screen, mouse_pos, text, current_width, current_height):
-    """Draw a tooltip box at the mouse position"""
-    tooltip_font = pygame.font.Font(None, 22)
+@lru_cache(maxsize=64)
+def _get_tooltip_surface(text):
+    """Tooltip box with its text laid out, built once per distinct text"""
+    tooltip_font = get_font(22)
     lines = text.split("\n")
     
     max_width = 0
@@ -180,6 +164,24 @@ def _draw_tooltip_box(screen, mouse_pos, text, current_width, current_height):
     tooltip_width = max_width + padding * 2
     tooltip_height = len(lines) * 22 + padding * 2
     
+    tooltip_surface = pygame.Surface((tooltip_width, tooltip_height), pygame.SRCALPHA)
+    tooltip_surface.fill((15, 18, 28, 230))
+    
+    pygame.draw.rect(
+        tooltip_surface, COLORS["electric_cyan"], tooltip_surface.get_rect(), 1, border_radius=4
+    )
+    
+    for i, line in enumerate(lines):
+        text_surface = tooltip_font.render(line, True, COLORS["soft_white"])
+        tooltip_surface.blit(text_surface, (padding, padding + i * 22))
+    return tooltip_surface
+
+
+def _draw_tooltip_box(screen, mouse_pos, text, current_width, current_height):
+    """Draw a tooltip box at the mouse position"""
+    tooltip_surface = _get_tooltip_surface(text)
+    tooltip_width, tooltip_height = tooltip_surface.get_size()
+    
     tooltip_x = mouse_pos[0] + 15
     tooltip_y = mouse_pos[1] + 15
     
@@ -188,14 +190,4 @@ def _draw_tooltip_box(screen, mouse_pos, text, current_width, current_height):
     if tooltip_y + tooltip_height > current_height - 10:
         tooltip_y = mouse_pos[1] - tooltip_height - 10
     
-    tooltip_rect = pygame.Rect(tooltip_x, tooltip_y, tooltip_width, tooltip_height)
-    
-    tooltip_bg = pygame.Surface((tooltip_width, tooltip_height), pygame.SRCALPHA)
-    tooltip_bg.fill((15, 18, 28, 230))
-    screen.blit(tooltip_bg, (tooltip_x, tooltip_y))
-    
-    pygame.draw.rect(screen, COLORS["electric_cyan"], tooltip_rect, 1, border_radius=4)
-    
-    for i, line in enumerate(lines):
-        text_surface = tooltip_font.render(line, True, COLORS["soft_white"])
-        screen.blit(text_surface, (tooltip_x + padding, tooltip_y + padding + i * 22))
+    screen.blit(tooltip_surface, (tooltip_x, tooltip_y))
@@ -4,6 +4,7 @@ Information Core - the main click target for Bit by Bit Game
 
 import pygame
 from constants import COLORS
+from ui_components import render_text
 
 
 def draw_information_core(screen, game_state, fonts, x, y, size):
@@ -20,6 +21,6 @@ def draw_information_core(screen, game_state, fonts, x, y, size):
     small_font = fonts.get("small_font")
     if small_font:
         label = "Click" if not game_state.binary_invented else "Generate"
-        text = small_font.render(label, True, COLORS["soft_white"])
+        text = render_text(small_font, label, COLORS["soft_white"])
         text_rect = text.get_rect(center=(center_x, center_y))
         screen.blit(text, text_rect)
@@ -3,7 +3,45 @@ Modal dialog drawing functions for settings, rebirth, and tutorial
 """
 
 import pygame
+from functools import lru_cache
 from constants import COLORS, HARDWARE_GENERATIONS, format_number
+from ui_components import render_text
+
+
+@lru_cache(maxsize=8)
+def _get_overlay(width, height, alpha):
+    """Full-screen translucent backdrop behind a modal, built once per size/alpha"""
+    overlay = pygame.Surface((width, height))
+    overlay.set_alpha(alpha)
+    overlay.fill(COLORS["deep_space_blue"])
+    return overlay
+
+
+@lru_cache(maxsize=32)
+def _get_rounded_box(width, height, fill_color, radius, border_color=None, border_width=0):
+    """Rounded modal box or button (fill plus optional border), built once per look"""
+    box = pygame.Surface((width, height), pygame.SRCALPHA)
+    box_rect = box.get_rect()
+    pygame.draw.rect(box, fill_color, box_rect, border_radius=radius)
+    if border_color is not None:
+        pygame.draw.rect(box, border_color, box_rect, border_width, border_radius=radius)
+    return box
+
+
+@lru_cache(maxsize=32)
+def _get_modal_button(width, height, fill_color, label, font, text_color, border_color=None, border_width=0):
+    """Modal button with its label composed in, one surface per hover state.
+
+    Returns (surface, offset); the surface grows to fit a label wider than the
+    button, so blit it at the button's topleft plus offset.
+    """
+    text = render_text(font, label, text_color)
+    box_rect = pygame.Rect(0, 0, width, height)
+    bounds = box_rect.union(text.get_rect(center=box_rect.center))
+    button = pygame.Surface(bounds.size, pygame.SRCALPHA)
+    button.blit(_get_rounded_box(width, height, fill_color, 8, border_color, border_width), (-bounds.x, -bounds.y))
+    button.blit(text, text.get_rect(center=(box_rect.centerx - bounds.x, box_rect.centery - bounds.y)))
+    return button, bounds.topleft
 
 
 def draw_rebirth_confirmation(screen, showing_rebirth_confirmation, state, bit_grid, WINDOW_WIDTH, WINDOW_HEIGHT, large_font, medium_font, small_font, COLORS):
@@ -11,21 +49,19 @@ def draw_rebirth_confirmation(screen, showing_rebirth_confirmation, state, bit_g
     if not showing_rebirth_confirmation:
         return
 
-    overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
-    overlay.set_alpha(200)
-    overlay.fill(COLORS["deep_space_blue"])
-    screen.blit(overlay, (0, 0))
+    screen.blit(_get_overlay(WINDOW_WIDTH, WINDOW_HEIGHT, 200), (0, 0))
 
     box_rect = pygame.Rect(
         WINDOW_WIDTH // 2 - 300, WINDOW_HEIGHT // 2 - 200, 600, 400
     )
-    pygame.draw.rect(
-        screen, COLORS["dim_gray"], box_rect, border_radius=16
+    screen.blit(
+        _get_rounded_box(box_rect.width, box_rect.height, COLORS["dim_gray"], 16, COLORS["gold"], 3),
+        box_rect,
     )
-    pygame.draw.rect(screen, COLORS["gold"], box_rect, 3, border_radius=16)
 
-    title_text = large_font.render(
-        "⚠️ COMPRESSION CYCLE ⚠️", True, COLORS["gold"]
+    title_text = render_text(
+        large_font,
+        "⚠️ COMPRESSION CYCLE ⚠️", COLORS["gold"]
     )
     title_rect = title_text.get_rect(
         center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 150)
@@ -75,7 +111,7 @@ def draw_rebirth_confirmation(screen, showing_rebirth_confirmation, state, bit_g
         else:
             text_color = COLORS["gold"]
 
-        text_surface = small_font.render(line, True, text_color)
+        text_surface = render_text(small_font, line, text_color)
         text_rect = text_surface.get_rect(
             center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + y_offset)
         )
@@ -92,12 +128,8 @@ def draw_rebirth_confirmation(screen, showing_rebirth_confirmation, state, bit_g
         if yes_rect.collidepoint(mouse_pos)
         else COLORS["gold"]
     )
-    pygame.draw.rect(screen, yes_color, yes_rect, border_radius=8)
-    yes_text = medium_font.render(
-        "COMPRESS! 🌀", True, COLORS["soft_white"]
-    )
-    yes_text_rect = yes_text.get_rect(center=yes_rect.center)
-    screen.blit(yes_text, yes_text_rect)
+    button, (ox, oy) = _get_modal_button(yes_rect.width, yes_rect.height, yes_color, "COMPRESS! 🌀", medium_font, COLORS["soft_white"])
+    screen.blit(button, (yes_rect.x + ox, yes_rect.y + oy))
 
     no_rect = pygame.Rect(
         WINDOW_WIDTH // 2 + 20, WINDOW_HEIGHT // 2 + 50, 100, 40
@@ -107,10 +139,8 @@ def draw_rebirth_confirmation(screen, showing_rebirth_confirmation, state, bit_g
         if no_rect.collidepoint(mouse_pos)
         else COLORS["dim_gray"]
     )
-    pygame.draw.rect(screen, no_color, no_rect, border_radius=8)
-    no_text = medium_font.render("CANCEL", True, COLORS["soft_white"])
-    no_text_rect = no_text.get_rect(center=no_rect.center)
-    screen.blit(no_text, no_text_rect)
+    button, (ox, oy) = _get_modal_button(no_rect.width, no_rect.height, no_color, "CANCEL", medium_font, COLORS["soft_white"])
+    screen.blit(button, (no_rect.x + ox, no_rect.y + oy))
 
 
 def draw_prestige_confirmation(screen, showing_prestige_confirmation, state, WINDOW_WIDTH, WINDOW_HEIGHT, large_font, medium_font, small_font, COLORS):
@@ -118,21 +148,19 @@ def draw_prestige_confirmation(screen, showing_prestige_confirmation, state, WIN
     if not showing_prestige_confirmation:
         return
 
-    overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
-    overlay.set_alpha(220)
-    overlay.fill(COLORS["deep_space_blue"])
-    screen.blit(overlay, (0, 0))
+    screen.blit(_get_overlay(WINDOW_WIDTH, WINDOW_HEIGHT, 220), (0, 0))
 
     box_rect = pygame.Rect(
         WINDOW_WIDTH // 2 - 350, WINDOW_HEIGHT // 2 - 250, 700, 500
     )
-    pygame.draw.rect(
-        screen, COLORS["panel_background"], box_rect, border_radius=16
+    screen.blit(
+        _get_rounded_box(box_rect.width, box_rect.height, COLORS["panel_background"], 16, COLORS["quantum_violet"], 3),
+        box_rect,
     )
-    pygame.draw.rect(screen, COLORS["quantum_violet"], box_rect, 3, border_radius=16)
 
-    title_text = large_font.render(
-        "🔧 UPGRADE MOTHERBOARD 🔧", True, COLORS["quantum_violet"]
+    title_text = render_text(
+        large_font,
+        "🔧 UPGRADE MOTHERBOARD 🔧", COLORS["quantum_violet"]
     )
     title_rect = title_text.get_rect(
         center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 200)
@@ -175,7 +203,7 @@ def draw_prestige_confirmation(screen, showing_prestige_confirmation, state, WIN
         else:
             text_color = COLORS["muted_blue"]
 
-        text_surface = small_font.render(line, True, text_color)
+        text_surface = render_text(small_font, line, text_color)
         text_rect = text_surface.get_rect(
             center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + y_offset)
         )
@@ -192,12 +220,8 @@ def draw_prestige_confirmation(screen, showing_prestige_confirmation, state, WIN
         if yes_rect.collidepoint(mouse_pos)
         else COLORS["gold"]
     )
-    pygame.draw.rect(screen, yes_color, yes_rect, border_radius=8)
-    yes_text = medium_font.render(
-        "UPGRADE! 🔧", True, COLORS["soft_white"]
-    )
-    yes_text_rect = yes_text.get_rect(center=yes_rect.center)
-    screen.blit(yes_text, yes_text_rect)
+    button, (ox, oy) = _get_modal_button(yes_rect.width, yes_rect.height, yes_color, "UPGRADE! 🔧", medium_font, COLORS["soft_white"])
+    screen.blit(button, (yes_rect.x + ox, yes_rect.y + oy))
 
     no_rect = pygame.Rect(
         WINDOW_WIDTH // 2 + 10, WINDOW_HEIGHT // 2 + 120, 140, 50
@@ -207,10 +231,8 @@ def draw_prestige_confirmation(screen, showing_prestige_confirmation, state, WIN
         if no_rect.collidepoint(mouse_pos)
         else COLORS["dim_gray"]
     )
-    pygame.draw.rect(screen, no_color, no_rect, border_radius=8)
-    no_text = medium_font.render("CANCEL", True, COLORS["soft_white"])
-    no_text_rect = no_text.get_rect(center=no_rect.center)
-    screen.blit(no_text, no_text_rect)
+    button, (ox, oy) = _get_modal_button(no_rect.width, no_rect.height, no_color, "CANCEL", medium_font, COLORS["soft_white"])
+    screen.blit(button, (no_rect.x + ox, no_rect.y + oy))
 
     return yes_rect, no_rect
 
@@ -220,10 +242,7 @@ def draw_tutorial(screen, showing_tutorial, tutorial_text, current_width, curren
     if not showing_tutorial or not tutorial_text:
         return
 
-    overlay = pygame.Surface((current_width, current_height))
-    overlay.set_alpha(200)
-    overlay.fill(COLORS["deep_space_blue"])
-    screen.blit(overlay, (0, 0))
+    screen.blit(_get_overlay(current_width, current_height, 200), (0, 0))
 
     box_width = min(500, current_width - 100)
     box_height = min(300, current_height - 200)
@@ -233,17 +252,15 @@ def draw_tutorial(screen, showing_tutorial, tutorial_text, current_width, curren
         box_width,
         box_height,
     )
-    pygame.draw.rect(
-        screen, COLORS["dim_gray"], box_rect, border_radius=16
-    )
-    pygame.draw.rect(
-        screen, COLORS["electric_cyan"], box_rect, 3, border_radius=16
+    screen.blit(
+        _get_rounded_box(box_rect.width, box_rect.height, COLORS["dim_gray"], 16, COLORS["electric_cyan"], 3),
+        box_rect,
     )
 
     lines = tutorial_text.split("\n")
     y_offset = 0
     for line in lines:
-        text_surface = small_font.render(line, True, COLORS["soft_white"])
+        text_surface = render_text(small_font, line, COLORS["soft_white"])
         text_rect = text_surface.get_rect(
             center=(
                 current_width // 2,
@@ -264,35 +281,20 @@ def draw_tutorial(screen, showing_tutorial, tutorial_text, current_width, curren
         button_color = COLORS["muted_blue"]
         text_color = COLORS["soft_white"]
 
-    pygame.draw.rect(
-        screen, button_color, continue_button_rect, border_radius=8
-    )
-    pygame.draw.rect(
-        screen,
-        COLORS["electric_cyan"],
-        continue_button_rect,
-        2,
-        border_radius=8,
+    button, (ox, oy) = _get_modal_button(
+        continue_button_rect.width, continue_button_rect.height,
+        button_color, "CLICK TO CONTINUE", medium_font, text_color,
+        COLORS["electric_cyan"], 2,
     )
+    screen.blit(button, (continue_button_rect.x + ox, continue_button_rect.y + oy))
 
-    continue_text = medium_font.render(
-        "CLICK TO CONTINUE", True, text_color
-    )
-    continue_text_rect = continue_text.get_rect(
-        center=continue_button_rect.center
-    )
-    screen.blit(continue_text, continue_text_rect)
 
+@lru_cache(maxsize=4)
+def _settings_layout(current_width, current_height, base_width, base_height):
+    """Screen rects of the settings box, its close button and its six setting rows.
 
-def draw_settings_page(screen, current_width, current_height, base_width, base_height,
-                        visual_settings, high_contrast_mode, reduced_motion_mode,
-                        visual_quality, large_font, medium_font, small_font, tiny_font, COLORS):
-    """Draw settings page modal"""
-    overlay = pygame.Surface((current_width, current_height))
-    overlay.set_alpha(230)
-    overlay.fill(COLORS["deep_space_blue"])
-    screen.blit(overlay, (0, 0))
-
+    Cached per window size; the returned rects are shared, so treat them as read-only.
+    """
     scale_x = current_width / base_width
     scale_y = current_height / base_height
     settings_rect = pygame.Rect(
@@ -301,215 +303,116 @@ def draw_settings_page(screen, current_width, current_height, base_width, base_h
         int(600 * scale_x),
         int(520 * scale_y),
     )
-    pygame.draw.rect(
-        screen, COLORS["dim_gray"], settings_rect, border_radius=16
+    rects = {
+        "close": pygame.Rect(settings_rect.right - 35, settings_rect.top + 10, 25, 25),
+    }
+    for name, row_y in (("crt", 270), ("rain", 320), ("particle", 370),
+                        ("contrast", 450), ("motion", 500), ("quality", 550)):
+        rects[name] = pygame.Rect(
+            current_width // 2 - int(200 * scale_x),
+            int(row_y * scale_y),
+            int(400 * scale_x),
+            int(40 * scale_y),
+        )
+    return settings_rect, rects
+
+
+@lru_cache(maxsize=8)
+def _get_settings_panel(current_width, current_height, base_width, base_height,
+                        crt_effects, binary_rain, particle_effects, high_contrast_mode,
+                        reduced_motion_mode, visual_quality, large_font, medium_font,
+                        small_font, tiny_font):
+    """Compose the settings box with its titles and every row for one combination of settings"""
+    scale_y = current_height / base_height
+    settings_rect, rects = _settings_layout(current_width, current_height, base_width, base_height)
+    ox, oy = settings_rect.topleft
+    panel = pygame.Surface(settings_rect.size, pygame.SRCALPHA)
+    panel.blit(
+        _get_rounded_box(settings_rect.width, settings_rect.height, COLORS["dim_gray"], 16, COLORS["electric_cyan"], 3),
+        (0, 0),
     )
-    pygame.draw.rect(
-        screen, COLORS["electric_cyan"], settings_rect, 3, border_radius=16
+
+    def blit_centered(text_surface, center):
+        panel.blit(text_surface, text_surface.get_rect(center=(center[0] - ox, center[1] - oy)))
+
+    blit_centered(
+        render_text(large_font, "⚙️ SETTINGS", COLORS["electric_cyan"]),
+        (current_width // 2, int(170 * scale_y)),
+    )
+    blit_centered(
+        render_text(medium_font, "VISUAL EFFECTS", COLORS["neon_purple"]),
+        (current_width // 2, int(220 * scale_y)),
+    )
+    blit_centered(
+        render_text(medium_font, "ACCESSIBILITY", COLORS["neon_purple"]),
+        (current_width // 2, int(420 * scale_y)),
     )
 
-    title_text = large_font.render("⚙️ SETTINGS", True, COLORS["electric_cyan"])
-    title_rect = title_text.get_rect(
-        center=(current_width // 2, int(170 * scale_y))
+    rows = (
+        ("crt", crt_effects, f"📺 CRT Effects: {'ON' if crt_effects else 'OFF'}"),
+        ("rain", binary_rain, f"🌧️ Binary Rain: {'ON' if binary_rain else 'OFF'}"),
+        ("particle", particle_effects, f"✨ Particle Effects: {'ON' if particle_effects else 'OFF'}"),
+        ("contrast", high_contrast_mode, f"👁️ High Contrast: {'ON' if high_contrast_mode else 'OFF'}"),
+        ("motion", reduced_motion_mode, f"🎯 Reduced Motion: {'ON' if reduced_motion_mode else 'OFF'}"),
+        ("quality", True, f"🎨 Visual Quality: {visual_quality.upper()}"),
     )
-    screen.blit(title_text, title_rect)
+    for name, is_on, label in rows:
+        row_rect = rects[name].move(-ox, -oy)
+        row_color = COLORS["electric_cyan"] if is_on else COLORS["muted_blue"]
+        pygame.draw.rect(panel, row_color, row_rect, 2, border_radius=8)
+        blit_centered(render_text(small_font, label, COLORS["soft_white"]), rects[name].center)
 
-    mouse_pos = pygame.mouse.get_pos()
+    blit_centered(
+        render_text(tiny_font, "Click any setting to toggle • Press ESC or click × to close", COLORS["muted_blue"]),
+        (current_width // 2, int(600 * scale_y)),
+    )
+    return panel
 
-    close_button_rect = pygame.Rect(
-        settings_rect.right - 35, settings_rect.top + 10, 25, 25
+
+def draw_settings_page(screen, current_width, current_height, base_width, base_height,
+                        visual_settings, high_contrast_mode, reduced_motion_mode,
+                        visual_quality, large_font, medium_font, small_font, tiny_font, COLORS):
+    """Draw settings page modal"""
+    screen.blit(_get_overlay(current_width, current_height, 230), (0, 0))
+
+    settings_rect, rects = _settings_layout(current_width, current_height, base_width, base_height)
+    # Everything except hover feedback only changes when a setting is toggled
+    screen.blit(
+        _get_settings_panel(
+            current_width, current_height, base_width, base_height,
+            bool(visual_settings["crt_effects"]), bool(visual_settings["binary_rain"]),
+            bool(visual_settings["particle_effects"]), bool(high_contrast_mode),
+            bool(reduced_motion_mode), visual_quality,
+            large_font, medium_font, small_font, tiny_font,
+        ),
+        settings_rect,
     )
+
+    mouse_pos = pygame.mouse.get_pos()
+
+    close_button_rect = rects["close"]
     close_button_color = (
         COLORS["signal_orange"] if close_button_rect.collidepoint(mouse_pos) else COLORS["dim_gray"]
     )
-    pygame.draw.rect(screen, close_button_color, close_button_rect, border_radius=4)
-    close_x = medium_font.render("×", True, COLORS["soft_white"])
+    screen.blit(_get_rounded_box(25, 25, close_button_color, 4), close_button_rect)
+    close_x = render_text(medium_font, "×", COLORS["soft_white"])
     close_x_rect = close_x.get_rect(center=close_button_rect.center)
     screen.blit(close_x, close_x_rect)
 
-    section_text = medium_font.render(
-        "VISUAL EFFECTS", True, COLORS["neon_purple"]
-    )
-    section_rect = section_text.get_rect(
-        center=(current_width // 2, int(220 * scale_y))
-    )
-    screen.blit(section_text, section_rect)
-
-    crt_rect = pygame.Rect(
-        current_width // 2 - int(200 * scale_x),
-        int(270 * scale_y),
-        int(400 * scale_x),
-        int(40 * scale_y),
-    )
-    crt_color = (
-        COLORS["electric_cyan"]
-        if visual_settings["crt_effects"]
-        else COLORS["muted_blue"]
-    )
-    pygame.draw.rect(screen, crt_color, crt_rect, 2, border_radius=8)
-    crt_text = small_font.render(
-        f"📺 CRT Effects: {'ON' if visual_settings['crt_effects'] else 'OFF'}",
-        True,
-        COLORS["soft_white"],
-    )
-    crt_text_rect = crt_text.get_rect(center=crt_rect.center)
-    screen.blit(crt_text, crt_text_rect)
-
-    rain_rect = pygame.Rect(
-        current_width // 2 - int(200 * scale_x),
-        int(320 * scale_y),
-        int(400 * scale_x),
-        int(40 * scale_y),
-    )
-    rain_color = (
-        COLORS["electric_cyan"]
-        if visual_settings["binary_rain"]
-        else COLORS["muted_blue"]
-    )
-    pygame.draw.rect(screen, rain_color, rain_rect, 2, border_radius=8)
-    rain_text = small_font.render(
-        f"🌧️ Binary Rain: {'ON' if visual_settings['binary_rain'] else 'OFF'}",
-        True,
-        COLORS["soft_white"],
-    )
-    rain_text_rect = rain_text.get_rect(center=rain_rect.center)
-    screen.blit(rain_text, rain_text_rect)
-
-    particle_rect = pygame.Rect(
-        current_width // 2 - int(200 * scale_x),
-        int(370 * scale_y),
-        int(400 * scale_x),
-        int(40 * scale_y),
-    )
-    particle_color = (
-        COLORS["electric_cyan"]
-        if visual_settings["particle_effects"]
-        else COLORS["muted_blue"]
-    )
-    pygame.draw.rect(screen, particle_color, particle_rect, 2, border_radius=8)
-    particle_text = small_font.render(
-        f"✨ Particle Effects: {'ON' if visual_settings['particle_effects'] else 'OFF'}",
-        True,
-        COLORS["soft_white"],
-    )
-    particle_text_rect = particle_text.get_rect(center=particle_rect.center)
-    screen.blit(particle_text, particle_text_rect)
-
-    access_section_text = medium_font.render(
-        "ACCESSIBILITY", True, COLORS["neon_purple"]
-    )
-    access_section_rect = access_section_text.get_rect(
-        center=(current_width // 2, int(420 * scale_y))
-    )
-    screen.blit(access_section_text, access_section_rect)
-
-    contrast_rect = pygame.Rect(
-        current_width // 2 - int(200 * scale_x),
-        int(450 * scale_y),
-        int(400 * scale_x),
-        int(40 * scale_y),
-    )
-    contrast_color = (
-        COLORS["electric_cyan"] if high_contrast_mode else COLORS["muted_blue"]
-    )
-    pygame.draw.rect(screen, contrast_color, contrast_rect, 2, border_radius=8)
-    contrast_text = small_font.render(
-        f"👁️ High Contrast: {'ON' if high_contrast_mode else 'OFF'}",
-        True,
-        COLORS["soft_white"],
-    )
-    contrast_text_rect = contrast_text.get_rect(center=contrast_rect.center)
-    screen.blit(contrast_text, contrast_text_rect)
-
-    motion_rect = pygame.Rect(
-        current_width // 2 - int(200 * scale_x),
-        int(500 * scale_y),
-        int(400 * scale_x),
-        int(40 * scale_y),
-    )
-    motion_color = (
-        COLORS["electric_cyan"]
-        if reduced_motion_mode
-        else COLORS["muted_blue"]
-    )
-    pygame.draw.rect(screen, motion_color, motion_rect, 2, border_radius=8)
-    motion_text = small_font.render(
-        f"🎯 Reduced Motion: {'ON' if reduced_motion_mode else 'OFF'}",
-        True,
-        COLORS["soft_white"],
-    )
-    motion_text_rect = motion_text.get_rect(center=motion_rect.center)
-    screen.blit(motion_text, motion_text_rect)
-
-    quality_rect = pygame.Rect(
-        current_width // 2 - int(200 * scale_x),
-        int(550 * scale_y),
-        int(400 * scale_x),
-        int(40 * scale_y),
-    )
-    quality_color = COLORS["electric_cyan"]
-    pygame.draw.rect(screen, quality_color, quality_rect, 2, border_radius=8)
-    quality_text = small_font.render(
-        f"🎨 Visual Quality: {visual_quality.upper()}",
-        True,
-        COLORS["soft_white"],
-    )
-    quality_text_rect = quality_text.get_rect(center=quality_rect.center)
-    screen.blit(quality_text, quality_text_rect)
-
-    inst_text = tiny_font.render(
-        "Click any setting to toggle • Press ESC or click × to close",
-        True,
-        COLORS["muted_blue"],
-    )
-    inst_rect = inst_text.get_rect(
-        center=(current_width // 2, int(600 * scale_y))
-    )
-    screen.blit(inst_text, inst_rect)
-
-    if crt_rect.collidepoint(mouse_pos):
-        pygame.draw.rect(
-            screen, COLORS["electric_cyan"], crt_rect, 3, border_radius=8
-        )
-    elif rain_rect.collidepoint(mouse_pos):
-        pygame.draw.rect(
-            screen, COLORS["electric_cyan"], rain_rect, 3, border_radius=8
-        )
-    elif particle_rect.collidepoint(mouse_pos):
-        pygame.draw.rect(
-            screen, COLORS["electric_cyan"], particle_rect, 3, border_radius=8
-        )
-    elif contrast_rect.collidepoint(mouse_pos):
-        pygame.draw.rect(
-            screen, COLORS["electric_cyan"], contrast_rect, 3, border_radius=8
-        )
-    elif motion_rect.collidepoint(mouse_pos):
-        pygame.draw.rect(
-            screen, COLORS["electric_cyan"], motion_rect, 3, border_radius=8
-        )
-    elif quality_rect.collidepoint(mouse_pos):
-        pygame.draw.rect(
-            screen, COLORS["electric_cyan"], quality_rect, 3, border_radius=8
-        )
+    for name in ("crt", "rain", "particle", "contrast", "motion", "quality"):
+        if rects[name].collidepoint(mouse_pos):
+            pygame.draw.rect(
+                screen, COLORS["electric_cyan"], rects[name], 3, border_radius=8
+            )
+            break
 
-    return {
-        "close": close_button_rect,
-        "crt": crt_rect,
-        "rain": rain_rect,
-        "particle": particle_rect,
-        "contrast": contrast_rect,
-        "motion": motion_rect,
-        "quality": quality_rect,
-    }
+    return rects
 
 
 def draw_statistics_page(screen, current_width, current_height, base_width, base_height,
                         state, format_number_func, large_font, medium_font, small_font, tiny_font, COLORS):
     """Draw statistics page modal"""
-    overlay = pygame.Surface((current_width, current_height))
-    overlay.set_alpha(230)
-    overlay.fill(COLORS["deep_space_blue"])
-    screen.blit(overlay, (0, 0))
+    screen.blit(_get_overlay(current_width, current_height, 230), (0, 0))
 
     scale_x = current_width / base_width
     scale_y = current_height / base_height
@@ -526,7 +429,7 @@ def draw_statistics_page(screen, current_width, current_height, base_width, base
         screen, COLORS["neon_purple"], stats_rect, 3, border_radius=16
     )
 
-    title_text = large_font.render("📊 STATISTICS", True, COLORS["neon_purple"])
+    title_text = render_text(large_font, "📊 STATISTICS", COLORS["neon_purple"])
     title_rect = title_text.get_rect(
         center=(current_width // 2, int(200 * scale_y))
     )
@@ -541,7 +444,7 @@ def draw_statistics_page(screen, current_width, current_height, base_width, base
         COLORS["signal_orange"] if close_button_rect.collidepoint(mouse_pos) else COLORS["dim_gray"]
     )
     pygame.draw.rect(screen, close_button_color, close_button_rect, border_radius=4)
-    close_x = medium_font.render("×", True, COLORS["soft_white"])
+    close_x = render_text(medium_font, "×", COLORS["soft_white"])
     close_x_rect = close_x.get_rect(center=close_button_rect.center)
     screen.blit(close_x, close_x_rect)
 
@@ -564,22 +467,22 @@ def draw_statistics_page(screen, current_width, current_height, base_width, base
 
     y_offset = 250
     for label, value in stats_lines:
-        label_text = small_font.render(label, True, COLORS["muted_blue"])
+        label_text = render_text(small_font, label, COLORS["muted_blue"])
         label_rect = label_text.get_rect(
             center=(current_width // 2 - 80, int(y_offset * scale_y))
         )
         screen.blit(label_text, label_rect)
 
-        value_text = small_font.render(str(value), True, COLORS["soft_white"])
+        value_text = render_text(small_font, str(value), COLORS["soft_white"])
         value_rect = value_text.get_rect(
             center=(current_width // 2 + 80, int(y_offset * scale_y))
         )
         screen.blit(value_text, value_rect)
         y_offset += 35
 
-    inst_text = tiny_font.render(
+    inst_text = render_text(
+        tiny_font,
         "Click × or press ESC to close",
-        True,
         COLORS["muted_blue"],
     )
     inst_rect = inst_text.get_rect(
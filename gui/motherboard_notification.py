@@ -4,6 +4,7 @@ Motherboard Upgrade Notification for Bit by Bit Game
 
 import pygame
 from constants import COLORS
+from ui_components import get_font
 
 
 class MotherboardUpgradeNotification:
@@ -40,7 +41,7 @@ class MotherboardUpgradeNotification:
         elapsed = pygame.time.get_ticks() - self.start_time
         self.alpha = max(0, 255 - int(255 * elapsed / self.duration))
         
-        font = pygame.font.SysFont("Arial", 24)
+        font = get_font(24, "Arial")
         
         # Render text with alpha
         text = font.render(self.message, True, COLORS["matrix_green"])
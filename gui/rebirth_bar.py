@@ -3,7 +3,47 @@ Rebirth bar drawing function
 """
 
 import pygame
+from functools import lru_cache
 from constants import COLORS, HARDWARE_GENERATIONS, format_number
+from ui_components import render_text
+
+
+@lru_cache(maxsize=4)
+def _get_gradient_strip(width):
+    """One-pixel-tall cyan-to-purple gradient, width pixels wide"""
+    start = COLORS["electric_cyan"]
+    end = COLORS["neon_purple"]
+    strip = pygame.Surface((width, 1))
+    for i in range(width):
+        gradient_ratio = i / width
+        strip.set_at((i, 0), tuple(
+            int(start[c] + (end[c] - start[c]) * gradient_ratio) for c in range(3)
+        ))
+    return strip
+
+
+@lru_cache(maxsize=8)
+def _get_progress_fill(width, height, strip_width):
+    """The gradient stretched over the filled part of the bar, cached per fill size"""
+    return pygame.transform.scale(_get_gradient_strip(strip_width), (width, height))
+
+
+@lru_cache(maxsize=4)
+def _get_shimmer_surface(height):
+    """40px translucent white band swept across the filled bar"""
+    shimmer_surface = pygame.Surface((40, height))
+    shimmer_surface.set_alpha(100)
+    shimmer_surface.fill((255, 255, 255))
+    return shimmer_surface
+
+
+@lru_cache(maxsize=4)
+def _get_top_glow_strip(width):
+    """Purple top border with a fading glow below it, width pixels wide"""
+    strip = pygame.Surface((width, 4), pygame.SRCALPHA)
+    for row, alpha in enumerate((255, 35, 20, 5)):
+        strip.fill((*COLORS["neon_purple"][:3], alpha), (0, row, width, 1))
+    return strip
 
 
 def draw_rebirth_bar(screen, state, bit_grid, rebirth_button, current_width, current_height,
@@ -16,51 +56,9 @@ def draw_rebirth_bar(screen, state, bit_grid, rebirth_button, current_width, cur
         int(80 * (current_height / base_height)),
     )
 
-    shadow_rect = pygame.Rect(
-        2,
-        current_height - int(78 * (current_height / base_height)),
-        current_width - 4,
-        int(76 * (current_height / base_height)),
-    )
-    pygame.draw.rect(screen, (0, 0, 0, 50), shadow_rect)
-
     pygame.draw.rect(screen, COLORS["deep_space_blue"], bar_rect)
 
-    pygame.draw.line(
-        screen,
-        COLORS["neon_purple"],
-        (
-            0,
-            current_height
-            - int(80 * (current_height / base_height)),
-        ),
-        (
-            current_width,
-            current_height
-            - int(80 * (current_height / base_height)),
-        ),
-        2,
-    )
-    for i in range(1, 4):
-        alpha = 50 - i * 15
-        glow_color = (*COLORS["neon_purple"][:3], alpha)
-        pygame.draw.line(
-            screen,
-            glow_color[:3],
-            (
-                0,
-                current_height
-                - int(80 * (current_height / base_height))
-                + i,
-            ),
-            (
-                current_width,
-                current_height
-                - int(80 * (current_height / base_height))
-                + i,
-            ),
-            1,
-        )
+    screen.blit(_get_top_glow_strip(current_width), bar_rect.topleft)
 
     current_gen, next_gen = state.get_hardware_generation_info()
     rebirth_threshold = state.get_rebirth_threshold()
@@ -96,32 +94,12 @@ def draw_rebirth_bar(screen, state, bit_grid, rebirth_button, current_width, cur
         border_radius=10,
     )
 
-    if progress > 0:
-        for i in range(progress_fill.width):
-            gradient_ratio = i / progress_fill.width
-            fill_color = (
-                int(
-                    COLORS["electric_cyan"][0]
-                    + (COLORS["neon_purple"][0] - COLORS["electric_cyan"][0])
-                    * gradient_ratio
-                ),
-                int(
-                    COLORS["electric_cyan"][1]
-                    + (COLORS["neon_purple"][1] - COLORS["electric_cyan"][1])
-                    * gradient_ratio
-                ),
-                int(
-                    COLORS["electric_cyan"][2]
-                    + (COLORS["neon_purple"][2] - COLORS["electric_cyan"][2])
-                    * gradient_ratio
-                ),
-            )
-            pygame.draw.line(
-                screen,
-                fill_color,
-                (progress_fill.left + i, progress_fill.top),
-                (progress_fill.left + i, progress_fill.bottom),
-            )
+    if progress > 0 and progress_fill.width > 0:
+        screen.blit(
+            # The old per-column lines spanned top..bottom inclusive, hence + 1
+            _get_progress_fill(progress_fill.width, progress_fill.height + 1, progress_bg.width),
+            progress_fill.topleft,
+        )
 
     if progress_fill.width > 0:
         shimmer_offset = (pygame.time.get_ticks() // 20) % (
@@ -137,12 +115,7 @@ def draw_rebirth_bar(screen, state, bit_grid, rebirth_button, current_width, cur
             shimmer_rect.left >= progress_fill.left
             and shimmer_rect.right <= progress_fill.right
         ):
-            shimmer_surface = pygame.Surface(
-                (shimmer_rect.width, shimmer_rect.height)
-            )
-            shimmer_surface.set_alpha(100)
-            shimmer_surface.fill((255, 255, 255))
-            screen.blit(shimmer_surface, shimmer_rect)
+            screen.blit(_get_shimmer_surface(shimmer_rect.height), shimmer_rect)
 
     if progress >= 1.0 and state.can_rebirth(bit_grid):
         if next_gen:
@@ -153,9 +126,9 @@ def draw_rebirth_bar(screen, state, bit_grid, rebirth_button, current_width, cur
             rebirth_button.text = f"🌀 COMPRESS FOR {tokens} ⭐"
         rebirth_button.draw(screen)
 
-    progress_text = monospace_font.render(
+    progress_text = render_text(
+        monospace_font,
         f"{era_completion_text} | ({current_bits} / {target_bits})",
-        True,
         COLORS["soft_white"],
     )
     progress_rect = progress_text.get_rect(
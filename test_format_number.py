@@ -0,0 +1,45 @@
+"""
+Tests for constants.format_number
+"""
+
+import math
+
+import pytest
+
+pytest.importorskip("pygame")
+
+from constants import format_number
+
+
+def test_small_numbers_are_plain_integers():
+    assert format_number(0) == "0"
+    assert format_number(999) == "999"
+    assert format_number(999.9) == "999"
+
+
+def test_suffixes_round_to_tenths():
+    assert format_number(1000) == "1.0K"
+    assert format_number(1250.87) == "1.3K"
+    assert format_number(2500000) == "2.5M"
+    assert format_number(7.25e9) == "7.3B"
+    assert format_number(3e12) == "3.0T"
+
+
+def test_infinite_cost_does_not_raise():
+    # get_generator_cost returns inf for generators outside the current era
+    assert format_number(float("inf")) == "infT"
+    assert format_number(math.inf) == "infT"
+
+
+def test_nan_does_not_raise():
+    assert format_number(float("nan")) == "nanT"
+
+
+def test_values_with_the_same_display_format_equal():
+    assert format_number(1_200_000) == format_number(1_249_999) == "1.2M"
+    assert format_number(1_250_000) == "1.3M"
+
+
+def test_non_finite_after_scaled_values():
+    assert format_number(5e15) == "5000.0T"
+    assert format_number(float("-inf")) == "-infT"
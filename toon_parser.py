@@ -57,7 +57,7 @@ class ToonParser:
         if first_content and self._is_array_header(first_content):
             # Root is array
             return self._parse_root_array()
-        elif len([line for line in self.lines if line.strip() and ":" in line]) > 0:
+        elif any(":" in line and line.strip() for line in self.lines):
             # Root is object
             return self._parse_root_object()
         else:
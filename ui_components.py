@@ -3,9 +3,76 @@ UI components for Bit by Bit Game
 """
 
 import pygame
+from functools import lru_cache
 from constants import COLORS, WINDOW_WIDTH, WINDOW_HEIGHT
 
 
+@lru_cache(maxsize=64)
+def get_font(size, name=None, bold=False):
+    """Shared font instance; name None is pygame's default font, else a SysFont"""
+    if name is None:
+        return pygame.font.Font(None, size)
+    return pygame.font.SysFont(name, size, bold=bold)
+
+
+@lru_cache(maxsize=512)
+def _render_text_cached(font, text, color):
+    return font.render(text, True, color)
+
+
+def render_text(font, text, color):
+    """Antialiased text surface, cached per (font, text, color); do not mutate it"""
+    return _render_text_cached(font, text, tuple(color))
+
+
+@lru_cache(maxsize=64)
+def _render_glow_text_cached(font, text, color, layers):
+    text_surface = _render_text_cached(font, text, color)
+    w, h = text_surface.get_size()
+    left = max(0, -min(dx for (dx, _), _ in layers))
+    top = max(0, -min(dy for (_, dy), _ in layers))
+    right = max(0, max(dx for (dx, _), _ in layers))
+    bottom = max(0, max(dy for (_, dy), _ in layers))
+
+    # Start from the text colour at zero alpha: every layer shares that colour,
+    # so blending only accumulates alpha, exactly as stacking on screen did
+    surface = pygame.Surface((w + left + right, h + top + bottom), pygame.SRCALPHA)
+    surface.fill((*color, 0))
+    glow = text_surface.copy()
+    for (dx, dy), alpha in layers:
+        glow.set_alpha(alpha)
+        surface.blit(glow, (left + dx, top + dy))
+    surface.blit(text_surface, (left, top))
+    return surface, pygame.Rect(left, top, w, h)
+
+
+def render_glow_text(font, text, color, layers):
+    """Text with faded offset copies behind it, composed once into one surface
+
+    layers is a sequence of ((dx, dy), alpha). Returns the surface and the rect
+    of the crisp text inside it; do not mutate either.
+    """
+    return _render_glow_text_cached(
+        font, text, tuple(color), tuple((tuple(offset), alpha) for offset, alpha in layers)
+    )
+
+
+@lru_cache(maxsize=32)
+def _get_button_glow(width, height, color, alpha):
+    """Rounded translucent halo drawn behind hovered/active buttons"""
+    glow_surf = pygame.Surface((width, height), pygame.SRCALPHA)
+    pygame.draw.rect(glow_surf, (*color, alpha), (0, 0, width, height), border_radius=6)
+    return glow_surf
+
+
+@lru_cache(maxsize=32)
+def _get_button_inner_shadow(width, height):
+    """Faint dark inset that gives enabled buttons some depth"""
+    shadow_surf = pygame.Surface((width, height), pygame.SRCALPHA)
+    pygame.draw.rect(shadow_surf, (0, 0, 0, 20), (0, 0, width, height), border_radius=2)
+    return shadow_surf
+
+
 class LayoutManager:
     """Centralized layout management for responsive positioning"""
     
@@ -326,14 +393,8 @@ class Button:
         # Draw glow effect for hover/active states
         if glow_alpha > 0:
             glow_rect = self.rect.inflate(4, 4)
-            glow_surf = pygame.Surface(
-                (glow_rect.width, glow_rect.height), pygame.SRCALPHA
-            )
-            pygame.draw.rect(
-                glow_surf,
-                (*border_color, glow_alpha),
-                (0, 0, glow_rect.width, glow_rect.height),
-                border_radius=6,
+            glow_surf = _get_button_glow(
+                glow_rect.width, glow_rect.height, tuple(border_color), glow_alpha
             )
             screen.blit(glow_surf, glow_rect)
 
@@ -373,15 +434,7 @@ class Button:
                 self.rect.width - 6,
                 self.rect.height - 6,
             )
-            shadow_surf = pygame.Surface(
-                (shadow_rect.width, shadow_rect.height), pygame.SRCALPHA
-            )
-            pygame.draw.rect(
-                shadow_surf,
-                (0, 0, 0, 20),
-                (0, 0, shadow_rect.width, shadow_rect.height),
-                border_radius=2,
-            )
+            shadow_surf = _get_button_inner_shadow(shadow_rect.width, shadow_rect.height)
             screen.blit(shadow_surf, shadow_rect)
 
         # Enhanced text rendering
@@ -430,11 +483,8 @@ class FloatingText:
         self.vy = -80
         self.scale = 1.5
         self.target_scale = 1.0
-        try:
-            self.font = pygame.font.SysFont("Consolas", 28, bold=True)
-        except:
-            self.font = pygame.font.Font(None, 32)
-        self._cached_surface = self.font.render(text, True, color)
+        # draw() sets alpha on this surface, so take a copy of the shared render
+        self._cached_surface = render_text(get_font(28, "Consolas", True), text, color).copy()
 
     def update(self, dt):
         self.y += self.vy * dt
@@ -445,14 +495,20 @@ class FloatingText:
     def draw(self, screen):
         if self.lifetime > 0:
             alpha = min(255, int(255 * self.lifetime * 2))
-            text_surface = self._cached_surface.copy()
-            text_surface.set_alpha(alpha)
+            text_surface = self._cached_surface
             
             w, h = text_surface.get_size()
             scaled_w = int(w * self.scale)
             scaled_h = int(h * self.scale)
-            if scaled_w > 0 and scaled_h > 0:
+            if (scaled_w, scaled_h) == (w, h):
+                # Scale has settled: blit the surface without scaling
+                text_surface.set_alpha(alpha)
+                screen.blit(text_surface, (self.x - w // 2, self.y - h // 2))
+            elif scaled_w > 0 and scaled_h > 0:
+                # transform.scale returns a fresh surface, so alpha is set on that
                 scaled = pygame.transform.scale(text_surface, (scaled_w, scaled_h))
+                scaled.set_alpha(alpha)
                 screen.blit(scaled, (self.x - scaled_w // 2, self.y - scaled_h // 2))
             else:
+                text_surface.set_alpha(alpha)
                 screen.blit(text_surface, (self.x, self.y))
@@ -7,27 +7,108 @@ import math
 import random
 from constants import COLORS, WINDOW_WIDTH, WINDOW_HEIGHT
 
+# Try to import numpy for the vectorized binary rain columns
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+    np = None
+
+# Shared generator for the bulk particle spawns in ParticleSystem.emit
+_rng = np.random.default_rng() if HAS_NUMPY else None
+
+# Numba is optional; without it particle integration runs as plain numpy ops
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+
+def _integrate_particles_numpy(x, y, vx, vy, life, gravity, dt, drag):
+    """Advance live particle arrays (views) in place by dt"""
+    x += vx * dt
+    y += vy * dt
+    vy += gravity * dt
+    life -= dt
+    vx *= drag
+
+
+def _integrate_particles_loops(x, y, vx, vy, life, gravity, dt, drag):
+    """Same as _integrate_particles_numpy as one fused pass, for numba to compile"""
+    for i in range(x.shape[0]):
+        x[i] += vx[i] * dt
+        y[i] += vy[i] * dt
+        vy[i] += gravity[i] * dt
+        life[i] -= dt
+        vx[i] *= drag
+
+
+if HAS_NUMBA:
+    _integrate_particles = njit(cache=True, fastmath=True)(_integrate_particles_loops)
+    # numba compiles on first call; do it at import with the same argument
+    # types ParticleSystem.update passes (float32 views, Python float scalars)
+    # so the first click burst does not stall on the JIT
+    _warmup = [np.zeros(1, dtype=np.float32) for _ in range(6)]
+    _integrate_particles(*_warmup, 1 / 60, 0.98)
+    del _warmup
+else:
+    _integrate_particles = _integrate_particles_numpy
+
+
+# Colours scaled by a fade factor, bucketed into COLOR_FADE_LEVELS steps
+COLOR_FADE_LEVELS = 32
+_COLOR_ALPHA_LUT = {}
+
+
+def scale_color(color, alpha):
+    """Return color darkened by alpha (0..1), memoised per fade bucket"""
+    bucket = int(alpha * (COLOR_FADE_LEVELS - 1))
+    if bucket < 0:
+        bucket = 0
+    elif bucket >= COLOR_FADE_LEVELS:
+        bucket = COLOR_FADE_LEVELS - 1
+    key = (color, bucket)
+    scaled = _COLOR_ALPHA_LUT.get(key)
+    if scaled is None:
+        factor = bucket / (COLOR_FADE_LEVELS - 1)
+        scaled = tuple(int(c * factor) for c in color)
+        _COLOR_ALPHA_LUT[key] = scaled
+    return scaled
+
+
+# Pre-baked additive glow sprites keyed by (color, size, fade level). Fading
+# is quantised so the cache stays small; blitting one of these replaces the
+# per-frame circle rasterisation done by Particle and BitDot.
+GLOW_FADE_LEVELS = 16
+_GLOW_SPRITES = {}
+
+
+def _glow_sprite(color, size, fade):
+    """Return a cached glow-plus-core disc for color at the given fade (0..1)"""
+    level = min(GLOW_FADE_LEVELS - 1, int(fade * GLOW_FADE_LEVELS))
+    key = (color, size, level)
+    sprite = _GLOW_SPRITES.get(key)
+    if sprite is None:
+        scale = (level + 1) / GLOW_FADE_LEVELS
+        radius = size + 2
+        sprite = pygame.Surface((radius * 2 + 1, radius * 2 + 1))
+        sprite.fill((0, 0, 0))
+        center = (radius, radius)
+        pygame.draw.circle(
+            sprite, tuple(int(c * 0.3 * scale) for c in color), center, radius
+        )
+        pygame.draw.circle(
+            sprite, tuple(int(c * scale) for c in color), center, size
+        )
+        _GLOW_SPRITES[key] = sprite
+    return sprite
+
 
 class Particle:
-    _surfaces = {}
-    
-    @classmethod
-    def _get_surface(cls, size, color):
-        key = (size, color)
-        if key not in cls._surfaces:
-            surf = pygame.Surface((size * 4, size * 4), pygame.SRCALPHA)
-            pygame.draw.circle(surf, (*color, 255), (size * 2, size * 2), size)
-            cls._surfaces[key] = surf
-        return cls._surfaces[key]
-
-    @classmethod
-    def _get_glow_surface(cls, size, color):
-        key = ("glow", size, color)
-        if key not in cls._surfaces:
-            surf = pygame.Surface((size * 6, size * 6), pygame.SRCALPHA)
-            pygame.draw.circle(surf, (*color, 80), (size * 3, size * 3), size + 2)
-            cls._surfaces[key] = surf
-        return cls._surfaces[key]
+    # Horizontal drag kept per 60 Hz frame
+    DRAG = 0.98
 
     def __init__(self, x, y, color=COLORS["electric_cyan"], particle_type="burst"):
         self.x = x
@@ -56,32 +137,147 @@ class Particle:
                 self.vy = random.uniform(-100, 100)
 
         self.gravity = 200 if particle_type == "burst" else 100
-        self.trail = []
 
     def update(self, dt):
-        if len(self.trail) < 5:
-            self.trail.append((self.x, self.y, self.lifetime))
-        else:
-            self.trail.pop(0)
-            self.trail.append((self.x, self.y, self.lifetime))
-
         self.x += self.vx * dt
         self.y += self.vy * dt
         self.vy += self.gravity * dt
         self.lifetime -= dt
-        self.vx *= 0.98
+        # Drag is tuned per 60 Hz frame; scale it by the real step
+        self.vx *= self.DRAG ** (dt * 60)
+
+    def blit_pair(self):
+        """(sprite, dest) for this particle's additive glow; only valid while alive"""
+        radius = self.size + 2
+        return (
+            _glow_sprite(self.color, self.size, self.lifetime),
+            (int(self.x) - radius, int(self.y) - radius),
+        )
 
     def draw(self, screen):
         if self.lifetime > 0:
-            fade = self.lifetime
-            cx, cy = int(self.x), int(self.y)
-            size = self.size
+            sprite, dest = self.blit_pair()
+            screen.blit(sprite, dest, special_flags=pygame.BLEND_RGB_ADD)
+
+
+class ParticleSystem:
+    """Fixed-capacity particle pool.
+
+    With numpy, live particles are packed at the front of parallel arrays and
+    spawned/integrated in bulk; without it the pool holds Particle objects.
+    """
+
+    _FIELDS = ("_x", "_y", "_vx", "_vy", "_life", "_gravity", "_size", "_color")
+
+    def __init__(self, capacity=100):
+        self.capacity = capacity
+        self._count = 0
+        self._colors = []
+        self._color_index = {}
+        self._particles = []
+        if HAS_NUMPY:
+            for name in self._FIELDS[:-2]:
+                setattr(self, name, np.zeros(capacity, dtype=np.float32))
+            self._size = np.zeros(capacity, dtype=np.int32)
+            self._color = np.zeros(capacity, dtype=np.int32)
+
+    def __len__(self):
+        return self._count if HAS_NUMPY else len(self._particles)
+
+    def clear(self):
+        self._count = 0
+        self._particles.clear()
+
+    def emit(self, x, y, colors, particle_type="burst", count=1):
+        """Spawn up to count particles at (x, y), each coloured by a random pick from colors"""
+        count = min(count, self.capacity - len(self))
+        if count <= 0:
+            return
+        if not HAS_NUMPY:
+            for _ in range(count):
+                self._particles.append(Particle(x, y, random.choice(colors), particle_type))
+            return
+
+        start, end = self._count, self._count + count
+        self._x[start:end] = x
+        self._y[start:end] = y
+        self._life[start:end] = 1.0
+        self._size[start:end] = _rng.integers(2, 7, count)
+        color_ids = [self._color_id(color) for color in colors]
+        self._color[start:end] = _rng.choice(color_ids, count)
+
+        if particle_type == "purchase":
+            target_x, target_y = WINDOW_WIDTH // 2, 200
+            dx, dy = target_x - x, target_y - y
+            distance = math.sqrt(dx**2 + dy**2)
+            if distance > 0:
+                # Independent speeds per axis, as Particle draws them
+                self._vx[start:end] = dx / distance * _rng.uniform(100, 200, count)
+                self._vy[start:end] = dy / distance * _rng.uniform(100, 200, count)
+            else:
+                self._vx[start:end] = _rng.uniform(-100, 100, count)
+                self._vy[start:end] = _rng.uniform(-100, 100, count)
+        elif particle_type == "click":
+            self._vx[start:end] = _rng.uniform(-80, 80, count)
+            self._vy[start:end] = _rng.uniform(-150, -50, count)
+        else:
+            self._vx[start:end] = _rng.uniform(-150, 150, count)
+            self._vy[start:end] = _rng.uniform(-250, -100, count)
+        self._gravity[start:end] = 200 if particle_type == "burst" else 100
+        self._count = end
+
+    def _color_id(self, color):
+        color_id = self._color_index.get(color)
+        if color_id is None:
+            color_id = self._color_index[color] = len(self._colors)
+            self._colors.append(color)
+        return color_id
 
-            glow_color = tuple(int(c * 0.3 * fade) for c in self.color)
-            pygame.draw.circle(screen, glow_color, (cx, cy), size + 2)
+    def update(self, dt):
+        """Integrate every live particle and drop the ones that expired"""
+        if not HAS_NUMPY:
+            particles = self._particles
+            write = 0
+            for particle in particles:
+                if particle.lifetime > 0:
+                    particle.update(dt)
+                    particles[write] = particle
+                    write += 1
+            del particles[write:]
+            return
+
+        n = self._count
+        if n == 0:
+            return
+        _integrate_particles(
+            self._x[:n], self._y[:n], self._vx[:n], self._vy[:n],
+            self._life[:n], self._gravity[:n], dt, Particle.DRAG ** (dt * 60),
+        )
 
-            main_color = tuple(int(c * fade) for c in self.color)
-            pygame.draw.circle(screen, main_color, (cx, cy), size)
+        alive = self._life[:n] > 0
+        live = int(np.count_nonzero(alive))
+        if live != n:
+            for name in self._FIELDS:
+                arr = getattr(self, name)
+                arr[:live] = arr[:n][alive]
+            self._count = live
+
+    def blit_pairs(self):
+        """(sprite, dest) for every live particle's additive glow"""
+        if not HAS_NUMPY:
+            return [p.blit_pair() for p in self._particles if p.lifetime > 0]
+        n = self._count
+        colors = self._colors
+        pairs = []
+        for x, y, life, size, color_id in zip(
+            self._x[:n].tolist(), self._y[:n].tolist(), self._life[:n].tolist(),
+            self._size[:n].tolist(), self._color[:n].tolist(),
+        ):
+            radius = size + 2
+            pairs.append(
+                (_glow_sprite(colors[color_id], size, life), (int(x) - radius, int(y) - radius))
+            )
+        return pairs
 
 
 class BinaryRain:
@@ -94,22 +290,57 @@ class BinaryRain:
         self._init_font()
         self.init_columns()
 
+    # Longest column and the per-row alpha ramp used by draw()
+    MAX_COLUMN_LENGTH = 15
+    ROW_ALPHAS = tuple(max(10, 30 - i * 2) for i in range(MAX_COLUMN_LENGTH))
+    ROW_SPACING = 20
+
     def _init_font(self):
-        """Initialize font and pre-render character surfaces"""
+        """Initialize font and pre-render every (char, alpha) glyph draw() can use"""
         self._font = pygame.font.Font(None, 16)
         self._char_surfaces = {
             "0": self._font.render("0", True, (30, 80, 30)),
             "1": self._font.render("1", True, (40, 220, 40)),
         }
-        self._alpha_surfaces = {}
-        for alpha in range(10, 31, 5):
-            for char in ["0", "1"]:
-                surf = self._char_surfaces[char].copy()
-                surf.set_alpha(alpha)
-                self._alpha_surfaces[(alpha, char)] = surf
+        # Alpha is baked into the per-pixel alpha channel (not set_alpha) so the
+        # glyphs can be copied unchanged into the column strips with BLEND_RGBA_MAX
+        self._glyphs = {}
+        for alpha in set(self.ROW_ALPHAS):
+            for char, base in self._char_surfaces.items():
+                surf = base.copy()
+                surf.fill((255, 255, 255, alpha), special_flags=pygame.BLEND_RGBA_MULT)
+                self._glyphs[(char, alpha)] = surf
+        # Glyph surfaces indexed [char][row] for strip composition
+        self._glyph_rows = [
+            [self._glyphs[(char, alpha)] for alpha in self.ROW_ALPHAS]
+            for char in ("0", "1")
+        ]
+        self._strip_size = (
+            max(surf.get_width() for surf in self._char_surfaces.values()),
+            self.MAX_COLUMN_LENGTH * self.ROW_SPACING,
+        )
+
+    def _new_strip(self):
+        return pygame.Surface(self._strip_size, pygame.SRCALPHA)
+
+    def _compose_strip(self, strip, chars):
+        """Redraw one column's pre-composed strip from its chars (0/1 ints)"""
+        glyph_rows = self._glyph_rows
+        spacing = self.ROW_SPACING
+        strip.fill((0, 0, 0, 0))
+        strip.blits(
+            [
+                (glyph_rows[char][i], (0, i * spacing), None, pygame.BLEND_RGBA_MAX)
+                for i, char in enumerate(chars)
+            ],
+            doreturn=False,
+        )
 
     def init_columns(self):
         num_columns = self.width // 20
+        if HAS_NUMPY:
+            self._init_column_arrays(num_columns)
+            return
         for i in range(num_columns):
             self.columns.append(
                 {
@@ -119,10 +350,33 @@ class BinaryRain:
                     "chars": random.choices(["0", "1"], k=random.randint(5, 15)),
                     "mutations": [0.0] * random.randint(5, 15),
                     "mutation_thresholds": [random.uniform(0.3, 0.8) for _ in range(15)],
+                    "strip": self._new_strip(),
+                    "dirty": True,
                 }
             )
 
+    def _init_column_arrays(self, num_columns):
+        """Store the columns as struct-of-arrays: one row per column, one slot per char"""
+        max_len = self.MAX_COLUMN_LENGTH
+        # One PCG64 generator feeds every batched draw below and in update
+        self._rng = rng = np.random.default_rng()
+        self.xs = np.arange(num_columns, dtype=np.int32) * 20 + rng.integers(
+            0, 16, num_columns
+        )
+        self.ys = rng.integers(-self.height, 1, num_columns).astype(np.float64)
+        self.speeds = rng.uniform(30, 80, num_columns)
+        self.lens = rng.integers(5, max_len + 1, num_columns)
+        self.chars = rng.integers(0, 2, (num_columns, max_len), dtype=np.uint8)
+        self.mutations = np.zeros((num_columns, max_len))
+        self.mutation_thresholds = rng.uniform(0.3, 0.8, (num_columns, max_len))
+        # One pre-composed glyph strip per column, recomposed only when its chars change
+        self._strips = [self._new_strip() for _ in range(num_columns)]
+        self._strip_dirty = np.ones(num_columns, dtype=bool)
+
     def update(self, dt):
+        if HAS_NUMPY:
+            self._update_vectorized(dt)
+            return
         for column in self.columns:
             if "mutations" not in column or len(column["mutations"]) != len(column["chars"]):
                 column["mutations"] = [0.0] * len(column["chars"])
@@ -134,7 +388,10 @@ class BinaryRain:
             for i in range(char_len):
                 column["mutations"][i] += dt
                 if column["mutations"][i] > thresholds[i]:
-                    column["chars"][i] = random.choice(["0", "1"])
+                    char = random.choice(["0", "1"])
+                    if char != column["chars"][i]:
+                        column["chars"][i] = char
+                        column["dirty"] = True
                     column["mutations"][i] = 0.0
 
             if column["y"] > self.height + char_len * 20:
@@ -142,20 +399,76 @@ class BinaryRain:
                 column["chars"] = random.choices(["0", "1"], k=random.randint(5, 15))
                 column["mutations"] = [0.0] * len(column["chars"])
                 column["speed"] = random.uniform(30, 80)
+                column["dirty"] = True
+
+    def _update_vectorized(self, dt):
+        """Advance every column and mutate every char with whole-array operations"""
+        rng = self._rng
+        self.ys += self.speeds * dt
+
+        self.mutations += dt
+        mutate = self.mutations > self.mutation_thresholds
+        count = int(mutate.sum())
+        if count:
+            new_chars = rng.integers(0, 2, count, dtype=np.uint8)
+            changed = np.zeros_like(mutate)
+            changed[mutate] = self.chars[mutate] != new_chars
+            # Slots past a column's length are never drawn, so they don't dirty it
+            changed &= np.arange(self.MAX_COLUMN_LENGTH) < self.lens[:, None]
+            self._strip_dirty |= changed.any(axis=1)
+            self.chars[mutate] = new_chars
+            self.mutations[mutate] = 0.0
+
+        wrapped = self.ys > self.height + self.lens * 20
+        count = int(wrapped.sum())
+        if count:
+            lens = rng.integers(5, self.MAX_COLUMN_LENGTH + 1, count)
+            self.lens[wrapped] = lens
+            self.ys[wrapped] = -lens * 20
+            self.chars[wrapped] = rng.integers(
+                0, 2, (count, self.MAX_COLUMN_LENGTH), dtype=np.uint8
+            )
+            self.mutations[wrapped] = 0.0
+            self.speeds[wrapped] = rng.uniform(30, 80, count)
+            self._strip_dirty |= wrapped
 
     def draw(self, screen):
+        if HAS_NUMPY:
+            self._draw_vectorized(screen)
+            return
+        height = self.height
+        strips = []
         for column in self.columns:
-            for i, char in enumerate(column["chars"]):
-                y_pos = column["y"] + i * 20
-                if 0 <= y_pos <= self.height:
-                    alpha = max(10, 30 - i * 2)
-                    alpha_rounded = ((alpha + 4) // 5) * 5
-                    surface = self._alpha_surfaces.get((alpha_rounded, char))
-                    if surface is None:
-                        surface = self._char_surfaces[char].copy()
-                        surface.set_alpha(alpha)
-                        self._alpha_surfaces[(alpha_rounded, char)] = surface
-                    screen.blit(surface, (column["x"], y_pos))
+            y = column["y"]
+            if y > height or y + len(column["chars"]) * self.ROW_SPACING <= 0:
+                continue
+            if column["dirty"]:
+                self._compose_strip(column["strip"], [int(c) for c in column["chars"]])
+                column["dirty"] = False
+            strips.append((column["strip"], (column["x"], y)))
+        screen.blits(strips, doreturn=False)
+
+    def _draw_vectorized(self, screen):
+        """Blit one pre-composed strip per on-screen column, recomposing dirty ones"""
+        visible = (self.ys <= self.height) & (self.ys + self.lens * self.ROW_SPACING > 0)
+        cols = np.flatnonzero(visible)
+        if not len(cols):
+            return
+        strips = self._strips
+        redraw = cols[self._strip_dirty[cols]]
+        if len(redraw):
+            for col, length in zip(redraw.tolist(), self.lens[redraw].tolist()):
+                self._compose_strip(strips[col], self.chars[col, :length].tolist())
+            self._strip_dirty[redraw] = False
+        screen.blits(
+            [
+                (strips[col], (x, y))
+                for col, x, y in zip(
+                    cols.tolist(), self.xs[cols].tolist(), self.ys[cols].tolist()
+                )
+            ],
+            doreturn=False,
+        )
 
 
 class BitDot:
@@ -181,10 +494,12 @@ class BitDot:
 
     def draw(self, screen):
         if self.lifetime > 0:
-            alpha = int(255 * self.lifetime)
-
-            color = COLORS["electric_cyan"]
-            pygame.draw.circle(screen, color, (int(self.x), int(self.y)), self.size)
+            radius = self.size + 2
+            screen.blit(
+                _glow_sprite(COLORS["electric_cyan"], self.size, self.lifetime),
+                (int(self.x) - radius, int(self.y) - radius),
+                special_flags=pygame.BLEND_RGB_ADD,
+            )
 
 
 class SmartBitVisualization:
@@ -457,7 +772,7 @@ class SmartBitVisualization:
         # Draw background particles first
         for particle in self.background_particles:
             alpha = particle["lifetime"] / 8.0
-            color = tuple(int(c * alpha) for c in particle["color"])
+            color = scale_color(particle["color"], alpha)
             pygame.draw.circle(
                 screen,
                 color,
@@ -490,7 +805,7 @@ class SmartBitVisualization:
                             + (stream["end_y"] - stream["start_y"]) * trail_progress
                         )
                         alpha = (1.0 - i / 5) * (1.0 - stream["progress"])
-                        color = tuple(int(c * alpha) for c in stream["color"])
+                        color = scale_color(stream["color"], alpha)
                         pygame.draw.circle(
                             screen,
                             color,
@@ -520,7 +835,7 @@ class SmartBitVisualization:
         if self.pulse_timer > 0:
             pulse_radius = int(abs(math.sin(self.pulse_timer)) * 30)
             pulse_alpha = abs(math.sin(self.pulse_timer)) * 0.3
-            pulse_color = tuple(int(c * pulse_alpha) for c in COLORS["electric_cyan"])
+            pulse_color = scale_color(COLORS["electric_cyan"], pulse_alpha)
             pygame.draw.circle(
                 screen, pulse_color, (self.center_x, self.center_y), pulse_radius, 2
             )
@@ -529,7 +844,7 @@ class SmartBitVisualization:
         """Draw a bit cluster"""
         alpha = cluster["lifetime"] / 2.0
         base_color = COLORS["electric_cyan"]
-        color = tuple(int(c * alpha) for c in base_color)
+        color = scale_color(base_color, alpha)
 
         # Draw cluster based on formation type
         formation = cluster["formation"]
@@ -571,7 +886,7 @@ class SmartBitVisualization:
         """Draw a byte formation"""
         alpha = formation["lifetime"] / 3.0
         base_color = COLORS["neon_purple"]
-        color = tuple(int(c * alpha) for c in base_color)
+        color = scale_color(base_color, alpha)
 
         # Draw hexagonal pattern
         for dx, dy in formation["hex_pattern"]: